@@ -1,58 +1,32 @@
-import requests
-import json
-import os
+import argparse
 
-api_key = os.environ.get('RONE_API_KEY')
-base_url = 'https://www.reb.or.kr/r-one/openapi/SttsApiTblData.do'
+from rone_client import RoneClient, recent_months
 
-# Monthly data for past 12 months
-months = ['202411', '202410', '202409', '202408', '202407', '202406',
-          '202405', '202404', '202403', '202402', '202401', '202312']
+parser = argparse.ArgumentParser(description='서울 동남권 아파트 매매지수 (최근 1년)')
+parser.add_argument('--end', help='마지막 월 YYYYMM (기본: 지난달)')
+parser.add_argument('--months', type=int, default=12, help='조회 개월 수 (기본: 12)')
+parser.add_argument('--refresh', action='store_true', help='캐시 무시하고 다시 조회')
+args = parser.parse_args()
+
+months = recent_months(args.months, args.end)
 
 print('\n=== 지난 1년 서울 지역별 아파트 매매지수 ===\n')
 
-all_data = []
-
-for month in months:
-    params = {
-        'KEY': api_key,
-        'Type': 'json',
-        'STATBL_ID': 'A_2024_00178',
-        'DTACYCLE_CD': 'MM',
-        'WRTTIME_IDTFR_ID': month,
-        'pSize': '1000'
-    }
-
-    response = requests.get(base_url, params=params)
-    data = response.json()
-
-    if 'SttsApiTblData' in data:
-        rows = data['SttsApiTblData'][1]['row']
-        for row in rows:
-            if '동남권' in row.get('CLS_NM', ''):  # 강남, 서초, 송파, 강동
-                all_data.append({
-                    'month': row['WRTTIME_DESC'],
-                    'region': row['CLS_FULLNM'],
-                    'index': float(row['DTA_VAL'])
-                })
-
-# Print results grouped by region
-regions = {}
-for d in all_data:
-    region = d['region']
-    if region not in regions:
-        regions[region] = []
-    regions[region].append((d['month'], d['index']))
+with RoneClient() as client:
+    table = client.fetch('A_2024_00178', months, refresh=args.refresh)
+
+# 강남, 서초, 송파, 강동
+regions = table.where(cls_nm=lambda name: '동남권' in name).by_region()
 
 for region, values in regions.items():
     print(f'\n{region}:')
     print('=' * 60)
-    for month, index in sorted(values, reverse=True):
+    for _, month, index in values:
         print(f'{month}: {index:.2f}')
 
     if len(values) >= 2:
-        first_val = values[-1][1]
-        last_val = values[0][1]
+        first_val = values[-1][2]
+        last_val = values[0][2]
         change = last_val - first_val
         change_pct = (change / first_val) * 100
         print(f'\n연간 변화: {change:+.2f} ({change_pct:+.2f}%)')
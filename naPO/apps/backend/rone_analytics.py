@@ -0,0 +1,225 @@
+"""
+R-ONE time-series analytics (pandas / NumPy)
+============================================
+- Loads R-ONE rows (RoneTable, DataFrame or raw row dicts) into a DataFrame
+- Month-over-month / year-over-year change, rolling mean and per-pyeong
+  conversion for every region at once (month × series matrix, no Python loops)
+- Results persisted under .rone_analytics/ once every requested period is published
+
+Usage:
+    python rone_analytics.py A_2024_00189 --months 36 --region 서울
+    python rone_analytics.py A_2024_00178 --months 120 --rolling 6 --top 20
+    python rone_analytics.py --bench 500000
+"""
+
+import argparse
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from rone_client import RoneClient, RoneTable, recent_months
+
+PYEONG_SQM = 3.3058  # 1 pyeong = 3.3058 sqm
+DEFAULT_RESULT_DIR = Path(__file__).with_name('.rone_analytics')
+
+SERIES_KEYS = ['region', 'item']
+
+
+def load_frame(source: Union[RoneTable, pd.DataFrame, Iterable[Dict[str, Any]]]) -> pd.DataFrame:
+    """Long frame [period, region, item, unit, value] sorted by series then period"""
+    if isinstance(source, RoneTable):
+        df = source.to_pandas()
+    else:
+        df = source if isinstance(source, pd.DataFrame) else pd.DataFrame.from_records(list(source))
+        df = df.rename(columns={
+            'WRTTIME_IDTFR_ID': 'period_id', 'CLS_FULLNM': 'region', 'ITM_NM': 'item',
+            'UI_NM': 'unit', 'DTA_VAL': 'value',
+        })
+        for column in ('item', 'unit'):
+            if column not in df:
+                df[column] = ''
+
+    # Only a few hundred distinct periods: parse those once and broadcast via category codes
+    period_ids = df['period_id'].astype(str).str[:6].astype('category')
+    periods = pd.to_datetime(period_ids.cat.categories, format='%Y%m')
+
+    frame = pd.DataFrame({
+        'period': periods.take(period_ids.cat.codes.to_numpy()),
+        'region': df['region'].astype('category'),
+        'item': df['item'].fillna('').astype('category'),
+        'unit': df['unit'].fillna('').astype('category'),
+        'value': pd.to_numeric(df['value'], errors='coerce').astype(np.float64),
+    })
+    return frame.sort_values(SERIES_KEYS + ['period'], kind='stable').reset_index(drop=True)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Column-wise rolling mean; NaN unless the whole window is present"""
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+    window_sums = sums.copy()
+    window_counts = counts.copy()
+    window_sums[window:] -= sums[:-window]
+    window_counts[window:] -= counts[:-window]
+    out = np.full_like(values, np.nan)
+    full = window_counts == window
+    out[full] = window_sums[full] / window
+    return out
+
+
+def compute_metrics(frame: pd.DataFrame, rolling: int = 3,
+                    per_pyeong: Optional[bool] = None) -> pd.DataFrame:
+    """Add mom_pct, yoy_pct, rolling_mean and (for per-㎡ units) value_per_pyeong
+
+    Values are scattered into a (month × series) matrix on a complete monthly axis,
+    so shift-based changes compare calendar months even when a month is missing.
+    """
+    if frame.empty:
+        return frame.assign(mom_pct=[], yoy_pct=[], rolling_mean=[])
+
+    series_codes = frame.groupby(SERIES_KEYS, observed=True, sort=True).ngroup().to_numpy()
+    series = frame.drop_duplicates(SERIES_KEYS).sort_values(SERIES_KEYS)[SERIES_KEYS + ['unit']]
+    month_numbers = (frame['period'].dt.year * 12 + frame['period'].dt.month - 1).to_numpy()
+    first_month = month_numbers.min()
+    month_pos = month_numbers - first_month
+
+    values = np.full((month_pos.max() + 1, len(series)), np.nan)
+    values[month_pos, series_codes] = frame['value'].to_numpy()
+
+    mom = np.full_like(values, np.nan)
+    yoy = np.full_like(values, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mom[1:] = (values[1:] / values[:-1] - 1.0) * 100.0
+        if len(values) > 12:
+            yoy[12:] = (values[12:] / values[:-12] - 1.0) * 100.0
+    rolling_mean = _rolling_mean(values, rolling)
+
+    # Observed cells only, ordered by series then month
+    series_idx, month_idx = np.nonzero(~np.isnan(values.T))
+    month_abs = month_idx + first_month
+    result = pd.DataFrame({
+        'period': pd.to_datetime({'year': month_abs // 12, 'month': month_abs % 12 + 1, 'day': 1}),
+        'region': series['region'].to_numpy()[series_idx],
+        'item': series['item'].to_numpy()[series_idx],
+        'unit': series['unit'].to_numpy()[series_idx],
+        'value': values[month_idx, series_idx],
+        'mom_pct': mom[month_idx, series_idx],
+        'yoy_pct': yoy[month_idx, series_idx],
+        'rolling_mean': rolling_mean[month_idx, series_idx],
+    })
+    for column in ('region', 'item', 'unit'):
+        result[column] = pd.Categorical(result[column], categories=frame[column].cat.categories)
+
+    if per_pyeong is None:
+        per_pyeong = bool(series['unit'].astype(str).str.contains('㎡').any())
+    if per_pyeong:
+        result['value_per_pyeong'] = result['value'] * PYEONG_SQM
+    return result
+
+
+def period_change(metrics: pd.DataFrame) -> pd.DataFrame:
+    """First vs last value per series over the loaded range"""
+    grouped = metrics.groupby(SERIES_KEYS, observed=True)['value']
+    summary = pd.DataFrame({'first': grouped.first(), 'last': grouped.last()})
+    summary['change'] = summary['last'] - summary['first']
+    summary['change_pct'] = summary['change'] / summary['first'] * 100.0
+    return summary.reset_index()
+
+
+def latest(metrics: pd.DataFrame) -> pd.DataFrame:
+    """Most recent row per series"""
+    return metrics.groupby(SERIES_KEYS, observed=True).tail(1).reset_index(drop=True)
+
+
+# ============================================================================
+# Persisted results
+# ============================================================================
+def _result_path(result_dir: Path, statbl_id: str, periods: Sequence[str], rolling: int) -> Path:
+    digest = hashlib.sha1(','.join(sorted(periods)).encode()).hexdigest()[:12]
+    return result_dir / f'{statbl_id}_r{rolling}_{digest}.pkl'
+
+
+def load_or_compute(client: RoneClient, statbl_id: str, periods: List[str], rolling: int = 3,
+                    result_dir: Path = DEFAULT_RESULT_DIR, refresh: bool = False) -> pd.DataFrame:
+    """Metrics for the given periods, reusing a persisted result when available
+
+    Results are only persisted once every requested period has rows; a period
+    that is not published yet is refetched (and the metrics recomputed) next time.
+    """
+    path = _result_path(result_dir, statbl_id, periods, rolling)
+    if path.exists() and not refresh:
+        return pd.read_pickle(path)
+
+    table = client.fetch(statbl_id, periods, refresh=refresh)
+    metrics = compute_metrics(load_frame(table), rolling)
+    if set(periods).difference(table.period_id):
+        return metrics
+
+    result_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    metrics.to_pickle(tmp_path)
+    tmp_path.replace(path)
+    return metrics
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _synthetic_rows(count: int) -> pd.DataFrame:
+    regions = max(1, count // 240)
+    periods = pd.date_range('2005-01-01', periods=240, freq='MS').strftime('%Y%m')
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'period_id': np.tile(periods, regions),
+        'region': np.repeat([f'지역{i}' for i in range(regions)], len(periods)),
+        'item': '매매가격',
+        'unit': '만원/㎡',
+        'value': 500 + rng.normal(0, 1, regions * len(periods)).cumsum(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='R-ONE 시계열 분석 (전월/전년 대비, 이동평균, 평당 환산)')
+    parser.add_argument('statbl_id', nargs='?', help='통계표 ID (예: A_2024_00189)')
+    parser.add_argument('--months', type=int, default=25, help='조회 개월 수 (기본: 25)')
+    parser.add_argument('--end', help='마지막 월 YYYYMM (기본: 지난달)')
+    parser.add_argument('--rolling', type=int, default=3, help='이동평균 개월 수 (기본: 3)')
+    parser.add_argument('--region', help='지역명 포함 필터 (예: 서울)')
+    parser.add_argument('--top', type=int, default=15, help='출력 지역 수 (기본: 15)')
+    parser.add_argument('--refresh', action='store_true', help='캐시/저장 결과 무시')
+    parser.add_argument('--bench', type=int, metavar='ROWS', help='합성 데이터로 처리 시간 측정')
+    args = parser.parse_args()
+
+    if args.bench:
+        rows = _synthetic_rows(args.bench)
+        start = time.perf_counter()
+        frame = load_frame(rows)
+        loaded = time.perf_counter()
+        metrics = compute_metrics(frame, args.rolling)
+        done = time.perf_counter()
+        print(f'{len(frame):,} rows: load {loaded - start:.3f}s, metrics {done - loaded:.3f}s '
+              f'({len(metrics):,} result rows)')
+        return
+
+    if not args.statbl_id:
+        parser.error('statbl_id is required unless --bench is given')
+
+    with RoneClient() as client:
+        metrics = load_or_compute(client, args.statbl_id, recent_months(args.months, args.end),
+                                  args.rolling, refresh=args.refresh)
+
+    if args.region:
+        metrics = metrics[metrics['region'].astype(str).str.contains(args.region)]
+
+    current = latest(metrics).sort_values('yoy_pct', ascending=False).head(args.top)
+    pd.set_option('display.width', 160)
+    print(current.to_string(index=False, float_format=lambda v: f'{v:,.2f}'))
+
+
+if __name__ == '__main__':
+    main()
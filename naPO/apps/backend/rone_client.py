@@ -0,0 +1,283 @@
+"""
+R-ONE (한국부동산원 부동산통계) Open API client
+===============================================
+- One pooled requests.Session with timeout + retry
+- Persistent SQLite cache keyed by (STATBL_ID, DTACYCLE_CD, WRTTIME_IDTFR_ID)
+- Concurrent period fetches (only cache misses go to the network)
+- Automatic paging beyond pSize via pIndex / list_total_count
+- Results returned as a typed columnar RoneTable
+
+Usage:
+    from rone_client import RoneClient, recent_months
+
+    client = RoneClient()
+    table = client.fetch('A_2024_00178', recent_months(12))
+    for region, series in table.where(lambda region: '서울' in region).by_region().items():
+        ...
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = 'https://www.reb.or.kr/r-one/openapi/SttsApiTblData.do'
+DEFAULT_CACHE_PATH = Path(__file__).with_name('.rone_cache.sqlite3')
+
+# RESULT.CODE for "no data" (period not published yet, etc.)
+NO_DATA_CODES = {'INFO-200'}
+
+
+class RoneError(Exception):
+    """R-ONE API returned an error result"""
+
+
+def recent_months(count: int, end: Optional[str] = None) -> List[str]:
+    """`count` months as YYYYMM, newest first, ending at `end` (default: last month)"""
+    if end:
+        year, month = int(end[:4]), int(end[4:6])
+    else:
+        today = date.today()
+        year, month = (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
+
+    months = []
+    for _ in range(count):
+        months.append(f'{year:04d}{month:02d}')
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months
+
+
+# ============================================================================
+# Columnar result
+# ============================================================================
+@dataclass
+class RoneTable:
+    """Column-oriented statistics table (one entry per R-ONE row)"""
+    statbl_id: str
+    period_id: List[str] = field(default_factory=list)    # WRTTIME_IDTFR_ID (e.g. 202411)
+    period: List[str] = field(default_factory=list)       # WRTTIME_DESC
+    cls_id: List[str] = field(default_factory=list)       # CLS_ID
+    cls_nm: List[str] = field(default_factory=list)       # CLS_NM
+    region: List[str] = field(default_factory=list)       # CLS_FULLNM
+    item: List[str] = field(default_factory=list)         # ITM_NM
+    unit: List[str] = field(default_factory=list)         # UI_NM
+    value: array = field(default_factory=lambda: array('d'))  # DTA_VAL (NaN if missing)
+
+    COLUMNS = ('period_id', 'period', 'cls_id', 'cls_nm', 'region', 'item', 'unit', 'value')
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def append_rows(self, period_id: str, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            raw = row.get('DTA_VAL')
+            self.period_id.append(row.get('WRTTIME_IDTFR_ID') or period_id)
+            self.period.append(row.get('WRTTIME_DESC', ''))
+            self.cls_id.append(str(row.get('CLS_ID', '')))
+            self.cls_nm.append(row.get('CLS_NM', ''))
+            self.region.append(row.get('CLS_FULLNM') or row.get('CLS_NM', ''))
+            self.item.append(row.get('ITM_NM', ''))
+            self.unit.append(row.get('UI_NM', ''))
+            self.value.append(float(raw) if raw not in (None, '') else float('nan'))
+
+    def take(self, indices: Iterable[int]) -> 'RoneTable':
+        """New table with the given row indices"""
+        indices = list(indices)
+        table = RoneTable(self.statbl_id)
+        for name in self.COLUMNS:
+            source = getattr(self, name)
+            target = getattr(table, name)
+            target.extend(source[i] for i in indices)
+        return table
+
+    def where(self, region: Optional[Callable[[str], bool]] = None,
+              cls_nm: Optional[Callable[[str], bool]] = None) -> 'RoneTable':
+        """Filter rows by predicates on region (CLS_FULLNM) and/or CLS_NM"""
+        return self.take(
+            i for i in range(len(self))
+            if (region is None or region(self.region[i])) and (cls_nm is None or cls_nm(self.cls_nm[i]))
+        )
+
+    def by_region(self) -> Dict[str, List[Tuple[str, str, float]]]:
+        """{region: [(period_id, period, value), ...]} sorted newest first"""
+        groups: Dict[str, List[Tuple[str, str, float]]] = {}
+        for i in range(len(self)):
+            groups.setdefault(self.region[i], []).append((self.period_id[i], self.period[i], self.value[i]))
+        for series in groups.values():
+            series.sort(key=lambda entry: entry[0], reverse=True)
+        return groups
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield {name: getattr(self, name)[i] for name in self.COLUMNS}
+
+    def to_pandas(self):
+        """pandas.DataFrame view (requires pandas)"""
+        import numpy as np
+        import pandas as pd
+
+        data = {name: getattr(self, name) for name in self.COLUMNS}
+        data['value'] = np.frombuffer(self.value, dtype=np.float64).copy()
+        return pd.DataFrame(data)
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+class RoneCache:
+    """SQLite cache of raw rows per (STATBL_ID, DTACYCLE_CD, WRTTIME_IDTFR_ID)"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rone_rows (
+        statbl_id TEXT NOT NULL,
+        dtacycle_cd TEXT NOT NULL,
+        wrttime_id TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        rows_json TEXT NOT NULL,
+        PRIMARY KEY (statbl_id, dtacycle_cd, wrttime_id)
+    );
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_many(self, statbl_id: str, cycle: str, periods: List[str],
+                 max_age: Optional[float] = None) -> Dict[str, List[Dict[str, Any]]]:
+        placeholders = ','.join('?' for _ in periods)
+        sql = (
+            'SELECT wrttime_id, rows_json FROM rone_rows '
+            f'WHERE statbl_id = ? AND dtacycle_cd = ? AND wrttime_id IN ({placeholders})'
+        )
+        params: List[Any] = [statbl_id, cycle, *periods]
+        if max_age is not None:
+            sql += ' AND fetched_at >= ?'
+            params.append(time.time() - max_age)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return {period: json.loads(rows_json) for period, rows_json in rows}
+
+    def put(self, statbl_id: str, cycle: str, period: str, rows: List[Dict[str, Any]]):
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO rone_rows VALUES (?, ?, ?, ?, ?)',
+                (statbl_id, cycle, period, time.time(), json.dumps(rows, ensure_ascii=False)),
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+# ============================================================================
+# Client
+# ============================================================================
+class RoneClient:
+    """Cached, concurrent client for SttsApiTblData.do"""
+
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+                 max_workers: int = 6, page_size: int = 1000, timeout: float = 15.0,
+                 max_retries: int = 3):
+        self.api_key = api_key or os.environ.get('RONE_API_KEY')
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = RoneCache(cache_path) if cache_path else None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(self.max_retries):
+            try:
+                response = self.session.get(BASE_URL, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+            except (requests.RequestException, ValueError):
+                if attempt == self.max_retries - 1:
+                    raise
+                time.sleep(2 ** attempt)
+        raise AssertionError('unreachable')
+
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
+        """(list_total_count, rows) from one response page"""
+        if 'SttsApiTblData' not in data:
+            result = data.get('RESULT', {})
+            if result.get('CODE') in NO_DATA_CODES:
+                return 0, []
+            raise RoneError(f"{result.get('CODE', 'UNKNOWN')}: {result.get('MESSAGE', data)}")
+
+        total, rows = 0, []
+        for part in data['SttsApiTblData']:
+            for entry in part.get('head', []):
+                if 'list_total_count' in entry:
+                    total = int(entry['list_total_count'])
+            if 'row' in part:
+                rows = part['row'] if isinstance(part['row'], list) else [part['row']]
+        return total or len(rows), rows
+
+    def fetch_period(self, statbl_id: str, period: str, cycle: str = 'MM') -> List[Dict[str, Any]]:
+        """All rows for one period (pages through list_total_count), no cache"""
+        params = {
+            'KEY': self.api_key,
+            'Type': 'json',
+            'STATBL_ID': statbl_id,
+            'DTACYCLE_CD': cycle,
+            'WRTTIME_IDTFR_ID': period,
+            'pIndex': 1,
+            'pSize': self.page_size,
+        }
+        total, rows = self._parse_page(self._request(params))
+        pages = -(-total // self.page_size)
+        for page in range(2, pages + 1):
+            _, more = self._parse_page(self._request({**params, 'pIndex': page}))
+            rows.extend(more)
+        return rows
+
+    def fetch(self, statbl_id: str, periods: List[str], cycle: str = 'MM',
+              refresh: bool = False, max_age: Optional[float] = None) -> RoneTable:
+        """Rows for all periods as a RoneTable (cache first, misses fetched concurrently)
+
+        Empty periods (not published yet) are not cached, so they are retried next time.
+        """
+        cached = {} if refresh or not self.cache else self.cache.get_many(statbl_id, cycle, periods, max_age)
+        missing = [period for period in periods if period not in cached]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                fetched = executor.map(lambda period: self.fetch_period(statbl_id, period, cycle), missing)
+                for period, rows in zip(missing, fetched):
+                    cached[period] = rows
+                    if rows and self.cache:
+                        self.cache.put(statbl_id, cycle, period, rows)
+
+        table = RoneTable(statbl_id)
+        for period in periods:
+            table.append_rows(period, cached.get(period, []))
+        return table
+
+    def close(self):
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self) -> 'RoneClient':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
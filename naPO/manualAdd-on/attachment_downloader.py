@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+지방의회 회의록 첨부파일(PDF/HWP) 다운로더
+==========================================
+- minutes_store에 저장된 pdf_url/hwp_url을 내려받아 디스크에 보관
+- 청크 단위 스트리밍 저장 (본문 전체를 메모리에 올리지 않음)
+- 호스트별 동시 요청 수 제한 + 전체 스레드 풀
+- 중단된 다운로드는 .part 파일에서 Range 요청으로 이어받기
+- SHA-256 내용 해시로 중복 제거 (files/<해시 앞 2자리>/<해시>.<확장자>)
+- 결과 메타데이터(해시/경로/크기)를 minutes_store.attachments에 기록
+
+Usage:
+    python attachment_downloader.py --db output/minutes.db --files output/files
+    python attachment_downloader.py --workers 16 --per-host 2 --limit 5000
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from council_crawler import HttpClient
+from minutes_store import DEFAULT_DB_PATH, MinutesStore
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+EXTENSIONS = {
+    "application/pdf": "pdf",
+    "application/x-hwp": "hwp",
+    "application/haansofthwp": "hwp",
+    "application/vnd.hancom.hwp": "hwp",
+}
+
+
+# ============================================================================
+# 다운로드 결과 모델
+# ============================================================================
+@dataclass
+class DownloadResult:
+    """첨부파일 1건 다운로드 결과"""
+    doc_key: str
+    kind: str
+    url: str
+    status: str               # ok / duplicate / failed
+    sha256: str = ""
+    path: str = ""
+    size: int = 0
+    content_type: str = ""
+    resumed_from: int = 0
+    error: str = ""
+
+
+# ============================================================================
+# 다운로더
+# ============================================================================
+class AttachmentDownloader:
+    """호스트별 동시성 제한 + Range 이어받기 + 내용 해시 중복 제거 다운로더"""
+
+    def __init__(self, files_dir: str = "output/files", max_workers: int = 8,
+                 per_host: int = 2, max_retries: int = 3, timeout: int = 60):
+        self.files_dir = Path(files_dir)
+        self.partial_dir = self.files_dir / ".partial"
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        # 하나의 커넥션 풀을 모든 작업 스레드가 공유
+        self.session = requests.Session()
+        self.session.headers.update(HttpClient.DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _partial_path(self, url: str) -> Path:
+        return self.partial_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part"
+
+    @staticmethod
+    def _hash_existing(path: Path) -> "hashlib._Hash":
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest
+
+    @staticmethod
+    def _extension(kind: str, content_type: str) -> str:
+        return EXTENSIONS.get(content_type.split(";")[0].strip().lower(), kind or "bin")
+
+    def _stream_to_partial(self, url: str, part_path: Path):
+        """.part 파일로 스트리밍 저장 - (sha256 digest, content_type, 이어받은 바이트) 반환"""
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416 and offset:
+                # 이미 끝까지 받은 상태
+                return self._hash_existing(part_path), response.headers.get("Content-Type", ""), offset
+            response.raise_for_status()
+
+            if offset and response.status_code == 206:
+                digest = self._hash_existing(part_path)
+                mode = "ab"
+            else:
+                # 서버가 Range를 무시하면 처음부터 다시 받음
+                digest = hashlib.sha256()
+                mode = "wb"
+                offset = 0
+
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+
+            return digest, response.headers.get("Content-Type", ""), offset
+
+    def download(self, doc_key: str, kind: str, url: str) -> DownloadResult:
+        """첨부파일 1건 다운로드 (재시도 포함)"""
+        part_path = self._partial_path(url)
+        error = ""
+
+        for attempt in range(self.max_retries):
+            try:
+                with self._host_slot(url):
+                    digest, content_type, resumed_from = self._stream_to_partial(url, part_path)
+            except (requests.RequestException, OSError) as e:
+                error = str(e)
+                logger.warning(f"다운로드 실패 (시도 {attempt + 1}/{self.max_retries}): {url} - {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(2 ** attempt)
+                continue
+
+            sha256 = digest.hexdigest()
+            size = part_path.stat().st_size
+            final_path = self.files_dir / sha256[:2] / f"{sha256}.{self._extension(kind, content_type)}"
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if final_path.exists():
+                part_path.unlink(missing_ok=True)
+                status = "duplicate"
+            else:
+                os.replace(part_path, final_path)
+                status = "ok"
+
+            return DownloadResult(
+                doc_key=doc_key, kind=kind, url=url, status=status, sha256=sha256,
+                path=str(final_path), size=size, content_type=content_type,
+                resumed_from=resumed_from,
+            )
+
+        return DownloadResult(doc_key=doc_key, kind=kind, url=url, status="failed", error=error)
+
+    def run(self, jobs: List[Dict[str, str]], store: Optional[MinutesStore] = None) -> Dict[str, int]:
+        """작업 목록을 스레드 풀로 처리하고 결과를 store에 기록
+
+        같은 URL을 가리키는 작업은 한 번만 내려받고 (같은 .part 파일을 두 스레드가
+        동시에 쓰지 않도록) 결과를 각 문서(doc_key/kind)에 기록한다.
+        작업은 호스트별 대기열에서 슬롯이 빈 호스트 것만 돌아가며 제출한다.
+        """
+        stats = {"ok": 0, "duplicate": 0, "failed": 0, "bytes": 0}
+        start = time.time()
+
+        jobs_by_url: Dict[str, List[Dict[str, str]]] = {}
+        for job in jobs:
+            jobs_by_url.setdefault(job["url"], []).append(job)
+
+        # 호스트별 대기열 - 슬롯이 빈 호스트의 작업만 풀에 넣어, 작업 스레드가
+        # 한 호스트의 세마포어에서 대기하느라 전체 동시성이 per_host로 줄지 않게 함
+        queues: Dict[str, Deque[str]] = {}
+        for url in jobs_by_url:
+            queues.setdefault(urlparse(url).netloc, deque()).append(url)
+        active: Dict[str, int] = dict.fromkeys(queues, 0)
+        total = len(jobs_by_url)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: Dict[Future, Tuple[str, List[Dict[str, str]]]] = {}
+            done = 0
+            while queues or futures:
+                # 호스트를 돌아가며 빈 슬롯만큼 제출
+                submitted = True
+                while submitted and len(futures) < self.max_workers:
+                    submitted = False
+                    for host in list(queues):
+                        if len(futures) >= self.max_workers:
+                            break
+                        if active[host] >= self.per_host:
+                            continue
+                        url = queues[host].popleft()
+                        if not queues[host]:
+                            del queues[host]
+                        group = jobs_by_url[url]
+                        future = executor.submit(self.download, group[0]["doc_key"], group[0]["kind"], url)
+                        futures[future] = (host, group)
+                        active[host] += 1
+                        submitted = True
+
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    host, group = futures.pop(future)
+                    active[host] -= 1
+                    done += 1
+                    result = future.result()
+                    stats[result.status] += 1
+                    stats["bytes"] += result.size
+                    if result.status != "failed":
+                        stats["duplicate"] += len(group) - 1  # 같은 URL을 공유하는 나머지 문서
+
+                    if store:
+                        # 중복 파일도 문서 기준으로는 정상 수집이므로 ok로 기록
+                        for job in group:
+                            store.record_attachment(
+                                job["doc_key"], job["kind"], result.url,
+                                status="failed" if result.status == "failed" else "ok",
+                                sha256=result.sha256, path=result.path, size=result.size,
+                                content_type=result.content_type, error=result.error,
+                            )
+
+                    if done % 100 == 0 or done == total:
+                        elapsed = time.time() - start
+                        logger.info(
+                            f"[{done}/{total}] 완료 {stats['ok']} / 중복 {stats['duplicate']} / "
+                            f"실패 {stats['failed']} ({stats['bytes'] / 1024 / 1024:.1f}MB, "
+                            f"{stats['bytes'] / 1024 / 1024 / elapsed if elapsed else 0:.2f}MB/s)"
+                        )
+
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="회의록 첨부파일(PDF/HWP) 다운로더")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"회의록 DB 경로 (기본: {DEFAULT_DB_PATH})")
+    parser.add_argument("--files", type=str, default="output/files", help="파일 저장 디렉토리 (기본: output/files)")
+    parser.add_argument("--kind", choices=["pdf", "hwp"], action="append", help="다운로드할 형식 (기본: 전체)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="전체 동시 다운로드 수 (기본: 8)")
+    parser.add_argument("--per-host", type=int, default=2, help="호스트별 동시 다운로드 수 (기본: 2)")
+    parser.add_argument("--limit", "-n", type=int, default=None, help="최대 다운로드 건수")
+
+    args = parser.parse_args()
+
+    store = MinutesStore(args.db)
+    downloader = AttachmentDownloader(args.files, max_workers=args.workers, per_host=args.per_host)
+
+    try:
+        jobs = store.pending_attachments(kinds=args.kind or ("pdf", "hwp"), limit=args.limit)
+        logger.info(f"다운로드 대상: {len(jobs)}건")
+        if jobs:
+            stats = downloader.run(jobs, store)
+            logger.info(f"다운로드 종료: {stats}")
+        return 0
+    except KeyboardInterrupt:
+        logger.info("사용자 중단 - 받던 파일은 다음 실행 시 이어받습니다.")
+        return 130
+    finally:
+        downloader.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,26 +4,33 @@
 ==========================================
 - 17개 광역의회 + 226개 기초의회 순차 크롤링
 - 진행 상황 로깅 및 결과 요약 리포트 생성
-- 실패한 의회 재시도 지원
+- 수집 항목을 즉시 JSONL에 append하고 항목 단위 체크포인트 기록
+- 중단/실패한 의회는 마지막 페이지부터 재개 (--resume)
+- 의회별 요청/파싱 계측 → 느린/불안정한 의회 리포트 (JSON/CSV/Markdown)
 
 Usage:
     python batch_crawl.py --max-pages 3
     python batch_crawl.py --max-pages 5 --type metropolitan
     python batch_crawl.py --max-pages 2 --type basic
-    python batch_crawl.py --resume  # 실패한 의회만 재시도
+    python batch_crawl.py --resume  # 미완료 의회 재개 (부분 완료 의회는 중단 페이지부터)
+    python batch_crawl.py --max-pages 3 --index output/minutes.db  # 전문 검색 색인
 """
 
 import argparse
+import csv
 import json
 import logging
+import os
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # 크롤러 모듈 임포트
-from council_crawler import get_all_councils, get_crawler, ResultSaver
+from council_crawler import get_all_councils, get_crawler, JsonlSink, ResultSaver
+from dedup_index import DedupIndex
+from minutes_store import IndexWriter, MinutesStore
 
 # 로깅 설정
 logging.basicConfig(
@@ -37,17 +44,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 상태 파일은 N건 또는 T초마다 갱신 (항목별 기록은 JSONL이 담당 - 재개 시 source_url로 건너뜀)
+STATUS_SAVE_EVERY = 50
+STATUS_SAVE_INTERVAL = 10.0
+
 
 class BatchCrawler:
     """전체 의회 일괄 크롤링 관리자"""
 
-    def __init__(self, output_dir: str = "output", max_pages: int = 3):
+    def __init__(self, output_dir: str = "output", max_pages: int = 3,
+                 index_path: Optional[str] = None, dedup_path: Optional[str] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_pages = max_pages
         self.results: Dict[str, Dict[str, Any]] = {}
+        # 진행 중/중단된 의회의 체크포인트: {code: {"page", "count", "output_file", "updated_at"}}
+        self.checkpoints: Dict[str, Dict[str, Any]] = {}
         self.start_time = None
 
+        # 전문 검색 색인 (선택) - 백그라운드 스레드에서 색인
+        self.index_store = MinutesStore(index_path) if index_path else None
+        self.index_writer = IndexWriter(self.index_store) if self.index_store else None
+
+        # CLIK 등 다른 출처와의 중복 색인 (선택) - 이미 있는 회의는 상세 요청 생략
+        self.dedup_index = DedupIndex(dedup_path) if dedup_path else None
+
         # 상태 파일
         self.status_file = self.output_dir / "crawl_status.json"
 
@@ -56,21 +77,24 @@ class BatchCrawler:
         if self.status_file.exists():
             with open(self.status_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
-        return {"completed": [], "failed": [], "results": {}}
+        return {"completed": [], "failed": [], "results": {}, "checkpoints": {}}
 
     def save_status(self):
-        """크롤링 상태 저장"""
+        """크롤링 상태 저장 (임시 파일에 쓴 뒤 교체하여 중단 시에도 손상 방지)"""
         status = {
             "last_updated": datetime.now().isoformat(),
             "completed": [code for code, r in self.results.items() if r.get("success")],
             "failed": [code for code, r in self.results.items() if not r.get("success")],
-            "results": self.results
+            "results": self.results,
+            "checkpoints": self.checkpoints,
         }
-        with open(self.status_file, 'w', encoding='utf-8') as f:
+        tmp_file = self.status_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump(status, ensure_ascii=False, indent=2, fp=f)
+        os.replace(tmp_file, self.status_file)
 
     def crawl_council(self, council_code: str, config: Dict[str, Any]) -> Dict[str, Any]:
-        """단일 의회 크롤링"""
+        """단일 의회 크롤링 - 항목마다 JSONL append + 체크포인트 갱신 (상태 파일 저장은 주기적으로)"""
         result = {
             "code": council_code,
             "name": config.get("name", ""),
@@ -83,6 +107,20 @@ class BatchCrawler:
         }
 
         start = time.time()
+        crawler = None
+        sink = None
+
+        # 이전 실행의 체크포인트가 있으면 같은 파일에 이어쓰고 중단 페이지부터 재개
+        checkpoint = self.checkpoints.get(council_code)
+        if checkpoint:
+            output_file = Path(checkpoint["output_file"])
+            start_page = checkpoint.get("page", 1)
+            skip_urls = JsonlSink.read_source_urls(output_file)
+            logger.info(f"  체크포인트에서 재개: 페이지 {start_page}, 기수집 {len(skip_urls)}건")
+        else:
+            output_file = ResultSaver(str(self.output_dir)).new_jsonl_path(council_code)
+            start_page = 1
+            skip_urls = set()
 
         try:
             crawler = get_crawler(council_code)
@@ -90,26 +128,60 @@ class BatchCrawler:
                 result["error"] = "크롤러 생성 실패"
                 return result
 
-            # 크롤링 실행
-            items = list(crawler.crawl(max_pages=self.max_pages))
-            result["count"] = len(items)
-
-            if items:
-                # 결과 저장
-                saver = ResultSaver(str(self.output_dir))
-                output_file = saver.save_jsonl(council_code, items)
+            crawler.keep_full_content = self.index_writer is not None
+            crawler.dedup_index = self.dedup_index
+            sink = JsonlSink(output_file)
+            count = len(skip_urls)
+            unsaved = 0
+            last_saved = time.monotonic()
+
+            # 크롤링 실행 - generator를 그대로 sink로 흘려보냄
+            max_pages = self.max_pages - (start_page - 1)
+            for item in crawler.crawl(max_pages=max_pages, start_page=start_page, skip_urls=skip_urls):
+                sink.write(item)
+                count += 1
+                if self.index_writer:
+                    self.index_writer.add(item)
+
+                self.checkpoints[council_code] = {
+                    "page": crawler.current_page,
+                    "count": count,
+                    "output_file": str(output_file),
+                    "updated_at": datetime.now().isoformat(),
+                }
+                unsaved += 1
+                if unsaved >= STATUS_SAVE_EVERY or time.monotonic() - last_saved >= STATUS_SAVE_INTERVAL:
+                    self.save_status()
+                    unsaved = 0
+                    last_saved = time.monotonic()
+
+            result["count"] = count
+
+            if count:
                 result["output_file"] = str(output_file)
                 result["success"] = True
             else:
                 result["success"] = False  # 0건이면 실패로 처리
                 result["error"] = "수집된 데이터 없음 (URL 확인 필요)"
 
-            crawler.close()
+            # 정상 종료된 의회는 체크포인트 제거
+            self.checkpoints.pop(council_code, None)
 
         except Exception as e:
             result["error"] = str(e)
+            result["count"] = self.checkpoints.get(council_code, {}).get("count", 0)
             logger.error(f"[{council_code}] 크롤링 오류: {e}")
 
+        finally:
+            if sink:
+                sink.close()
+                if not sink.count and not skip_urls:
+                    output_file.unlink(missing_ok=True)
+            if crawler:
+                result["request_delay"] = crawler.request_delay
+                result["metrics"] = crawler.telemetry.summary()
+                crawler.close()
+
         result["duration"] = round(time.time() - start, 2)
         return result
 
@@ -130,11 +202,12 @@ class BatchCrawler:
         else:
             targets = all_councils
 
-        # resume 모드: 실패한 것만 재시도
+        # resume 모드: 완료된 의회는 건너뛰고, 부분 완료 의회는 체크포인트부터 재개
         if resume:
-            failed = set(prev_status.get("failed", []))
-            targets = {k: v for k, v in targets.items() if k in failed}
-            logger.info(f"재시도 모드: {len(targets)}개 의회")
+            self.results = prev_status.get("results", {})
+            self.checkpoints = prev_status.get("checkpoints", {})
+            targets = {k: v for k, v in targets.items() if k not in completed}
+            logger.info(f"재개 모드: {len(targets)}개 의회 (부분 완료 {len(self.checkpoints)}개)")
 
         total = len(targets)
         success_count = 0
@@ -154,6 +227,7 @@ class BatchCrawler:
 
             result = self.crawl_council(code, config)
             self.results[code] = result
+            self.save_status()
 
             if result["success"]:
                 success_count += 1
@@ -163,9 +237,7 @@ class BatchCrawler:
                 fail_count += 1
                 logger.warning(f"  ✗ 실패: {result['error']}")
 
-            # 상태 저장 (10개마다)
             if idx % 10 == 0:
-                self.save_status()
                 logger.info(f"  [진행률: {idx}/{total} ({idx*100//total}%)]")
 
             # 의회 간 딜레이
@@ -176,6 +248,19 @@ class BatchCrawler:
 
         # 결과 리포트 생성
         self.generate_report(total, success_count, fail_count, total_items)
+        self.generate_metrics_report()
+
+    def close(self):
+        """색인 writer 정리 (남은 큐 색인 후 종료)"""
+        if self.index_writer:
+            self.index_writer.close()
+            self.index_writer = None
+        if self.index_store:
+            self.index_store.close()
+            self.index_store = None
+        if self.dedup_index:
+            self.dedup_index.close()
+            self.dedup_index = None
 
     def generate_report(self, total: int, success: int, fail: int, items: int):
         """크롤링 결과 리포트 생성"""
@@ -256,6 +341,116 @@ class BatchCrawler:
         logger.info(f"리포트 저장: {report_file}")
 
 
+    METRIC_COLUMNS = [
+        "requests", "failures", "retries", "bytes", "deduplicated",
+        "ttfb_p50", "ttfb_p90", "ttfb_p99",
+        "download_p50", "download_p90", "download_p99",
+        "total_p50", "total_p90", "total_p99",
+        "parse_list_p50", "parse_list_p90", "parse_detail_p50", "parse_detail_p90",
+    ]
+
+    def generate_metrics_report(self, top_n: int = 15):
+        """의회별 계측 집계를 JSON/CSV로 내보내고 느린/불안정한 의회 Markdown 요약 생성"""
+        rows = []
+        for code, r in self.results.items():
+            metrics = r.get("metrics")
+            if not metrics or not metrics.get("requests"):
+                continue
+            rows.append({
+                "code": code,
+                "name": r.get("name", ""),
+                "request_delay": r.get("request_delay", 0),
+                "count": r.get("count", 0),
+                "duration": r.get("duration", 0),
+                **{col: metrics.get(col, 0) for col in self.METRIC_COLUMNS},
+            })
+
+        if not rows:
+            return
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        json_file = self.output_dir / f"crawl_metrics_{timestamp}.json"
+        csv_file = self.output_dir / f"crawl_metrics_{timestamp}.csv"
+        md_file = self.output_dir / f"crawl_metrics_{timestamp}.md"
+
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(rows, ensure_ascii=False, indent=2, fp=f)
+
+        with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        def flakiness(row):
+            # (최종 실패율, 요청당 재시도 수)
+            return row["failures"] / row["requests"], row["retries"] / row["requests"]
+
+        slowest = sorted(rows, key=lambda x: x["total_p90"], reverse=True)[:top_n]
+        flakiest = sorted(
+            (row for row in rows if row["failures"] or row["retries"]),
+            key=flakiness, reverse=True,
+        )[:top_n]
+        # 오류/재시도가 없고 p90 응답이 딜레이의 20% 미만이면 딜레이 하향 검토 대상
+        conservative = [
+            row for row in rows
+            if not row["failures"] and not row["retries"]
+            and row["request_delay"] and row["total_p90"] < row["request_delay"] * 0.2
+        ]
+
+        lines = [
+            "# 의회별 크롤링 계측 요약",
+            "",
+            f"- 생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"- 계측 의회: {len(rows)}개 / 총 요청 {sum(r['requests'] for r in rows)}건",
+            "",
+            f"## 가장 느린 의회 (요청 p90 기준 상위 {top_n})",
+            "",
+            "| 의회 | 요청 | TTFB p50 | TTFB p90 | 다운로드 p90 | 전체 p90 | 목록 파싱 p90 | 상세 파싱 p90 |",
+            "|------|-----:|--------:|--------:|-----------:|--------:|------------:|------------:|",
+        ]
+        for row in slowest:
+            lines.append(
+                f"| {row['name']} ({row['code']}) | {row['requests']} | {row['ttfb_p50']:.3f}s | "
+                f"{row['ttfb_p90']:.3f}s | {row['download_p90']:.3f}s | {row['total_p90']:.3f}s | "
+                f"{row['parse_list_p90'] * 1000:.1f}ms | {row['parse_detail_p90'] * 1000:.1f}ms |"
+            )
+
+        lines += [
+            "",
+            f"## 가장 불안정한 의회 (실패율/재시도 상위 {top_n})",
+            "",
+            "| 의회 | 요청 | 실패 | 재시도 | 실패율 | 요청당 재시도 |",
+            "|------|-----:|-----:|------:|------:|------------:|",
+        ]
+        for row in flakiest:
+            lines.append(
+                f"| {row['name']} ({row['code']}) | {row['requests']} | {row['failures']} | "
+                f"{row['retries']} | {flakiness(row)[0] * 100:.1f}% | {flakiness(row)[1]:.2f} |"
+            )
+        if not flakiest:
+            lines.append("| (없음) | | | | | |")
+
+        lines += [
+            "",
+            "## request_delay 하향 검토 대상",
+            "",
+            "오류/재시도 없이 요청 p90이 request_delay의 20% 미만인 의회입니다.",
+            "",
+        ]
+        for row in sorted(conservative, key=lambda x: x["total_p90"]):
+            lines.append(
+                f"- {row['name']} ({row['code']}): request_delay {row['request_delay']}s, "
+                f"요청 p90 {row['total_p90']:.3f}s"
+            )
+        if not conservative:
+            lines.append("- (없음)")
+
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+        logger.info(f"계측 리포트 저장: {md_file} (JSON: {json_file.name}, CSV: {csv_file.name})")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="전국 243개 지방의회 일괄 크롤링",
@@ -269,11 +464,16 @@ def main():
     parser.add_argument("--output", "-o", type=str, default="output",
                         help="출력 디렉토리 (기본: output)")
     parser.add_argument("--resume", "-r", action="store_true",
-                        help="실패한 의회만 재시도")
+                        help="미완료 의회 재개 (부분 완료 의회는 중단 페이지부터)")
+    parser.add_argument("--index", type=str, default=None,
+                        help="전문 검색 색인 DB 경로 (예: output/minutes.db)")
+    parser.add_argument("--dedup", type=str, default=None,
+                        help="중복 색인 DB 경로 - 다른 출처에 이미 있는 회의는 건너뜀 (예: output/dedup.db)")
 
     args = parser.parse_args()
 
-    crawler = BatchCrawler(output_dir=args.output, max_pages=args.max_pages)
+    crawler = BatchCrawler(output_dir=args.output, max_pages=args.max_pages,
+                           index_path=args.index, dedup_path=args.dedup)
 
     try:
         crawler.run(council_type=args.type, resume=args.resume)
@@ -282,6 +482,8 @@ def main():
         crawler.save_status()
         logger.info("상태 저장 완료. --resume 옵션으로 재시도 가능.")
         return 130
+    finally:
+        crawler.close()
 
     return 0
 
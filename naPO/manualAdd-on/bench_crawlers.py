@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+지방의회 크롤러 벤치마크 (로컬 모의 서버)
+==========================================
+- 실제 의회 사이트 대신 로컬 HTTP 서버가 crawler_type별 목록/상세 페이지를 응답
+- 녹화된 픽스처(bench_fixtures/<대상>/list.html, detail.html)가 있으면 사용,
+  없으면 각 크롤러 레이아웃에 맞춘 합성 페이지 사용
+- 응답 지연(latency/jitter)과 오류 응답(error rate) 주입
+- 크롤러 클래스별 목록 파싱 시간, 상세 파싱 시간, 전체 크롤링 처리량(items/sec) 측정
+- 이전 결과(--baseline)와 비교해 성능 회귀 검출
+
+대상 키는 의회코드별 특수 크롤러(gyeonggi, seoul)는 의회 코드, 나머지는 crawler_type.
+
+Usage:
+    python bench_crawlers.py                              # 전체 크롤러 합성 픽스처 벤치마크
+    python bench_crawlers.py --only busanjin incheon_metro --latency 0.05 --error-rate 0.05
+    python bench_crawlers.py --record busanjin            # 실제 페이지를 픽스처로 녹화
+    python bench_crawlers.py --output bench.json --baseline old.json --max-regression 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+# 벤치마크 중 학습한 추출 플랜이 실제 플랜 파일(.extraction_plans.json)에 섞이지 않도록 메모리에만 유지
+os.environ.setdefault("COUNCIL_PLAN_CACHE", "0")
+
+from bs4 import BeautifulSoup
+
+from council_crawler import (
+    BaseCouncilCrawler,
+    SPECIAL_CRAWLERS,
+    crawler_class_for,
+    get_crawler,
+    get_registry,
+    percentile,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "bench_fixtures"
+LIST_PATH = "/bench/list"
+
+
+# ============================================================================
+# 픽스처
+# ============================================================================
+@dataclass
+class Fixture:
+    """대상 1개의 목록/상세 응답 본문"""
+    list_html: str
+    detail_html: str
+    empty_html: str = "<html><body><table><tbody></tbody></table></body></html>"
+    origin: str = ""      # 녹화 원본 사이트 (응답 시 모의 서버 주소로 치환)
+    source: str = "synthetic"
+
+
+def _table(rows: List[str], table_class: str = "") -> str:
+    cls = f' class="{table_class}"' if table_class else ""
+    return f"<html><body><table{cls}><thead><tr><th>번호</th></tr></thead><tbody>{''.join(rows)}</tbody></table></body></html>"
+
+
+def _meeting(i: int) -> Dict[str, str]:
+    """합성 회의 i번의 메타데이터"""
+    return {
+        "assembly": f"제{9 + i % 3}대",
+        "session": f"제{300 + i // 4}회",
+        "order": f"제{i % 4 + 1}차",
+        "kind": "정례회" if i % 5 == 0 else "임시회",
+        "committee": ("본회의", "운영위원회", "행정자치위원회", "복지환경위원회")[i % 4],
+        "date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+    }
+
+
+def _generic_rows(n: int, link) -> List[str]:
+    """번호/회기/차수/위원회(링크)/날짜 5컬럼 행"""
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f"<tr><td>{m['assembly']}</td><td>{m['session']}</td><td>{m['order']}</td>"
+            f"<td>{link(i, m)}</td><td>{m['date']}</td></tr>"
+        )
+    return rows
+
+
+def _list_generic(n: int) -> str:
+    return _table(_generic_rows(n, lambda i, m: f'<a href="view.do?uid={1000 + i}">{m["session"]} {m["committee"]} 회의록</a>'))
+
+
+def _list_assembly(n: int) -> str:
+    return _table(_generic_rows(n, lambda i, m: (
+        f'<a href="view.do?uid={1000 + i}" onclick="fn_view(\'{1000 + i}\')">{m["session"]} {m["committee"]}</a>'
+    )))
+
+
+def _list_gyeonggi(n: int) -> str:
+    return _table(_generic_rows(n, lambda i, m: f'<a href="mntsViewer.do?key={1000 + i}">{m["session"]} {m["committee"]}</a>'))
+
+
+def _list_hwaseong(n: int) -> str:
+    return _table(_generic_rows(n, lambda i, m: f'<a href="#none" onclick="goView(\'{1000 + i}\')">{m["session"]} {m["committee"]}</a>'))
+
+
+def _list_dobong(n: int) -> str:
+    return _table(_generic_rows(n, lambda i, m: (
+        f'<a href="javascript:void(0)" onclick="location.href=\'view.do?uid={1000 + i}\'">{m["session"]} {m["committee"]}</a>'
+    )))
+
+
+def _list_links(n: int, href: str) -> str:
+    items = []
+    for i in range(n):
+        m = _meeting(i)
+        items.append(f'<li><a href="{href.format(id=1000 + i)}">[{m["kind"][:2]}]{m["session"]} {m["committee"]} {m["order"]}</a></li>')
+    return f"<html><body><ul class='list'>{''.join(items)}</ul></body></html>"
+
+
+def _list_geumcheon(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f"<tr><td>{n - i}</td><td>{m['assembly']}</td>"
+            f'<td class="sbj"><a href="view.do?uid={1000 + i}">{m["session"]} {m["committee"]}</a></td><td>{m["date"]}</td></tr>'
+        )
+    return _table(rows, "normal_list")
+
+
+def _list_councilbook(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f"<tr><td>{n - i}</td><td>{m['assembly']}</td><td>{m['session']}</td>"
+            f'<td><a href="#" onclick="ajaxMtrList(\'{3000 + i}\')">{m["committee"]} {m["order"]}</a></td>'
+            f"<td>{m['committee']}</td><td>{m['date']}</td></tr>"
+        )
+    return _table(rows)
+
+
+def _list_busan_board(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f'<tr><td>{n - i}</td><td class="subject"><a href="board/view.do?nttId={1000 + i}">'
+            f'{m["session"]} {m["committee"]} 회의록</a></td><td class="date">{m["date"]}</td></tr>'
+        )
+    return _table(rows, "board_list")
+
+
+def _list_busanjin(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f"<tr><td>{m['session']}</td><td>{m['kind']}</td><td>"
+            f"<a href=\"#\" onclick=\"fn_popup_page({300 + i},2,{i % 9 + 1},{i % 4 + 1},'{m['kind']}','{m['committee']}',0,1,'','')\">"
+            f"{m['committee']} {m['order']}</a></td><td>{m['date']}</td></tr>"
+        )
+    return _table(rows)
+
+
+def _list_viewer(n: int) -> str:
+    items = []
+    for i in range(n):
+        m = _meeting(i)
+        items.append(
+            f'<li><a href="viewer.do?uid={1000 + i}"><span class="fll icon">회의록</span>'
+            f'<span class="fll">{m["assembly"]} {m["session"][1:]} [{m["kind"]}] {m["order"][1:]} {m["committee"]}</span></a></li>'
+        )
+    return f"<html><body><ul class='minutes'>{''.join(items)}</ul></body></html>"
+
+
+def _list_incheon(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        date = m["date"].replace("-", ".")
+        rows.append(
+            f"<tr><td>{n - i}</td><td>{m['session']}</td><td>{m['order']}\n  {m['committee']}</td>"
+            f'<td><a href="view.do?uid={1000 + i}">회의록</a></td><td>{date} Thu요일</td></tr>'
+        )
+    return _table(rows, "general_board")
+
+
+def _list_busan_metro(n: int) -> str:
+    rows = []
+    for i in range(n):
+        m = _meeting(i)
+        rows.append(
+            f"<tr><td>{n - i}</td><td>{m['assembly']}</td><td>{m['session']}</td><td>{m['order']}</td>"
+            f"<td>{m['committee']}</td><td>{m['date']}</td>"
+            f'<td><a href="preView.do?uid={1000 + i}">회의록보기</a></td></tr>'
+        )
+    return _table(rows, "list")
+
+
+# 대상 키 -> 합성 목록 페이지 생성기 (없는 대상은 기본 5컬럼 테이블)
+SYNTHETIC_LISTS = {
+    "gyeonggi": _list_gyeonggi,
+    "assembly": _list_assembly,
+    "ansan": lambda n: _list_links(n, "/SvcMntsViewer.do?schSn={id}"),
+    "hwaseong": _list_hwaseong,
+    "dobong": _list_dobong,
+    "seongdong": lambda n: _list_links(n, "view?ntime={id}"),
+    "yangcheon": lambda n: _list_links(n, "record/main?uid={id}"),
+    "geumcheon": _list_geumcheon,
+    "councilbook": _list_councilbook,
+    "busan_board": _list_busan_board,
+    "saha": _list_busan_board,
+    "yeonje": _list_busan_board,
+    "sasang": _list_busan_board,
+    "busanjin": _list_busanjin,
+    "jeonbuk_metro": _list_viewer,
+    "jeonnam_metro": _list_viewer,
+    "incheon_metro": _list_incheon,
+    "busan_metro": _list_busan_metro,
+}
+
+
+def synthetic_detail(kb: int) -> str:
+    """발언 단위 문단으로 채운 약 kb KB 분량의 상세 페이지"""
+    speeches = []
+    size, i = 0, 0
+    while size < kb * 1024:
+        speech = (
+            f"<p>○{'위원장' if i % 3 == 0 else '위원'} 홍길동{i % 7} 안건 제{i + 1}항에 대하여 말씀드리겠습니다. "
+            f"예산 집행 현황과 향후 계획에 대한 질의가 있었으며 관계 부서의 답변을 들었습니다.</p>"
+        )
+        speeches.append(speech)
+        size += len(speech.encode("utf-8"))
+        i += 1
+    body = "\n".join(speeches)
+    return (
+        "<html><body><h3 class=\"view_title\">제300회 임시회 본회의 회의록</h3>"
+        f"<div id=\"content\" class=\"view_content record_content content\">{body}</div></body></html>"
+    )
+
+
+def load_fixture(target: str, fixtures_dir: Path, rows: int, detail_kb: int) -> Fixture:
+    """녹화된 픽스처 우선, 없으면 합성 픽스처"""
+    target_dir = fixtures_dir / target
+    if (target_dir / "list.html").exists() and (target_dir / "detail.html").exists():
+        meta_path = target_dir / "meta.json"
+        meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+        return Fixture(
+            list_html=(target_dir / "list.html").read_text(encoding="utf-8"),
+            detail_html=(target_dir / "detail.html").read_text(encoding="utf-8"),
+            origin=meta.get("origin", ""),
+            source="recorded",
+        )
+    make_list = SYNTHETIC_LISTS.get(target, _list_generic)
+    return Fixture(list_html=make_list(rows), detail_html=synthetic_detail(detail_kb))
+
+
+def record_fixture(council_code: str, fixtures_dir: Path) -> Optional[Path]:
+    """실제 의회 사이트의 목록 1페이지와 첫 상세 페이지를 픽스처로 저장"""
+    crawler = get_crawler(council_code)
+    if crawler is None:
+        return None
+    try:
+        list_url = crawler.get_list_url(1)
+        list_response = crawler.client.get(list_url)
+        if list_response is None:
+            logger.error(f"목록 페이지 로드 실패: {list_url}")
+            return None
+        meetings = crawler.parse_list_page(BeautifulSoup(list_response.content, "html.parser"), list_url)
+        if not meetings:
+            logger.error(f"목록에서 회의록을 찾지 못함: {list_url}")
+            return None
+        detail_url = meetings[0]["detail_url"]
+        detail_response = crawler.client.get(detail_url)
+        if detail_response is None:
+            logger.error(f"상세 페이지 로드 실패: {detail_url}")
+            return None
+
+        target_dir = fixtures_dir / target_key(council_code, crawler.config)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        (target_dir / "list.html").write_text(list_response.text, encoding="utf-8")
+        (target_dir / "detail.html").write_text(detail_response.text, encoding="utf-8")
+        parsed = urlparse(crawler.base_url)
+        meta = {
+            "council_code": council_code,
+            "origin": f"{parsed.scheme}://{parsed.netloc}",
+            "list_url": list_url,
+            "detail_url": detail_url,
+            "items": len(meetings),
+            "recorded_at": datetime.now().isoformat(),
+        }
+        (target_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        logger.info(f"픽스처 저장: {target_dir} (목록 {len(meetings)}건)")
+        return target_dir
+    finally:
+        crawler.close()
+
+
+# ============================================================================
+# 모의 서버
+# ============================================================================
+class MockCouncilServer:
+    """목록/상세 픽스처를 응답하는 로컬 HTTP 서버
+
+    LIST_PATH 요청은 목록 페이지(pages 이후는 빈 목록), 그 외 모든 경로는 상세 페이지로 응답한다.
+    """
+
+    def __init__(self, fixture: Fixture, page_param: str = "pageNo", pages: int = 3,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: int = 0):
+        self.fixture = fixture
+        self.page_param = page_param
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"list": 0, "detail": 0, "errors": 0}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (실제 사이트와 같은 연결 재사용)
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed ACK 대기(~40ms) 방지
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.origin = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread: Optional[threading.Thread] = None
+        self._bodies = {
+            "detail": self._rewrite(fixture.detail_html),
+            "list": self._rewrite(fixture.list_html),
+            "empty": fixture.empty_html.encode("utf-8"),
+        }
+
+    def _rewrite(self, html: str) -> bytes:
+        """녹화 원본 절대 URL을 모의 서버 주소로 치환"""
+        if self.fixture.origin:
+            html = html.replace(self.fixture.origin, self.origin)
+        return html.encode("utf-8")
+
+    def _draw(self):
+        """(지연 초, 오류 여부) - 스레드 간 난수 생성기 공유"""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+        return delay, failed
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        parsed = urlparse(handler.path)
+        if parsed.path == LIST_PATH:
+            page = int(parse_qs(parsed.query).get(self.page_param, ["1"])[0] or 1)
+            kind, body_key = "list", "list" if page <= self.pages else "empty"
+        else:
+            kind, body_key = "detail", "detail"
+
+        delay, failed = self._draw()
+        if delay:
+            time.sleep(delay)
+
+        with self._lock:
+            self.counts[kind] += 1
+            self.counts["errors"] += int(failed)
+
+        if failed:
+            body, status = b"injected error", self.error_status
+        else:
+            body, status = self._bodies[body_key], 200
+        handler.send_response(status)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self) -> "MockCouncilServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockCouncilServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+def target_key(council_code: str, config: Dict[str, Any]) -> str:
+    """벤치마크 대상 키 (특수 크롤러는 의회 코드, 나머지는 crawler_type)"""
+    return council_code if council_code in SPECIAL_CRAWLERS else config.get("crawler_type", "default")
+
+
+def discover_targets() -> Dict[str, str]:
+    """대상 키 -> 대표 의회 코드 (대상별 첫 의회)"""
+    targets: Dict[str, str] = {}
+    for code, config in get_registry().all().items():
+        targets.setdefault(target_key(code, config), code)
+    return targets
+
+
+@dataclass
+class BenchResult:
+    """대상 1개의 벤치마크 결과 (시간 단위: ms)"""
+    target: str
+    council_code: str
+    crawler_class: str
+    fixture: str
+    list_items: int = 0
+    soup_list_ms: float = 0.0       # 목록 HTML -> BeautifulSoup
+    list_parse_ms: float = 0.0      # parse_list_page (p50)
+    soup_detail_ms: float = 0.0     # 상세 HTML -> BeautifulSoup
+    detail_parse_ms: float = 0.0    # parse_detail_page (p50)
+    crawl_items: int = 0
+    crawl_seconds: float = 0.0
+    items_per_sec: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    error: str = ""
+    telemetry: Dict[str, Any] = field(default_factory=dict)
+
+
+def _time_ms(func, repeat: int) -> tuple:
+    """(마지막 반환값, p50 ms)"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, round(percentile(samples, 50), 3)
+
+
+def bench_target(target: str, council_code: str, fixture: Fixture, args) -> BenchResult:
+    """파싱 마이크로벤치마크 + 모의 서버 대상 전체 크롤링"""
+    registry_config = get_registry().get(council_code)
+    crawler_class = crawler_class_for(council_code, registry_config)
+    result = BenchResult(target, council_code, crawler_class.__name__, fixture.source)
+    page_param = registry_config.get("pagination", {}).get("param", "pageNo")
+
+    server = MockCouncilServer(
+        fixture, page_param=page_param, pages=args.pages, latency=args.latency,
+        jitter=args.jitter, error_rate=args.error_rate, seed=args.seed,
+    )
+    with server:
+        # 모의 서버를 가리키도록 URL만 바꾼 설정 (셀렉터/파라미터는 실제 설정 그대로)
+        config = dict(registry_config, base_url=server.origin, list_url=f"{server.origin}{LIST_PATH}",
+                      request_delay=0.0)
+        crawler: BaseCouncilCrawler = crawler_class(council_code, config)
+        try:
+            list_url = crawler.get_list_url(1)
+            list_html = server._bodies["list"]
+            soup, result.soup_list_ms = _time_ms(lambda: BeautifulSoup(list_html, "html.parser"), args.repeat)
+            meetings, result.list_parse_ms = _time_ms(lambda: crawler.parse_list_page(soup, list_url), args.repeat)
+            result.list_items = len(meetings)
+
+            if meetings:
+                detail_html = server._bodies["detail"]
+                detail_url = meetings[0]["detail_url"]
+                detail_soup, result.soup_detail_ms = _time_ms(
+                    lambda: BeautifulSoup(detail_html, "html.parser"), args.repeat)
+                _, result.detail_parse_ms = _time_ms(
+                    lambda: crawler.parse_detail_page(detail_soup, detail_url, meetings[0]), args.repeat)
+
+            start = time.perf_counter()
+            result.crawl_items = sum(1 for _ in crawler.crawl(max_pages=args.pages + 1))
+            result.crawl_seconds = round(time.perf_counter() - start, 3)
+            if result.crawl_seconds:
+                result.items_per_sec = round(result.crawl_items / result.crawl_seconds, 1)
+
+            summary = crawler.telemetry.summary()
+            result.requests = summary["requests"]
+            result.failures = summary["failures"]
+            result.retries = summary["retries"]
+            result.telemetry = summary
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            logger.exception(f"[{target}] 벤치마크 실패")
+        finally:
+            crawler.close()
+    return result
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+COMPARE_FIELDS = (
+    # (필드, 클수록 좋은지)
+    ("list_parse_ms", False),
+    ("detail_parse_ms", False),
+    ("items_per_sec", True),
+)
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, Dict[str, Any]]) -> List[tuple]:
+    """기준 결과 대비 악화 항목 - [(악화율 %, 설명)], 악화율 큰 순"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.target)
+        if not base:
+            continue
+        for name, higher_is_better in COMPARE_FIELDS:
+            old, new = base.get(name, 0), getattr(result, name)
+            if not old:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better else change
+            if worse > 0:
+                regressions.append((worse, f"{result.target}.{name}: {old} -> {new} ({change:+.1f}%)"))
+    return sorted(regressions, reverse=True)
+
+
+def print_report(results: List[BenchResult]):
+    header = (f"{'대상':<15} {'클래스':<26} {'픽스처':<9} {'목록':>4} {'목록soup':>9} {'목록파싱':>9} "
+              f"{'상세soup':>9} {'상세파싱':>9} {'수집':>5} {'items/s':>8} {'요청':>5} {'실패':>4} {'재시도':>5}")
+    print(header)
+    print("-" * 140)
+    for r in results:
+        print(
+            f"{r.target:<15} {r.crawler_class:<26} {r.fixture:<9} {r.list_items:>4} {r.soup_list_ms:>9.3f} "
+            f"{r.list_parse_ms:>9.3f} {r.soup_detail_ms:>9.3f} {r.detail_parse_ms:>9.3f} {r.crawl_items:>5} "
+            f"{r.items_per_sec:>8.1f} {r.requests:>5} {r.failures:>4} {r.retries:>5}"
+            + (f"  ! {r.error}" if r.error else "")
+        )
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="지방의회 크롤러 벤치마크 (로컬 모의 서버)")
+    parser.add_argument("--only", nargs="+", metavar="TARGET", help="대상 키 (crawler_type 또는 gyeonggi/seoul)")
+    parser.add_argument("--list-targets", action="store_true", help="대상 키와 대표 의회 목록 출력")
+    parser.add_argument("--record", nargs="+", metavar="TARGET", help="실제 사이트에서 픽스처 녹화 (대상 키 또는 의회 코드)")
+    parser.add_argument("--fixtures", type=str, default=str(DEFAULT_FIXTURES_DIR), help="픽스처 디렉토리")
+    parser.add_argument("--rows", type=int, default=20, help="합성 목록 페이지당 건수 (기본: 20)")
+    parser.add_argument("--detail-kb", type=int, default=30, help="합성 상세 페이지 크기 KB (기본: 30)")
+    parser.add_argument("--pages", type=int, default=3, help="크롤링 목록 페이지 수 (기본: 3)")
+    parser.add_argument("--repeat", type=int, default=20, help="파싱 반복 측정 횟수 (기본: 20)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 초 (기본: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대 초 (기본: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 0~1 (기본: 0)")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    parser.add_argument("--output", "-o", type=str, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", type=str, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="기준 대비 이 비율(%%) 이상 악화되면 종료 코드 1")
+    parser.add_argument("--verbose", "-v", action="store_true", help="크롤러 로그 출력")
+
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger("council_crawler").setLevel(logging.WARNING)
+
+    fixtures_dir = Path(args.fixtures)
+    targets = discover_targets()
+
+    if args.list_targets:
+        for target, code in sorted(targets.items()):
+            print(f"{target:<15} {code:<15} {crawler_class_for(code, get_registry().get(code)).__name__}")
+        return 0
+
+    if args.record:
+        failed = [name for name in args.record if record_fixture(targets.get(name, name), fixtures_dir) is None]
+        return 1 if failed else 0
+
+    selected = args.only or sorted(targets)
+    unknown = [name for name in selected if name not in targets]
+    if unknown:
+        parser.error(f"알 수 없는 대상: {', '.join(unknown)} (--list-targets로 확인)")
+
+    results = []
+    for target in selected:
+        fixture = load_fixture(target, fixtures_dir, args.rows, args.detail_kb)
+        result = bench_target(target, targets[target], fixture, args)
+        logger.info(f"[{target}] {result.crawler_class}: {result.crawl_items}건, {result.items_per_sec} items/sec")
+        results.append(result)
+
+    print_report(results)
+
+    if args.output:
+        payload = {
+            "created_at": datetime.now().isoformat(),
+            "settings": {key: getattr(args, key) for key in
+                         ("rows", "detail_kb", "pages", "repeat", "latency", "jitter", "error_rate", "seed")},
+            "results": {r.target: asdict(r) for r in results},
+        }
+        Path(args.output).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        logger.info(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline)
+        for _, text in regressions:
+            print(f"  악화: {text}")
+        if args.max_regression is not None:
+            worst = [text for worse, text in regressions if worse >= args.max_regression]
+            if worst:
+                logger.error(f"허용치({args.max_regression}%) 이상 성능 회귀 {len(worst)}건")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,23 +11,33 @@ Usage:
     python clik_crawler.py --region gyeonggi --max-pages 3
     python clik_crawler.py --council-name 수원시의회 --max-pages 2
     python clik_crawler.py --year 2024 --max-pages 10
+    python clik_crawler.py --year 2024 --max-pages 50 --details --workers 8 --rps 4
+    python clik_crawler.py --sweep --year-from 2010 --year-to 2025 --workers 8
 """
 
 import argparse
 import json
 import logging
+import os
 import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional, Dict, Any, List
+from typing import Iterator, Optional, Dict, Any, List, Set
 from urllib.parse import urljoin, urlencode, quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+from dedup_index import DedupIndex
+from kr_parsing import extract_date, normalize_date
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +46,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 검색 결과 파싱 패턴
+COUNCIL_NAME_PATTERN = re.compile(r'([가-힣]+(?:시|군|구|도)의회)')
+CONTROL_NO_PATTERNS = [
+    re.compile(r"goDetailSingleDB\(['\"]?(\w+)['\"]?"),
+    re.compile(r"goDetail\(['\"]?(\w+)['\"]?"),
+    re.compile(r"viewPdfExec\(['\"]?(\w+)['\"]?"),
+    re.compile(r"['\"](\w{10,})['\"]"),  # 긴 영숫자 ID
+]
+PDF_EXEC_PATTERN = re.compile(r"viewPdfExec\(['\"](\w+)['\"]")
+
 
 # ============================================================================
 # 데이터 모델
@@ -60,6 +80,33 @@ class ClikMeetingMinutes:
         return asdict(self)
 
 
+# ============================================================================
+# 요청 속도 제한
+# ============================================================================
+class RateLimiter:
+    """스레드 간 공유하는 토큰 버킷 (초당 rate건, 최대 burst건까지 연속 허용)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 # ============================================================================
 # CLIK 포털 크롤러
 # ============================================================================
@@ -99,17 +146,26 @@ class ClikCrawler:
         "Referer": "https://clik.nanet.go.kr/",
     }
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", max_workers: int = 4,
+                 requests_per_second: float = 2.0):
         self.session = requests.Session()
         self.session.headers.update(self.DEFAULT_HEADERS)
+        # 동시 모드에서 작업 스레드가 하나의 커넥션 풀을 재사용
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.request_delay = 1.5
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second, burst=max_workers)
+        self.dedup_index = None  # DedupIndex - 의회 직접 크롤링에 이미 있는 회의는 상세 요청 생략
 
     def _get(self, url: str, params: Dict = None, max_retries: int = 3) -> Optional[requests.Response]:
         """GET 요청 with 재시도"""
         for attempt in range(max_retries):
             try:
+                self.rate_limiter.acquire()
                 response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
                 return response
@@ -123,6 +179,7 @@ class ClikCrawler:
         """POST 요청 with 재시도"""
         for attempt in range(max_retries):
             try:
+                self.rate_limiter.acquire()
                 response = self.session.post(url, data=data, timeout=30)
                 response.raise_for_status()
                 return response
@@ -219,15 +276,12 @@ class ClikCrawler:
             council_name = council_elem.get_text(strip=True)
         else:
             # 텍스트에서 추출
-            council_match = re.search(r'([가-힣]+(?:시|군|구|도)의회)', meta_text)
+            council_match = COUNCIL_NAME_PATTERN.search(meta_text)
             if council_match:
                 council_name = council_match.group(1)
 
         # 발행일 추출
-        pub_date = ""
-        date_match = re.search(r'(\d{4}[.-]\d{2}[.-]\d{2})', meta_text)
-        if date_match:
-            pub_date = date_match.group(1).replace('.', '-')
+        pub_date = extract_date(meta_text)
 
         # PDF URL
         pdf_url = None
@@ -271,7 +325,7 @@ class ClikCrawler:
                 'control_no': control_no or '',
                 'title': title,
                 'council_name': cells[1].get_text(strip=True) if len(cells) > 1 else '',
-                'pub_date': cells[2].get_text(strip=True) if len(cells) > 2 else '',
+                'pub_date': normalize_date(cells[2].get_text(strip=True)) if len(cells) > 2 else '',
                 'pdf_url': None,
                 'source_url': page_url,
             })
@@ -280,15 +334,8 @@ class ClikCrawler:
 
     def _extract_control_no(self, onclick: str) -> Optional[str]:
         """onclick에서 제어번호 추출"""
-        patterns = [
-            r"goDetailSingleDB\(['\"]?(\w+)['\"]?",
-            r"goDetail\(['\"]?(\w+)['\"]?",
-            r"viewPdfExec\(['\"]?(\w+)['\"]?",
-            r"['\"](\w{10,})['\"]",  # 긴 영숫자 ID
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, onclick)
+        for pattern in CONTROL_NO_PATTERNS:
+            match = pattern.search(onclick)
             if match:
                 return match.group(1)
         return None
@@ -296,7 +343,7 @@ class ClikCrawler:
     def _extract_pdf_url(self, onclick: str) -> Optional[str]:
         """onclick에서 PDF URL 추출"""
         # viewPdfExec('제어번호','PROC',...)
-        match = re.search(r"viewPdfExec\(['\"](\w+)['\"]", onclick)
+        match = PDF_EXEC_PATTERN.search(onclick)
         if match:
             control_no = match.group(1)
             return f"{self.BASE_URL}/potal/search/pdfViewer.do?ctrlNo={control_no}&collection=PROC"
@@ -381,36 +428,12 @@ class ClikCrawler:
             for result in results:
                 # 상세 정보 가져오기 (선택적)
                 detail = {}
-                if fetch_details and result.get('control_no'):
+                if fetch_details and self._should_fetch_detail(result):
                     time.sleep(self.request_delay)
                     detail = self.fetch_detail(result['control_no']) or {}
 
-                # 의회 유형 판단
-                council_name_str = result.get('council_name', '')
-                council_type = 'metropolitan' if any(x in council_name_str for x in ['특별시', '광역시', '특별자치시', '도의회']) else 'basic'
-
-                # 지역 추출
-                region_str = detail.get('region', '')
-                if not region_str:
-                    for r_code, r_name in self.REGION_CODES.items():
-                        if r_name[:2] in council_name_str:
-                            region_str = r_name
-                            break
-
-                minutes = ClikMeetingMinutes(
-                    control_no=result.get('control_no', ''),
-                    council_name=council_name_str,
-                    council_type=council_type,
-                    region=region_str,
-                    title=result.get('title', ''),
-                    pub_date=result.get('pub_date', ''),
-                    assembly_committee=detail.get('assembly_committee', ''),
-                    meeting_type=detail.get('meeting_type', ''),
-                    content_preview=detail.get('content_preview', ''),
-                    pdf_url=result.get('pdf_url'),
-                    source_url=result.get('source_url', ''),
-                    scraped_at=datetime.now().isoformat(),
-                )
+                minutes = self._build_minutes(result, detail)
+                self._register(minutes)
 
                 total_count += 1
                 logger.info(f"  [{total_count}] {minutes.council_name} | {minutes.title[:40]}...")
@@ -420,6 +443,141 @@ class ClikCrawler:
 
         logger.info(f"=== 크롤링 완료: 총 {total_count}건 ===")
 
+    def _build_minutes(self, result: Dict[str, Any], detail: Dict[str, Any]) -> ClikMeetingMinutes:
+        """검색 결과 + 상세 정보 → ClikMeetingMinutes"""
+        # 의회 유형 판단
+        council_name_str = result.get('council_name', '')
+        council_type = 'metropolitan' if any(x in council_name_str for x in ['특별시', '광역시', '특별자치시', '도의회']) else 'basic'
+
+        # 지역 추출
+        region_str = detail.get('region', '')
+        if not region_str:
+            for r_code, r_name in self.REGION_CODES.items():
+                if r_name[:2] in council_name_str:
+                    region_str = r_name
+                    break
+
+        return ClikMeetingMinutes(
+            control_no=result.get('control_no', ''),
+            council_name=council_name_str,
+            council_type=council_type,
+            region=region_str,
+            title=result.get('title', ''),
+            pub_date=result.get('pub_date', ''),
+            assembly_committee=detail.get('assembly_committee', ''),
+            meeting_type=detail.get('meeting_type', ''),
+            content_preview=detail.get('content_preview', ''),
+            pdf_url=result.get('pdf_url'),
+            source_url=result.get('source_url', ''),
+            scraped_at=datetime.now().isoformat(),
+        )
+
+    def _should_fetch_detail(self, result: Dict[str, Any]) -> bool:
+        """상세 요청 여부 - 의회 직접 크롤링으로 이미 수집된 회의면 생략"""
+        if not result.get('control_no'):
+            return False
+        if self.dedup_index is None:
+            return True
+        match = self.dedup_index.find(result, exclude_source="clik")
+        if match:
+            logger.debug(f"  {match.source}에 이미 있음 ({match.source_id}), 상세 생략: {result['control_no']}")
+            return False
+        return True
+
+    def _register(self, minutes: ClikMeetingMinutes):
+        """중복 색인에 등록"""
+        if self.dedup_index is not None and minutes.control_no:
+            self.dedup_index.add(minutes.to_dict(), "clik", minutes.control_no)
+
+    def _fetch_search_page(self, search_url: str) -> Optional[List[Dict[str, Any]]]:
+        """검색 페이지 1개 로드 + 파싱 (실패 시 None, 마지막 페이지면 빈 목록)"""
+        response = self._get(search_url)
+        if not response:
+            return None
+        soup = BeautifulSoup(response.content, 'html.parser')
+        return self.parse_search_results(soup, search_url)
+
+    def crawl_concurrent(self, max_pages: int = 5, keyword: str = "",
+                         region: str = None, council_name: str = None,
+                         year: int = None, fetch_details: bool = False,
+                         prefetch: int = None) -> Iterator[ClikMeetingMinutes]:
+        """CLIK 동시 크롤링 - 검색 페이지를 앞서 받아두고 상세 정보는 병렬로 조회
+
+        모든 요청은 공유 토큰 버킷(rate_limiter)을 통과하므로 동시성을 높여도
+        서버에 보내는 초당 요청 수는 requests_per_second를 넘지 않는다.
+        결과 순서는 순차 crawl()과 같다 (페이지 순 → 페이지 내 순).
+        """
+        prefetch = prefetch or self.max_workers
+        logger.info("=== CLIK 포털 동시 크롤링 시작 ===")
+        logger.info(
+            f"페이지 수: {max_pages}, 지역: {region or '전체'}, 의회: {council_name or '전체'}, "
+            f"작업자: {self.max_workers}, 초당 요청: {self.rate_limiter.rate}"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="clik")
+        pending_pages: deque = deque()   # (page, Future[검색 결과])
+        staged: deque = deque()          # (page, 검색 결과, [Future[상세] | None])
+        next_page = 1
+        exhausted = False
+        total_count = 0
+
+        def submit_pages():
+            nonlocal next_page
+            while not exhausted and next_page <= max_pages and len(pending_pages) < prefetch:
+                search_url = self.build_search_url(
+                    page=next_page, keyword=keyword, region=region,
+                    council_name=council_name, year_from=year, year_to=year,
+                )
+                pending_pages.append((next_page, executor.submit(self._fetch_search_page, search_url)))
+                next_page += 1
+
+        def stage_pages(block: bool):
+            """완료된 검색 페이지를 순서대로 꺼내 상세 조회를 예약"""
+            nonlocal exhausted
+            while pending_pages and (block or pending_pages[0][1].done()):
+                page, future = pending_pages.popleft()
+                results = future.result()
+                block = False
+                if results is None:
+                    logger.warning(f"페이지 {page} 로드 실패")
+                elif not results:
+                    logger.info(f"페이지 {page}: 결과 없음 (마지막 페이지)")
+                    exhausted = True
+                    for _, later in pending_pages:
+                        later.cancel()
+                    pending_pages.clear()
+                    return
+                else:
+                    logger.info(f"페이지 {page}: {len(results)}건 발견")
+                    details: List[Optional[Future]] = [
+                        executor.submit(self.fetch_detail, result['control_no'])
+                        if fetch_details and self._should_fetch_detail(result) else None
+                        for result in results
+                    ]
+                    staged.append((page, results, details))
+                submit_pages()
+
+        try:
+            submit_pages()
+            while pending_pages or staged:
+                stage_pages(block=not staged)
+                if not staged:
+                    continue
+
+                page, results, details = staged.popleft()
+                for result, detail_future in zip(results, details):
+                    detail = (detail_future.result() if detail_future else None) or {}
+                    minutes = self._build_minutes(result, detail)
+                    self._register(minutes)
+                    total_count += 1
+                    logger.info(f"  [{total_count}] {minutes.council_name} | {minutes.title[:40]}...")
+                    yield minutes
+                    stage_pages(block=False)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"=== 크롤링 완료: 총 {total_count}건 ===")
+
     def save_jsonl(self, results: List[ClikMeetingMinutes], prefix: str = "clik") -> Path:
         """JSONL 형식으로 저장"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -434,6 +592,173 @@ class ClikCrawler:
 
     def close(self):
         self.session.close()
+        if self.dedup_index is not None:
+            self.dedup_index.close()
+            self.dedup_index = None
+
+
+# ============================================================================
+# 연도 × 지역 분할 수집 (sweep)
+# ============================================================================
+@dataclass
+class SweepShard:
+    """sweep 작업 단위 (연도 1개 × 지역 1개, region=None이면 지역 구분 없음)"""
+    year: int
+    region: Optional[str]
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}_{self.region or 'all'}"
+
+
+def plan_sweep(year_from: int, year_to: int,
+               regions: Optional[List[Optional[str]]] = None) -> List[SweepShard]:
+    """큰 검색 요청을 연도 × 지역 shard로 분할 (최근 연도부터, regions=[None]이면 연도만 분할)"""
+    regions = regions or list(ClikCrawler.REGION_CODES.keys())
+    return [
+        SweepShard(year=year, region=region)
+        for year in range(year_to, year_from - 1, -1)
+        for region in regions
+    ]
+
+
+class ClikSweep:
+    """shard를 동시에 수집하고, shard별 진행 상태를 저장해 중단 후 이어서 실행
+
+    - shard 결과: <sweep_dir>/<연도>_<지역>.jsonl (페이지 단위로 추가 기록)
+    - 진행 상태: <sweep_dir>/state.json (shard별 다음 페이지/건수/상태)
+    - 병합: control_no 기준 중복 제거
+    """
+
+    def __init__(self, crawler: ClikCrawler, shards: List[SweepShard], sweep_dir: Path,
+                 max_pages: int = 200, keyword: str = "", council_name: Optional[str] = None,
+                 fetch_details: bool = False):
+        self.crawler = crawler
+        self.shards = shards
+        self.sweep_dir = Path(sweep_dir)
+        self.sweep_dir.mkdir(parents=True, exist_ok=True)
+        self.state_file = self.sweep_dir / "state.json"
+        self.max_pages = max_pages
+        self.keyword = keyword
+        self.council_name = council_name
+        self.fetch_details = fetch_details
+        self._lock = threading.Lock()
+        self.state: Dict[str, Dict[str, Any]] = {}
+
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        for shard in shards:
+            self.state.setdefault(shard.key, {"status": "pending", "next_page": 1, "count": 0})
+
+    def _save_state(self):
+        """진행 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def _update_state(self, shard: SweepShard, **changes):
+        with self._lock:
+            state = self.state[shard.key]
+            if changes.get("status") != "failed":
+                state.pop("error", None)
+            state.update(changes, updated_at=datetime.now().isoformat())
+            self._save_state()
+
+    def _is_finished(self, shard: SweepShard) -> bool:
+        state = self.state[shard.key]
+        return state["status"] == "done" or (
+            state["status"] == "truncated" and state["next_page"] > self.max_pages
+        )
+
+    def run_shard(self, shard: SweepShard) -> int:
+        """shard 1개 수집 - 저장된 다음 페이지부터 이어서 실행"""
+        state = self.state[shard.key]
+        page = state["next_page"]
+        count = state["count"]
+
+        with open(self.sweep_dir / f"{shard.key}.jsonl", 'a', encoding='utf-8') as f:
+            while page <= self.max_pages:
+                search_url = self.crawler.build_search_url(
+                    page=page, keyword=self.keyword, region=shard.region,
+                    council_name=self.council_name, year_from=shard.year, year_to=shard.year,
+                )
+                results = self.crawler._fetch_search_page(search_url)
+                if results is None:
+                    self._update_state(shard, status="failed", error=f"페이지 {page} 로드 실패")
+                    return count
+                if not results:
+                    self._update_state(shard, status="done", next_page=page, count=count)
+                    return count
+
+                for result in results:
+                    detail = {}
+                    if self.fetch_details and self.crawler._should_fetch_detail(result):
+                        detail = self.crawler.fetch_detail(result['control_no']) or {}
+                    minutes = self.crawler._build_minutes(result, detail)
+                    self.crawler._register(minutes)
+                    f.write(json.dumps(minutes.to_dict(), ensure_ascii=False) + '\n')
+                f.flush()
+
+                page += 1
+                count += len(results)
+                self._update_state(shard, status="running", next_page=page, count=count)
+
+        # 페이지 상한에 도달 - 결과가 더 남아 있을 수 있음
+        logger.warning(f"[{shard.key}] 최대 {self.max_pages}페이지 도달 - 결과가 잘렸을 수 있습니다.")
+        self._update_state(shard, status="truncated", next_page=page, count=count)
+        return count
+
+    def run(self, max_workers: int = 4) -> Dict[str, int]:
+        """미완료 shard를 동시에 수집"""
+        todo = [shard for shard in self.shards if not self._is_finished(shard)]
+        logger.info(f"=== CLIK sweep 시작: shard {len(self.shards)}개 중 {len(todo)}개 남음 ===")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sweep") as executor:
+            futures = {executor.submit(self.run_shard, shard): shard for shard in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                shard = futures[future]
+                try:
+                    count = future.result()
+                except Exception as e:
+                    logger.exception(f"[{shard.key}] 오류: {e}")
+                    self._update_state(shard, status="failed", error=str(e))
+                    continue
+                logger.info(
+                    f"[{done}/{len(todo)}] {shard.key}: {count}건 ({self.state[shard.key]['status']})"
+                )
+
+        summary: Dict[str, int] = {}
+        for shard in self.shards:
+            status = self.state[shard.key]["status"]
+            summary[status] = summary.get(status, 0) + 1
+        return summary
+
+    def merge(self, output_file: Path) -> int:
+        """shard 결과를 control_no 기준으로 중복 제거하여 병합"""
+        seen: Set[str] = set()
+        written = 0
+        with open(output_file, 'w', encoding='utf-8') as out:
+            for shard in self.shards:
+                shard_file = self.sweep_dir / f"{shard.key}.jsonl"
+                if not shard_file.exists():
+                    continue
+                with open(shard_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # 중단 시점에 잘린 마지막 줄
+                        key = item.get('control_no') or (
+                            f"{item.get('council_name')}|{item.get('pub_date')}|{item.get('title')}"
+                        )
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        out.write(json.dumps(item, ensure_ascii=False) + '\n')
+                        written += 1
+        return written
 
 
 # ============================================================================
@@ -449,11 +774,12 @@ def main():
   python clik_crawler.py --region gyeonggi --max-pages 3
   python clik_crawler.py --council-name 수원시의회 --max-pages 2
   python clik_crawler.py --year 2024 --keyword 예산 --max-pages 10
+  python clik_crawler.py --sweep --year-from 2015 --year-to 2024 --workers 8
         """
     )
 
     parser.add_argument("--max-pages", "-m", type=int, default=5,
-                        help="최대 크롤링 페이지 수 (기본: 5)")
+                        help="최대 크롤링 페이지 수, --sweep에서는 shard당 상한 (기본: 5)")
     parser.add_argument("--region", "-r", type=str,
                         choices=list(ClikCrawler.REGION_CODES.keys()),
                         help="지역 필터 (예: gyeonggi, seoul)")
@@ -462,11 +788,23 @@ def main():
     parser.add_argument("--keyword", "-k", type=str, default="",
                         help="검색 키워드")
     parser.add_argument("--year", "-y", type=int,
-                        help="연도 필터 (예: 2024)")
+                        help="연도 필터 (예: 2024), --sweep에서는 --year-from/--year-to 대신 사용")
     parser.add_argument("--output", "-o", type=str, default="output",
                         help="출력 디렉토리 (기본: output)")
     parser.add_argument("--details", "-d", action="store_true",
                         help="상세 정보 가져오기 (느림)")
+    parser.add_argument("--sweep", action="store_true",
+                        help="연도 × 지역 shard로 나눠 동시 수집 (중단 후 재실행 시 이어서 수집)")
+    parser.add_argument("--year-from", type=int, default=2010,
+                        help="sweep 시작 연도 (기본: 2010)")
+    parser.add_argument("--year-to", type=int, default=datetime.now().year,
+                        help="sweep 종료 연도 (기본: 올해)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="동시 요청 작업자 수 (2 이상이면 동시 모드, 기본: 1)")
+    parser.add_argument("--rps", type=float, default=2.0,
+                        help="동시 모드 초당 최대 요청 수 (기본: 2.0)")
+    parser.add_argument("--dedup", type=str, default=None,
+                        help="중복 색인 DB 경로 - 의회 직접 크롤링에 있는 회의는 상세 생략 (예: output/dedup.db)")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="상세 로그 출력")
 
@@ -475,10 +813,17 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    crawler = ClikCrawler(output_dir=args.output)
+    crawler = ClikCrawler(output_dir=args.output, max_workers=args.workers,
+                          requests_per_second=args.rps)
+    if args.dedup:
+        crawler.dedup_index = DedupIndex(args.dedup)
+    crawl = crawler.crawl_concurrent if args.workers > 1 else crawler.crawl
+
+    if args.sweep:
+        return run_sweep(crawler, args)
 
     try:
-        results = list(crawler.crawl(
+        results = list(crawl(
             max_pages=args.max_pages,
             keyword=args.keyword,
             region=args.region,
@@ -523,5 +868,42 @@ def main():
         crawler.close()
 
 
+def run_sweep(crawler: ClikCrawler, args) -> int:
+    """--sweep 실행 (--max-pages는 shard당 페이지 상한)
+
+    --year는 --year-from/--year-to 대신 그 연도만, --council-name은 검색 조건에 추가
+    (지역을 함께 주지 않으면 의회 하나를 지역별로 나눌 필요가 없으므로 연도만 분할).
+    """
+    year_from, year_to = (args.year, args.year) if args.year else (args.year_from, args.year_to)
+    if args.region:
+        regions: Optional[List[Optional[str]]] = [args.region]
+    else:
+        regions = [None] if args.council_name else None
+    shards = plan_sweep(year_from, year_to, regions)
+    name = f"{year_from}_{year_to}_{args.region or 'all'}"
+    if args.council_name:
+        name += f"_{args.council_name.replace(' ', '_')}"
+    if args.keyword:
+        name += f"_{args.keyword}"
+    sweep = ClikSweep(
+        crawler, shards, crawler.output_dir / f"clik_sweep_{name}",
+        max_pages=args.max_pages, keyword=args.keyword, council_name=args.council_name,
+        fetch_details=args.details,
+    )
+
+    try:
+        summary = sweep.run(max_workers=args.workers)
+        output_file = crawler.output_dir / f"clik_sweep_{name}.jsonl"
+        total = sweep.merge(output_file)
+        logger.info(f"shard 상태: {summary}")
+        logger.info(f"병합 완료: {output_file} ({total}건, control_no 중복 제거)")
+        return 0 if summary.get("failed", 0) == 0 else 1
+    except KeyboardInterrupt:
+        logger.info("사용자 중단 - 같은 옵션으로 다시 실행하면 이어서 수집합니다.")
+        return 130
+    finally:
+        crawler.close()
+
+
 if __name__ == "__main__":
     sys.exit(main())
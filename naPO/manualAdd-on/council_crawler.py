@@ -16,17 +16,22 @@ Usage:
 import argparse
 import json
 import logging
+import math
+import os
+import pickle
 import re
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional, Dict, Any, List
+from typing import Iterator, Optional, Dict, Any, List, Set
 from urllib.parse import urljoin, parse_qs, urlparse
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 
 try:
@@ -35,6 +40,15 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+from kr_parsing import (
+    collapse_whitespace,
+    extract_date,
+    normalize_date,
+    parse_session_text,
+    session_number,
+    split_meeting_title,
+)
+
 # ============================================================================
 # 로깅 설정
 # ============================================================================
@@ -66,6 +80,8 @@ class MeetingMinutes:
     hwp_url: Optional[str] = None
     source_url: str = ""
     scraped_at: str = ""
+    content_text: str = ""  # 본문 전문 (keep_full_content=True일 때만 채움)
+    duplicate_of: str = ""  # 다른 출처에 이미 있어 상세를 생략한 경우 "출처:ID" (예: clik:123)
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -648,13 +664,23 @@ COUNCILS: Dict[str, Dict[str, Any]] = {
 # ============================================================================
 # YAML 설정 로더
 # ============================================================================
-def load_basic_councils_from_yaml() -> Dict[str, Dict[str, Any]]:
+BASIC_COUNCILS_YAML = Path(__file__).parent / "basic_councils.yaml"
+
+# 기초의회 지역 그룹 (basic_councils.yaml 최상위 키)
+REGION_GROUPS = [
+    'seoul_districts', 'busan_districts', 'daegu_districts', 'incheon_districts',
+    'gwangju_districts', 'daejeon_districts', 'ulsan_districts',
+    'gyeonggi_cities', 'gangwon_cities', 'chungbuk_cities', 'chungnam_cities',
+    'jeonbuk_cities', 'jeonnam_cities', 'gyeongbuk_cities', 'gyeongnam_cities'
+]
+
+
+def load_basic_councils_from_yaml(yaml_path: Path = BASIC_COUNCILS_YAML) -> Dict[str, Dict[str, Any]]:
     """basic_councils.yaml에서 226개 기초의회 설정 로드"""
     if not YAML_AVAILABLE:
         logger.warning("PyYAML이 설치되지 않아 기초의회 설정을 로드할 수 없습니다.")
         return {}
 
-    yaml_path = Path(__file__).parent / "basic_councils.yaml"
     if not yaml_path.exists():
         logger.warning(f"기초의회 설정 파일이 없습니다: {yaml_path}")
         return {}
@@ -672,14 +698,7 @@ def load_basic_councils_from_yaml() -> Dict[str, Dict[str, Any]]:
     detail_selectors = common.get('detail_selectors', {})
 
     # 각 지역 그룹 처리
-    region_groups = [
-        'seoul_districts', 'busan_districts', 'daegu_districts', 'incheon_districts',
-        'gwangju_districts', 'daejeon_districts', 'ulsan_districts',
-        'gyeonggi_cities', 'gangwon_cities', 'chungbuk_cities', 'chungnam_cities',
-        'jeonbuk_cities', 'jeonnam_cities', 'gyeongbuk_cities', 'gyeongnam_cities'
-    ]
-
-    for group in region_groups:
+    for group in REGION_GROUPS:
         if group not in data:
             continue
 
@@ -692,6 +711,7 @@ def load_basic_councils_from_yaml() -> Dict[str, Dict[str, Any]]:
                 'list_url': council.get('list_url', '/record/list.do'),
                 'detail_url': council.get('detail_url', '/record/view.do'),
                 'type': 'basic',
+                'region_group': group,
                 'crawler_type': council.get('crawler_type', 'default'),
                 'selectors': council.get('selectors', default_selectors),
                 'detail_selectors': council.get('detail_selectors', detail_selectors),
@@ -704,13 +724,247 @@ def load_basic_councils_from_yaml() -> Dict[str, Dict[str, Any]]:
     return councils
 
 
+# ============================================================================
+# 의회 설정 레지스트리
+# ============================================================================
+REQUIRED_CONFIG_KEYS = ("name", "admin_code", "base_url", "list_url")
+
+
+@dataclass
+class CompiledCouncil:
+    """셀렉터와 URL 템플릿을 미리 컴파일한 의회 설정"""
+    code: str
+    list_url: str                 # 1페이지 목록 URL (절대경로)
+    page_prefix: str              # list_url + "?pageNo=" 형태의 페이지 URL 접두어
+    detail_prefix: str            # detail_url + "?uid=" 형태의 상세 URL 접두어
+    selectors: Dict[str, Any] = field(default_factory=dict)         # 이름 -> SoupSieve
+    detail_selectors: Dict[str, Any] = field(default_factory=dict)  # 이름 -> SoupSieve
+
+    def page_url(self, page: int) -> str:
+        return self.list_url if page <= 1 else f"{self.page_prefix}{page}"
+
+    def detail_url(self, meeting_id: str) -> str:
+        return f"{self.detail_prefix}{meeting_id}"
+
+
+def _compile_selectors(selectors: Dict[str, str], code: str) -> Dict[str, Any]:
+    compiled = {}
+    for name, selector in (selectors or {}).items():
+        try:
+            compiled[name] = soupsieve.compile(selector)
+        except Exception as e:  # soupsieve.SelectorSyntaxError 등
+            logger.warning(f"[{code}] 셀렉터 컴파일 실패 ({name}={selector!r}): {e}")
+    return compiled
+
+
+def compile_council(code: str, config: Dict[str, Any]) -> CompiledCouncil:
+    """의회 설정의 셀렉터/URL 템플릿 컴파일"""
+    base_url = config["base_url"]
+    list_url = urljoin(base_url, config["list_url"])
+    page_param = config.get("pagination", {}).get("param", "pageNo")
+    detail_url = urljoin(base_url, config.get("detail_url", "/view.do"))
+    id_param = config.get("id_param", "uid")
+
+    return CompiledCouncil(
+        code=code,
+        list_url=list_url,
+        page_prefix=f"{list_url}{'&' if '?' in list_url else '?'}{page_param}=",
+        detail_prefix=f"{detail_url}{'&' if '?' in detail_url else '?'}{id_param}=",
+        selectors=_compile_selectors(config.get("selectors", {}), code),
+        detail_selectors=_compile_selectors(config.get("detail_selectors", {}), code),
+    )
+
+
+class CouncilRegistry:
+    """광역(COUNCILS) + 기초(YAML) 의회 설정 레지스트리
+
+    - YAML은 한 번만 파싱하고 파일 mtime/크기가 바뀔 때만 다시 로드
+    - 파싱 결과를 pickle 캐시로 저장해 다음 프로세스 기동 시 YAML 파싱 생략
+    - 코드/지역 그룹/crawler_type별 인덱스 조회, 컴파일된 설정 memoize
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, yaml_path: Path = BASIC_COUNCILS_YAML, cache_path: Optional[Path] = None,
+                 use_cache: bool = True):
+        self.yaml_path = Path(yaml_path)
+        self.cache_path = cache_path or self.yaml_path.with_name(f".{self.yaml_path.stem}.cache.pkl")
+        self.use_cache = use_cache
+        self._lock = threading.Lock()
+        self._source_key = None
+        self._councils: Dict[str, Dict[str, Any]] = {}
+        self._by_group: Dict[str, List[str]] = {}
+        self._by_crawler_type: Dict[str, List[str]] = {}
+        self._compiled: Dict[str, CompiledCouncil] = {}
+
+    def _stat_key(self):
+        try:
+            st = self.yaml_path.stat()
+        except OSError:
+            return None
+        return (self.CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+    def _load_basic(self, source_key) -> Dict[str, Dict[str, Any]]:
+        """pickle 캐시가 유효하면 사용, 아니면 YAML 파싱 후 캐시 갱신"""
+        if self.use_cache and source_key and self.cache_path.exists():
+            try:
+                with open(self.cache_path, "rb") as f:
+                    cached = pickle.load(f)
+                if cached.get("key") == source_key:
+                    return cached["councils"]
+            except Exception as e:
+                logger.debug(f"설정 캐시 무시: {e}")
+
+        basic = load_basic_councils_from_yaml(self.yaml_path)
+        if self.use_cache and source_key and basic:
+            try:
+                tmp_path = self.cache_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    pickle.dump({"key": source_key, "councils": basic}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                logger.debug(f"설정 캐시 저장 실패: {e}")
+        return basic
+
+    @staticmethod
+    def _validate(code: str, config: Dict[str, Any]) -> bool:
+        missing = [key for key in REQUIRED_CONFIG_KEYS if not config.get(key)]
+        if missing:
+            logger.warning(f"[{code}] 필수 설정 누락으로 제외: {', '.join(missing)}")
+            return False
+        return True
+
+    def _ensure_loaded(self):
+        source_key = self._stat_key()
+        if self._councils and source_key == self._source_key:
+            return
+
+        with self._lock:
+            if self._councils and source_key == self._source_key:
+                return
+
+            councils: Dict[str, Dict[str, Any]] = {}
+            for code, config in COUNCILS.items():
+                councils[code] = dict(config, region_group="metropolitan")
+            councils.update(self._load_basic(source_key))
+            councils = {code: cfg for code, cfg in councils.items() if self._validate(code, cfg)}
+
+            by_group: Dict[str, List[str]] = {}
+            by_crawler_type: Dict[str, List[str]] = {}
+            for code, config in councils.items():
+                by_group.setdefault(config.get("region_group", ""), []).append(code)
+                by_crawler_type.setdefault(config.get("crawler_type", "default"), []).append(code)
+
+            self._councils = councils
+            self._by_group = by_group
+            self._by_crawler_type = by_crawler_type
+            self._compiled = {}
+            self._source_key = source_key
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """전체 설정 (얕은 복사본)"""
+        self._ensure_loaded()
+        return dict(self._councils)
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        self._ensure_loaded()
+        return self._councils.get(code)
+
+    def codes_by_region_group(self, group: str) -> List[str]:
+        self._ensure_loaded()
+        return list(self._by_group.get(group, []))
+
+    def codes_by_crawler_type(self, crawler_type: str) -> List[str]:
+        self._ensure_loaded()
+        return list(self._by_crawler_type.get(crawler_type, []))
+
+    def compiled(self, code: str) -> Optional[CompiledCouncil]:
+        """컴파일된 설정 (최초 요청 시 컴파일 후 memoize)"""
+        self._ensure_loaded()
+        compiled = self._compiled.get(code)
+        if compiled is None and code in self._councils:
+            compiled = compile_council(code, self._councils[code])
+            self._compiled[code] = compiled
+        return compiled
+
+
+_registry = CouncilRegistry(use_cache=os.environ.get("COUNCIL_REGISTRY_CACHE", "1") != "0")
+
+
+def get_registry() -> CouncilRegistry:
+    """프로세스 전역 의회 설정 레지스트리"""
+    return _registry
+
+
 def get_all_councils() -> Dict[str, Dict[str, Any]]:
     """광역의회 + 기초의회 전체 설정 반환"""
-    all_councils = COUNCILS.copy()
-    basic_councils = load_basic_councils_from_yaml()
-    all_councils.update(basic_councils)
-    return all_councils
+    return _registry.all()
+
 
+# ============================================================================
+# 크롤링 계측
+# ============================================================================
+@dataclass
+class RequestMetric:
+    """HTTP 요청 1건의 계측값 (초 단위)"""
+    url: str
+    status: int          # 최종 HTTP 상태 (응답 없이 실패하면 0)
+    ttfb: float          # 요청 시작 ~ 응답 헤더 수신 (DNS/연결 포함)
+    download: float      # 본문 수신 시간
+    total: float         # 재시도/백오프 포함 전체 소요 시간
+    bytes: int
+    retries: int
+    ok: bool
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수 (빈 목록이면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class CrawlTelemetry:
+    """의회 단위 요청/파싱 계측 수집기"""
+
+    def __init__(self):
+        self.requests: List[RequestMetric] = []
+        self.parse_times: Dict[str, List[float]] = {"list": [], "detail": []}
+        self.deduplicated = 0  # 다른 출처에 있어 상세 요청을 생략한 회의 수
+
+    def record_request(self, metric: RequestMetric):
+        self.requests.append(metric)
+
+    def record_parse(self, kind: str, seconds: float):
+        self.parse_times.setdefault(kind, []).append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """백분위수 집계 (batch 리포트/상태 파일용)"""
+        ttfb = [m.ttfb for m in self.requests if m.ok]
+        download = [m.download for m in self.requests if m.ok]
+        total = [m.total for m in self.requests]
+        status_counts: Dict[str, int] = {}
+        for m in self.requests:
+            status_counts[str(m.status)] = status_counts.get(str(m.status), 0) + 1
+
+        summary = {
+            "requests": len(self.requests),
+            "failures": sum(1 for m in self.requests if not m.ok),
+            "retries": sum(m.retries for m in self.requests),
+            "bytes": sum(m.bytes for m in self.requests),
+            "status_counts": status_counts,
+            "deduplicated": self.deduplicated,
+        }
+        for name, values in (("ttfb", ttfb), ("download", download), ("total", total)):
+            summary[f"{name}_p50"] = round(percentile(values, 50), 4)
+            summary[f"{name}_p90"] = round(percentile(values, 90), 4)
+            summary[f"{name}_p99"] = round(percentile(values, 99), 4)
+        for kind, values in self.parse_times.items():
+            summary[f"parse_{kind}_p50"] = round(percentile(values, 50), 4)
+            summary[f"parse_{kind}_p90"] = round(percentile(values, 90), 4)
+        return summary
 
 # ============================================================================
 # HTTP 클라이언트
@@ -726,28 +980,177 @@ class HttpClient:
         "Connection": "keep-alive",
     }
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 telemetry: Optional[CrawlTelemetry] = None):
         self.session = requests.Session()
         self.session.headers.update(self.DEFAULT_HEADERS)
         self.timeout = timeout
         self.max_retries = max_retries
+        self.telemetry = telemetry
     
     def get(self, url: str, **kwargs) -> Optional[requests.Response]:
-        """GET 요청 with 재시도"""
+        """GET 요청 with 재시도 (telemetry가 있으면 TTFB/다운로드 시간 등 기록)"""
+        caller_streams = kwargs.pop("stream", False)
+        started = time.perf_counter()
+        status = 0
+        ttfb = download = 0.0
+        
         for attempt in range(self.max_retries):
+            response = None
             try:
-                response = self.session.get(url, timeout=self.timeout, **kwargs)
+                attempt_start = time.perf_counter()
+                response = self.session.get(url, timeout=self.timeout, stream=True, **kwargs)
+                ttfb = time.perf_counter() - attempt_start
+                status = response.status_code
                 response.raise_for_status()
+                if not caller_streams:
+                    body_start = time.perf_counter()
+                    response.content  # 본문 수신 (download 시간 측정)
+                    download = time.perf_counter() - body_start
+                self._record(url, status, ttfb, download, started, attempt, ok=True,
+                             size=0 if caller_streams else len(response.content))
                 return response
             except requests.RequestException as e:
+                if response is not None:
+                    response.close()
                 logger.warning(f"요청 실패 (시도 {attempt + 1}/{self.max_retries}): {url} - {e}")
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)  # 지수 백오프
+        
+        self._record(url, status, ttfb, download, started, self.max_retries - 1, ok=False, size=0)
         return None
     
+    def _record(self, url: str, status: int, ttfb: float, download: float,
+                started: float, retries: int, ok: bool, size: int):
+        if self.telemetry is None:
+            return
+        self.telemetry.record_request(RequestMetric(
+            url=url,
+            status=status,
+            ttfb=ttfb,
+            download=download,
+            total=time.perf_counter() - started,
+            bytes=size,
+            retries=retries,
+            ok=ok,
+        ))
+    
     def close(self):
         self.session.close()
 
+# ============================================================================
+# 추출 플랜 (의회별로 성공한 대체 셀렉터 학습)
+# ============================================================================
+LIST_TABLE_FALLBACKS = [
+    "table.list tbody tr",
+    "table.tbl_list tbody tr",
+    "table tbody tr",
+    ".list_table tbody tr",
+    "#list tbody tr",
+]
+CONTENT_FALLBACKS = [".view_content", ".record_content", ".content", "#content", "article"]
+LINK_FALLBACK = "a[href]"
+
+COMPILED_FALLBACKS = {
+    selector: soupsieve.compile(selector)
+    for selector in LIST_TABLE_FALLBACKS + CONTENT_FALLBACKS + [LINK_FALLBACK]
+}
+
+GO_VIEW_PATTERN = re.compile(r"goView\(['\"]?(\d+)['\"]?\)")
+
+ONCLICK_ID_PATTERNS = [
+    re.compile(r"fn_view\(['\"]?(\d+)['\"]?\)"),
+    GO_VIEW_PATTERN,
+    re.compile(r"view\(['\"]?(\d+)['\"]?\)"),
+    re.compile(r"['\"](\d{4,})['\"]"),
+    re.compile(r"\((\d+)\)"),
+]
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 의회별 크롤러의 href/onclick 패턴
+SCH_SN_PATTERN = re.compile(r"schSn=(\d+)")
+LOCATION_HREF_PATTERN = re.compile(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]")
+UID_PATTERN = re.compile(r"uid=(\d+)")
+AJAX_MTR_LIST_PATTERN = re.compile(r"ajaxMtrList\(['\"]?(\d+)['\"]?\)")
+FN_POPUP_PAGE_PATTERN = re.compile(r"fn_popup_page\((\d+),(\d+),(\d+),(\d+),'([^']*)','([^']*)'")
+
+
+class ExtractionPlanStore:
+    """의회별 추출 플랜 저장소
+
+    설정 셀렉터가 실패했을 때 성공한 대체 셀렉터를 의회 코드별로 기억해 두고,
+    다음 페이지와 다음 실행에서는 대체 셀렉터 중 그 경로를 먼저 시도한다
+    (설정 셀렉터는 항상 먼저 시도). 플랜이 바뀔 때만 JSON 파일로 저장한다
+    (path=None이면 메모리에만 유지).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._plans: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._plans = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"추출 플랜 로드 실패: {e}")
+
+    def get(self, council_code: str) -> Dict[str, Any]:
+        """의회 플랜 (호출자가 읽기 전용으로 참조)"""
+        with self._lock:
+            return self._plans.setdefault(council_code, {})
+
+    def learn(self, council_code: str, kind: str, value: Any):
+        with self._lock:
+            plan = self._plans.setdefault(council_code, {})
+            if plan.get(kind) == value:
+                return
+            plan[kind] = value
+        logger.debug(f"[{council_code}] 추출 플랜 학습: {kind}={value!r}")
+        self.save()
+
+    def forget(self, council_code: str, kind: str):
+        with self._lock:
+            if self._plans.get(council_code, {}).pop(kind, None) is None:
+                return
+        self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            payload = json.dumps(self._plans, ensure_ascii=False, indent=2, sort_keys=True)
+        try:
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"추출 플랜 저장 실패: {e}")
+
+
+_plan_store = ExtractionPlanStore(
+    Path(__file__).parent / ".extraction_plans.json"
+    if os.environ.get("COUNCIL_PLAN_CACHE", "1") != "0" else None
+)
+
+
+def _ordered_candidates(config_selector, fallbacks: List[str], winner: Optional[str]) -> List[tuple]:
+    """(플랜 키, 컴파일된 셀렉터) 목록 - 설정 셀렉터가 항상 먼저, 학습된 경로는 대체 셀렉터 중 맨 앞"""
+    ordered = sorted(fallbacks, key=lambda selector: selector != winner)
+    candidates = [("config", config_selector)] if config_selector is not None else []
+    candidates.extend((selector, COMPILED_FALLBACKS[selector]) for selector in ordered)
+    return candidates
+
+
+def _record_winner(council_code: str, kind: str, key: str, plan: Dict[str, Any]):
+    """성공한 경로 기록 - 설정 셀렉터가 다시 맞으면 학습된 대체 경로는 잊음"""
+    if key == "config":
+        if kind in plan:
+            _plan_store.forget(council_code, kind)
+    elif plan.get(kind) != key:
+        _plan_store.learn(council_code, kind, key)
+
 # ============================================================================
 # 기본 크롤러 클래스
 # ============================================================================
@@ -757,23 +1160,25 @@ class BaseCouncilCrawler(ABC):
     def __init__(self, council_code: str, config: Dict[str, Any]):
         self.council_code = council_code
         self.config = config
-        self.client = HttpClient()
+        self.telemetry = CrawlTelemetry()
+        self.client = HttpClient(telemetry=self.telemetry)
         self.base_url = config["base_url"]
         self.selectors = config.get("selectors", {})
         self.detail_selectors = config.get("detail_selectors", {})
         self.request_delay = config.get("request_delay", 2.0)
+        # 레지스트리 설정이면 memoize된 컴파일 결과 재사용
+        if _registry.get(council_code) is config:
+            self.compiled = _registry.compiled(council_code)
+        else:
+            self.compiled = compile_council(council_code, config)
+        self.plan = _plan_store.get(council_code)
+        self.keep_full_content = False  # True면 본문 전문을 MeetingMinutes.content_text에 보관
+        self.current_page = 0  # crawl() 진행 중인 목록 페이지 (체크포인트용)
+        self.dedup_index = None  # DedupIndex - 다른 출처(CLIK)에 이미 있는 회의는 상세 요청 생략
     
     def get_list_url(self, page: int = 1) -> str:
         """목록 페이지 URL 생성"""
-        list_path = self.config["list_url"]
-        url = urljoin(self.base_url, list_path)
-        
-        if page > 1:
-            param = self.config.get("pagination", {}).get("param", "pageNo")
-            separator = "&" if "?" in url else "?"
-            url = f"{url}{separator}{param}={page}"
-        
-        return url
+        return self.compiled.page_url(page)
     
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """페이지 가져오기"""
@@ -786,24 +1191,18 @@ class BaseCouncilCrawler(ABC):
         """목록 페이지 파싱 - 회의 목록 추출"""
         meetings = []
         
-        # 테이블 행 찾기
-        table_selector = self.selectors.get("list_table", "table tbody tr")
-        rows = soup.select(table_selector)
-        
-        if not rows:
-            # 대체 셀렉터 시도
-            alt_selectors = [
-                "table.list tbody tr",
-                "table.tbl_list tbody tr",
-                "table tbody tr",
-                ".list_table tbody tr",
-                "#list tbody tr",
-            ]
-            for alt_sel in alt_selectors:
-                rows = soup.select(alt_sel)
-                if rows:
-                    logger.debug(f"대체 셀렉터 사용: {alt_sel}")
-                    break
+        # 테이블 행 찾기 (설정 셀렉터 → 대체 셀렉터, 학습된 셀렉터 우선)
+        rows = []
+        candidates = _ordered_candidates(
+            self.compiled.selectors.get("list_table"), LIST_TABLE_FALLBACKS, self.plan.get("list_table")
+        )
+        for key, selector in candidates:
+            rows = selector.select(soup)
+            if rows:
+                if key != "config":
+                    logger.debug(f"대체 셀렉터 사용: {key}")
+                _record_winner(self.council_code, "list_table", key, self.plan)
+                break
         
         for row in rows:
             try:
@@ -818,13 +1217,13 @@ class BaseCouncilCrawler(ABC):
     
     def _extract_meeting_info(self, row: BeautifulSoup, page_url: str) -> Optional[Dict[str, Any]]:
         """테이블 행에서 회의 정보 추출"""
-        # 링크 찾기
-        link_selector = self.selectors.get("meeting_link", "a")
-        link_elem = row.select_one(link_selector)
+        # 링크 찾기 (설정 셀렉터 → 대체)
+        link_selector = self.compiled.selectors.get("meeting_link")
+        link_elem = link_selector.select_one(row) if link_selector else row.select_one("a")
         
         if not link_elem:
             # 대체: 행 내 아무 링크나 찾기
-            link_elem = row.select_one("a[href]")
+            link_elem = COMPILED_FALLBACKS[LINK_FALLBACK].select_one(row)
         
         if not link_elem:
             return None
@@ -885,18 +1284,12 @@ class BaseCouncilCrawler(ABC):
         return None
     
     def _extract_id_from_onclick(self, onclick: str) -> Optional[str]:
-        """onclick 속성에서 ID 추출"""
-        # 다양한 패턴 시도
-        patterns = [
-            r"fn_view\(['\"]?(\d+)['\"]?\)",
-            r"goView\(['\"]?(\d+)['\"]?\)",
-            r"view\(['\"]?(\d+)['\"]?\)",
-            r"['\"](\d{4,})['\"]",
-            r"\((\d+)\)",
-        ]
+        """onclick 속성에서 ID 추출 (구체적인 패턴부터 - 순서를 학습으로 바꾸지 않음)"""
+        if not onclick:
+            return None
         
-        for pattern in patterns:
-            match = re.search(pattern, onclick)
+        for pattern in ONCLICK_ID_PATTERNS:
+            match = pattern.search(onclick)
             if match:
                 return match.group(1)
         
@@ -904,35 +1297,36 @@ class BaseCouncilCrawler(ABC):
     
     def _build_detail_url(self, meeting_id: str) -> str:
         """상세 페이지 URL 생성"""
-        detail_path = self.config.get("detail_url", "/view.do")
-        id_param = self.config.get("id_param", "uid")
-        url = urljoin(self.base_url, detail_path)
-        separator = "&" if "?" in url else "?"
-        return f"{url}{separator}{id_param}={meeting_id}"
+        return self.compiled.detail_url(meeting_id)
     
     def parse_detail_page(self, soup: BeautifulSoup, url: str, meta: Dict[str, Any]) -> MeetingMinutes:
         """상세 페이지 파싱"""
         # 제목 추출
-        title_selector = self.detail_selectors.get("title", ".view_title, h3.title")
-        title_elem = soup.select_one(title_selector)
+        title_selector = self.compiled.detail_selectors.get("title")
+        title_elem = title_selector.select_one(soup) if title_selector else soup.select_one(".view_title, h3.title")
         title = title_elem.get_text(strip=True) if title_elem else meta.get("title", "")
         
-        # 본문 추출
-        content_selector = self.detail_selectors.get("content", ".view_content")
-        content_elem = soup.select_one(content_selector)
-        
-        if not content_elem:
-            # 대체 셀렉터
-            for alt_sel in [".view_content", ".record_content", ".content", "#content", "article"]:
-                content_elem = soup.select_one(alt_sel)
-                if content_elem:
-                    break
+        # 본문 추출 (설정 셀렉터 → 대체 셀렉터, 학습된 셀렉터 우선)
+        content_elem = None
+        candidates = _ordered_candidates(
+            self.compiled.detail_selectors.get("content"), CONTENT_FALLBACKS, self.plan.get("content")
+        )
+        for key, selector in candidates:
+            content_elem = selector.select_one(soup)
+            if content_elem:
+                _record_winner(self.council_code, "content", key, self.plan)
+                break
         
         content_text = ""
         if content_elem:
             content_text = content_elem.get_text(separator=" ", strip=True)
-            content_text = re.sub(r"\s+", " ", content_text)
+            content_text = WHITESPACE_PATTERN.sub(" ", content_text)
         
+        return self._build_minutes(meta, url, title, content_text)
+    
+    def _build_minutes(self, meta: Dict[str, Any], url: str, title: str,
+                       content_text: str = "", duplicate_of: str = "") -> MeetingMinutes:
+        """목록 메타 + (있으면) 상세 본문으로 MeetingMinutes 생성"""
         # 파일 다운로드 URL 생성
         pdf_url = None
         hwp_url = None
@@ -963,34 +1357,29 @@ class BaseCouncilCrawler(ABC):
             hwp_url=hwp_url,
             source_url=url,
             scraped_at=datetime.now().isoformat(),
+            content_text=content_text if self.keep_full_content else "",
+            duplicate_of=duplicate_of,
         )
     
     def _normalize_date(self, date_str: str) -> str:
-        """날짜 문자열 정규화 (YYYY-MM-DD)"""
-        if not date_str:
-            return ""
-        
-        # 다양한 형식 처리
-        date_str = re.sub(r"[년월]", "-", date_str)
-        date_str = re.sub(r"[일\s].*", "", date_str)
-        date_str = re.sub(r"\.", "-", date_str)
-        date_str = date_str.strip()
-        
-        # YYYY-MM-DD 형식 검증
-        if re.match(r"^\d{4}-\d{1,2}-\d{1,2}$", date_str):
-            parts = date_str.split("-")
-            return f"{parts[0]}-{int(parts[1]):02d}-{int(parts[2]):02d}"
-        
-        return date_str
+        """날짜 문자열 정규화 (YYYY-MM-DD) - kr_parsing.normalize_date (memoize)"""
+        return normalize_date(date_str)
     
-    def crawl(self, max_pages: int = 5, start_page: int = 1) -> Iterator[MeetingMinutes]:
-        """크롤링 실행"""
+    def crawl(self, max_pages: int = 5, start_page: int = 1,
+              skip_urls: Optional[Set[str]] = None) -> Iterator[MeetingMinutes]:
+        """크롤링 실행
+
+        skip_urls에 포함된 상세 URL은 이미 수집된 것으로 보고 상세 요청을 생략한다
+        (중단된 페이지부터 재개할 때 사용).
+        """
         logger.info(f"=== {self.config['name']} 크롤링 시작 ===")
         logger.info(f"페이지 범위: {start_page} ~ {start_page + max_pages - 1}")
         
         total_count = 0
+        skip_urls = skip_urls or set()
         
         for page in range(start_page, start_page + max_pages):
+            self.current_page = page
             list_url = self.get_list_url(page)
             logger.info(f"[페이지 {page}] {list_url}")
             
@@ -1001,7 +1390,9 @@ class BaseCouncilCrawler(ABC):
                 continue
             
             # 목록 파싱
+            parse_start = time.perf_counter()
             meetings = self.parse_list_page(soup, list_url)
+            self.telemetry.record_parse("list", time.perf_counter() - parse_start)
             
             if not meetings:
                 logger.info(f"페이지 {page}: 회의록 없음 (마지막 페이지)")
@@ -1012,6 +1403,24 @@ class BaseCouncilCrawler(ABC):
             # 각 회의록 상세 페이지 크롤링
             for meeting_info in meetings:
                 detail_url = meeting_info["detail_url"]
+                if detail_url in skip_urls:
+                    logger.debug(f"  이미 수집됨, 건너뜀: {detail_url}")
+                    continue
+                
+                if self.dedup_index is not None:
+                    match = self.dedup_index.find(
+                        {**meeting_info, "council_name": self.config["name"]}, exclude_source="council"
+                    )
+                    if match:
+                        # 상세 요청만 생략하고 목록 정보로 기록 (수집 건수/재개 기준에 포함)
+                        logger.debug(f"  {match.source}에 이미 있음 ({match.source_id}), 상세 생략: {detail_url}")
+                        self.telemetry.deduplicated += 1
+                        total_count += 1
+                        yield self._build_minutes(
+                            meeting_info, detail_url, meeting_info.get("title", ""),
+                            duplicate_of=f"{match.source}:{match.source_id}",
+                        )
+                        continue
                 
                 time.sleep(self.request_delay)  # Rate limiting
                 
@@ -1021,7 +1430,14 @@ class BaseCouncilCrawler(ABC):
                     continue
                 
                 try:
+                    parse_start = time.perf_counter()
                     minutes = self.parse_detail_page(detail_soup, detail_url, meeting_info)
+                    self.telemetry.record_parse("detail", time.perf_counter() - parse_start)
+                    if self.dedup_index is not None:
+                        self.dedup_index.add(
+                            minutes.to_dict(), "council",
+                            f"{self.council_code}:{minutes.meeting_id or minutes.source_url}",
+                        )
                     total_count += 1
                     logger.info(f"  [{total_count}] {minutes.meeting_date} | {minutes.title[:30]}...")
                     yield minutes
@@ -1181,15 +1597,14 @@ class AnsanCouncilCrawler(BaseCouncilCrawler):
             detail_url = urljoin(page_url, href)
 
             # schSn 파라미터 추출
-            match = re.search(r'schSn=(\d+)', href)
+            match = SCH_SN_PATTERN.search(href)
             meeting_id = match.group(1) if match else ""
 
             title = link.get_text(strip=True)
 
             # 제목에서 정보 추출
             # 예: "[임시]제300회 본회의 제3차"
-            session_match = re.search(r'제(\d+)회', title)
-            session_num = f"제{session_match.group(1)}회" if session_match else ""
+            session_num = session_number(title)
 
             meetings.append({
                 "detail_url": detail_url,
@@ -1228,7 +1643,7 @@ class HwaseongCouncilCrawler(BaseCouncilCrawler):
 
             # onclick에서 회의록 ID 추출
             if onclick:
-                match = re.search(r"goView\(['\"]?(\d+)['\"]?\)", onclick)
+                match = GO_VIEW_PATTERN.search(onclick)
                 if match:
                     meeting_id = match.group(1)
                     detail_url = f"{self.base_url}/cnts/mnt/mntsView.php?bbsCd=mnt&bbsSubCd=mnt01&schSn={meeting_id}"
@@ -1278,7 +1693,7 @@ class DobongCouncilCrawler(BaseCouncilCrawler):
                 detail_url = urljoin(page_url, href)
             elif onclick:
                 # onclick에서 URL 추출
-                match = re.search(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]", onclick)
+                match = LOCATION_HREF_PATTERN.search(onclick)
                 if match:
                     detail_url = urljoin(page_url, match.group(1))
                 else:
@@ -1355,7 +1770,7 @@ class SeongdongCouncilCrawler(BaseCouncilCrawler):
             if href and not href.startswith("#"):
                 detail_url = urljoin(page_url, href)
             elif onclick:
-                match = re.search(r"goView\(['\"]?(\d+)['\"]?\)", onclick)
+                match = GO_VIEW_PATTERN.search(onclick)
                 if match:
                     detail_url = f"{self.base_url}/cast/minutes/view?ntime={match.group(1)}"
                 else:
@@ -1398,7 +1813,7 @@ class YangcheonCouncilCrawler(BaseCouncilCrawler):
             if href and not href.startswith("javascript"):
                 detail_url = urljoin(page_url, href)
             elif onclick:
-                match = re.search(r"uid=(\d+)", onclick)
+                match = UID_PATTERN.search(onclick)
                 if match:
                     detail_url = f"{self.base_url}/record/main?uid={match.group(1)}"
                 else:
@@ -1495,7 +1910,7 @@ class CouncilBookCrawler(BaseCouncilCrawler):
                 detail_url = urljoin(page_url, href)
             elif onclick:
                 # ajaxMtrList('3181') 형태 파싱
-                match = re.search(r"ajaxMtrList\(['\"]?(\d+)['\"]?\)", onclick)
+                match = AJAX_MTR_LIST_PATTERN.search(onclick)
                 if match:
                     detail_url = f"{self.base_url}/source/pages/simple/simple.do?mints_sn={match.group(1)}"
                 else:
@@ -1582,7 +1997,7 @@ class BusanjinCrawler(BaseCouncilCrawler):
 
             onclick = link.get("onclick", "")
             # fn_popup_page(353,2,5,1,'임시회','안전복지위원회',0,1,'','')
-            match = re.search(r"fn_popup_page\((\d+),(\d+),(\d+),(\d+),'([^']*)','([^']*)'", onclick)
+            match = FN_POPUP_PAGE_PATTERN.search(onclick)
             if match:
                 session = match.group(1)
                 committee = match.group(6)
@@ -1629,27 +2044,18 @@ class JeonbukMetroCrawler(BaseCouncilCrawler):
                 text = link.get_text(strip=True)
 
             # 텍스트에서 정보 파싱: "제12대 422회 [임시회] 2차"
-            import re
-            assembly_match = re.search(r'제(\d+)대', text)
-            session_match = re.search(r'(\d+)회', text)
-            type_match = re.search(r'\[(정례회|임시회)\]', text)
-            order_match = re.search(r'(\d+)차', text)
-
-            assembly_num = f"제{assembly_match.group(1)}대" if assembly_match else ""
-            session_num = f"{session_match.group(1)}회" if session_match else ""
-            meeting_type = type_match.group(1) if type_match else ""
-            order = f"{order_match.group(1)}차" if order_match else ""
-
-            title = f"{session_num} {meeting_type} {order}".strip()
+            info = parse_session_text(text)
+
+            title = f"{info.session} {info.meeting_type} {info.order}".strip()
             if not title:
                 title = text[:50]
 
             meetings.append({
                 "detail_url": detail_url,
                 "meeting_id": self._extract_id_from_url(detail_url) or "",
-                "assembly_num": assembly_num,
-                "session_num": session_num,
-                "meeting_type": meeting_type,
+                "assembly_num": info.assembly,
+                "session_num": info.session,
+                "meeting_type": info.meeting_type,
                 "committee": "",
                 "meeting_date": "",
                 "title": title,
@@ -1683,30 +2089,19 @@ class JeonnamMetroCrawler(BaseCouncilCrawler):
                 text = link.get_text(strip=True)
 
             # 텍스트에서 정보 파싱
-            import re
-            assembly_match = re.search(r'제(\d+)대', text)
-            session_match = re.search(r'(\d+)회', text)
-            type_match = re.search(r'\[(정례회|임시회)\]', text)
-            order_match = re.search(r'(\d+)차', text)
-            committee_match = re.search(r'(본회의|위원회)', text)
-
-            assembly_num = f"제{assembly_match.group(1)}대" if assembly_match else ""
-            session_num = f"{session_match.group(1)}회" if session_match else ""
-            meeting_type = type_match.group(1) if type_match else ""
-            order = f"{order_match.group(1)}차" if order_match else ""
-            committee = committee_match.group(1) if committee_match else ""
-
-            title = f"{session_num} {meeting_type} {order} {committee}".strip()
+            info = parse_session_text(text)
+
+            title = f"{info.session} {info.meeting_type} {info.order} {info.committee}".strip()
             if not title:
                 title = text[:50]
 
             meetings.append({
                 "detail_url": detail_url,
                 "meeting_id": self._extract_id_from_url(detail_url) or "",
-                "assembly_num": assembly_num,
-                "session_num": session_num,
-                "meeting_type": meeting_type,
-                "committee": committee,
+                "assembly_num": info.assembly,
+                "session_num": info.session,
+                "meeting_type": info.meeting_type,
+                "committee": info.committee,
                 "meeting_date": "",
                 "title": title,
             })
@@ -1720,7 +2115,6 @@ class IncheonMetroCrawler(BaseCouncilCrawler):
     def parse_list_page(self, soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
         """인천광역시의회 목록 파싱"""
         meetings = []
-        import re
 
         # 테이블 행 선택
         rows = soup.select("table.general_board tbody tr")
@@ -1736,7 +2130,7 @@ class IncheonMetroCrawler(BaseCouncilCrawler):
 
             # 제목 (TD3) - 줄바꿈과 공백 정리
             title_text = cells[2].get_text(separator=' ', strip=True)
-            title_text = re.sub(r'\s+', ' ', title_text)  # 다중 공백을 단일 공백으로
+            title_text = collapse_whitespace(title_text)  # 다중 공백을 단일 공백으로
 
             # 회의록 링크 (TD4)
             link = cells[3].select_one("a")
@@ -1751,18 +2145,11 @@ class IncheonMetroCrawler(BaseCouncilCrawler):
                 detail_url = urljoin(page_url, detail_url)
 
             # 날짜 (TD5) - "2025.11.20 Thu요일" 형식
-            date_text = cells[4].get_text(strip=True)
-            date_match = re.search(r'(\d{4})\.(\d{2})\.(\d{2})', date_text)
-            meeting_date = f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}" if date_match else ""
+            meeting_date = extract_date(cells[4].get_text(strip=True))
 
             # 제목에서 회차와 위원회 분리
             # "제2차 의회운영위원회" -> meeting_type: "제2차", committee: "의회운영위원회"
-            type_match = re.search(r'(제?\d+차)', title_text)
-            meeting_type = type_match.group(1) if type_match else ""
-
-            # 위원회 이름 추출
-            committee_match = re.search(r'(본회의|[\w]+위원회)', title_text)
-            committee = committee_match.group(1) if committee_match else ""
+            meeting_type, committee = split_meeting_title(title_text)
 
             meetings.append({
                 "detail_url": detail_url,
@@ -1818,60 +2205,56 @@ class BusanMetroCrawler(BaseCouncilCrawler):
 # ============================================================================
 # 크롤러 팩토리
 # ============================================================================
+# crawler_type 기반 크롤러 선택
+TYPE_CRAWLERS = {
+    "ems": EmsCouncilCrawler,
+    "assembly": AssemblyCouncilCrawler,
+    "ansan": AnsanCouncilCrawler,
+    "hwaseong": HwaseongCouncilCrawler,
+    "goyang": BaseCouncilCrawler,
+    "dobong": DobongCouncilCrawler,
+    "seodaemun": SeodaemunCouncilCrawler,
+    "seongdong": SeongdongCouncilCrawler,
+    "yangcheon": YangcheonCouncilCrawler,
+    "geumcheon": GeumcheonCouncilCrawler,
+    # 부산 자치구의회
+    "councilbook": CouncilBookCrawler,
+    "busan_board": BusanBoardCrawler,
+    "busanjin": BusanjinCrawler,
+    "saha": BusanBoardCrawler,  # 사하구도 게시판 형식
+    "yeonje": BusanBoardCrawler,  # 연제구도 게시판 형식
+    "sasang": BusanBoardCrawler,  # 사상구도 게시판 형식
+    # 광역의회 전용
+    "busan_metro": BusanMetroCrawler,
+    "jeonbuk_metro": JeonbukMetroCrawler,
+    "jeonnam_metro": JeonnamMetroCrawler,
+    "incheon_metro": IncheonMetroCrawler,
+}
+
+# 의회별 특수 크롤러 매핑 (레거시)
+SPECIAL_CRAWLERS = {
+    "gyeonggi": GyeonggiCouncilCrawler,
+    "seoul": SeoulCouncilCrawler,
+}
+
+
+def crawler_class_for(council_code: str, config: Dict[str, Any]) -> type:
+    """크롤러 클래스 선택 - 우선순위: 의회코드 > crawler_type > 기본"""
+    if council_code in SPECIAL_CRAWLERS:
+        return SPECIAL_CRAWLERS[council_code]
+    return TYPE_CRAWLERS.get(config.get("crawler_type", "default"), BaseCouncilCrawler)
+
+
 def get_crawler(council_code: str) -> Optional[BaseCouncilCrawler]:
     """의회 코드로 크롤러 인스턴스 생성"""
-    all_councils = get_all_councils()
+    config = _registry.get(council_code)
 
-    if council_code not in all_councils:
+    if config is None:
         logger.error(f"지원하지 않는 의회 코드: {council_code}")
         logger.info("사용 가능한 의회 목록은 --list 옵션으로 확인하세요.")
         return None
 
-    config = all_councils[council_code]
-
-    # crawler_type 기반 크롤러 선택
-    crawler_type = config.get('crawler_type', 'default')
-
-    type_crawlers = {
-        "ems": EmsCouncilCrawler,
-        "assembly": AssemblyCouncilCrawler,
-        "ansan": AnsanCouncilCrawler,
-        "hwaseong": HwaseongCouncilCrawler,
-        "goyang": BaseCouncilCrawler,
-        "dobong": DobongCouncilCrawler,
-        "seodaemun": SeodaemunCouncilCrawler,
-        "seongdong": SeongdongCouncilCrawler,
-        "yangcheon": YangcheonCouncilCrawler,
-        "geumcheon": GeumcheonCouncilCrawler,
-        # 부산 자치구의회
-        "councilbook": CouncilBookCrawler,
-        "busan_board": BusanBoardCrawler,
-        "busanjin": BusanjinCrawler,
-        "saha": BusanBoardCrawler,  # 사하구도 게시판 형식
-        "yeonje": BusanBoardCrawler,  # 연제구도 게시판 형식
-        "sasang": BusanBoardCrawler,  # 사상구도 게시판 형식
-        # 광역의회 전용
-        "busan_metro": BusanMetroCrawler,
-        "jeonbuk_metro": JeonbukMetroCrawler,
-        "jeonnam_metro": JeonnamMetroCrawler,
-        "incheon_metro": IncheonMetroCrawler,
-    }
-
-    # 의회별 특수 크롤러 매핑 (레거시)
-    special_crawlers = {
-        "gyeonggi": GyeonggiCouncilCrawler,
-        "seoul": SeoulCouncilCrawler,
-    }
-
-    # 우선순위: 의회코드 > crawler_type > 기본
-    if council_code in special_crawlers:
-        crawler_class = special_crawlers[council_code]
-    elif crawler_type in type_crawlers:
-        crawler_class = type_crawlers[crawler_type]
-    else:
-        crawler_class = BaseCouncilCrawler
-
-    return crawler_class(council_code, config)
+    return crawler_class_for(council_code, config)(council_code, config)
 
 # ============================================================================
 # 결과 저장
@@ -1895,6 +2278,11 @@ class ResultSaver:
         
         return filename
     
+    def new_jsonl_path(self, council_code: str) -> Path:
+        """스트리밍 저장용 JSONL 파일 경로"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self.output_dir / f"{council_code}_{timestamp}.jsonl"
+
     def save_json(self, council_code: str, results: List[MeetingMinutes]) -> Path:
         """JSON 형식으로 저장"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1907,6 +2295,78 @@ class ResultSaver:
         
         return filename
 
+class JsonlSink:
+    """append-only JSONL 기록기 - 항목 단위로 쓰고 주기적으로 flush
+
+    재개 시 기존 파일의 잘린 마지막 줄(중단 시 flush 전 일부만 기록된 항목)은
+    잘라낸 뒤 이어쓴다 - 그대로 두면 다음 항목이 그 뒤에 붙어 둘 다 읽을 수 없게 된다.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 10):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.count = 0
+        self.truncate_partial_line(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, item: MeetingMinutes):
+        self._file.write(json.dumps(item.to_dict(), ensure_ascii=False) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    @staticmethod
+    def truncate_partial_line(path: Path, block_size: int = 64 * 1024):
+        """줄바꿈으로 끝나지 않는 마지막 줄을 마지막 줄바꿈 위치까지 잘라냄"""
+        try:
+            f = open(path, "r+b")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if not end:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            pos = end
+            while pos > 0:
+                start = max(0, pos - block_size)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b"\n")
+                if newline != -1:
+                    pos = start + newline + 1
+                    break
+                pos = start
+            logger.info(f"잘린 마지막 줄 제거: {path} ({end - pos}바이트)")
+            f.truncate(pos)
+
+    @staticmethod
+    def read_source_urls(path: Path) -> Set[str]:
+        """기존 JSONL에서 수집 완료된 source_url 집합 (마지막 줄이 잘렸으면 무시)"""
+        urls: Set[str] = set()
+        path = Path(path)
+        if not path.exists():
+            return urls
+        # 잘린 줄은 UTF-8 문자 중간에서 끊겼을 수 있으므로 디코딩 오류는 치환
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    urls.add(json.loads(line)["source_url"])
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return urls
+
 # ============================================================================
 # CLI 인터페이스
 # ============================================================================
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+CLIK ↔ 의회 직접 크롤링 간 회의록 중복 색인
+============================================
+- 같은 회의가 CLIK(control_no)과 개별 의회 크롤러(meeting_id) 양쪽에서 수집되는 문제 해결
+- 정규화 키 (의회, 날짜, 회기, 위원회, 차수) 완전 일치 조회 - dict O(1)
+- 키가 불완전할 때는 제목+미리보기 SimHash(64bit)를 16bit × 4 밴드 LSH로 후보 조회
+- 수집 중 상세 페이지 요청 전에 조회하여 이미 다른 출처에 있는 회의는 상세 요청 생략
+- 색인은 SQLite에 저장하고 시작 시 메모리로 적재
+
+Usage:
+    python dedup_index.py build output/*.jsonl
+    python dedup_index.py check output/clik_all_20250101.jsonl
+    python dedup_index.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEDUP_PATH = "output/dedup.db"
+
+SIMHASH_BITS = 64
+BAND_BITS = 16
+BANDS = SIMHASH_BITS // BAND_BITS
+
+
+# ============================================================================
+# 정규화
+# ============================================================================
+SESSION_PATTERN = re.compile(r"제\s*(\d+)\s*회")
+DEGREE_PATTERN = re.compile(r"제\s*(\d+)\s*차")
+COMMITTEE_PATTERN = re.compile(r"([가-힣]*(?:위원회|본회의))")
+DATE_PATTERN = re.compile(r"(\d{4})\D{0,3}(\d{1,2})\D{0,3}(\d{1,2})")
+NON_TEXT_PATTERN = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+
+def normalize_council(name: str) -> str:
+    """의회명 정규화 ("수원시 의회" → "수원시")"""
+    name = re.sub(r"\s+", "", name or "")
+    return name[:-2] if name.endswith("의회") else name
+
+
+def normalize_date(value: str) -> str:
+    """YYYY-MM-DD (인식 불가 시 빈 문자열)"""
+    match = DATE_PATTERN.search(value or "")
+    if not match:
+        return ""
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def _first_group(pattern: re.Pattern, *texts: str) -> str:
+    for text in texts:
+        match = pattern.search(text or "")
+        if match:
+            return match.group(1)
+    return ""
+
+
+def normalize_record(record: Dict[str, Any]) -> Dict[str, str]:
+    """출처별 필드명을 공통 필드로 정규화
+
+    의회 크롤러 목록(session_num/committee), MeetingMinutes(session_number/committee_name),
+    CLIK(pub_date/assembly_committee) 형식을 모두 받는다.
+    """
+    title = record.get("title") or ""
+    session = record.get("session_number") or record.get("session_num") or ""
+    committee = (
+        record.get("committee_name") or record.get("committee")
+        or record.get("assembly_committee") or ""
+    )
+    meeting_type = record.get("meeting_type") or ""
+    return {
+        "council": normalize_council(record.get("council_name", "")),
+        "date": normalize_date(record.get("meeting_date") or record.get("pub_date") or ""),
+        "session": _first_group(SESSION_PATTERN, session, title),
+        "committee": re.sub(r"\s+", "", _first_group(COMMITTEE_PATTERN, committee, meeting_type, title)),
+        "degree": _first_group(DEGREE_PATTERN, title),
+        "text": NON_TEXT_PATTERN.sub("", f"{title}{(record.get('content_preview') or '')[:300]}"),
+    }
+
+
+def meeting_key(fields: Dict[str, str]) -> Optional[str]:
+    """완전 일치용 키 - 의회/날짜/회기가 모두 있어야 생성"""
+    if not (fields["council"] and fields["date"] and fields["session"]):
+        return None
+    return "|".join((fields["council"], fields["date"], fields["session"], fields["committee"], fields["degree"]))
+
+
+def simhash(text: str, n: int = 3) -> int:
+    """문자 n-gram SimHash (64bit)"""
+    if not text:
+        return 0
+    grams = Counter(text[i:i + n] for i in range(max(1, len(text) - n + 1)))
+    weights = [0] * SIMHASH_BITS
+    for gram, count in grams.items():
+        value = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _bands(value: int) -> List[Tuple[int, int]]:
+    mask = (1 << BAND_BITS) - 1
+    return [(band, value >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64bit)에 저장하기 위한 변환"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+# ============================================================================
+# 중복 색인
+# ============================================================================
+@dataclass
+class DedupMatch:
+    """이미 색인된 회의"""
+    source: str
+    source_id: str
+    reason: str      # key / simhash
+    distance: int = 0
+
+
+class DedupIndex:
+    """정규화 키 + SimHash LSH 기반 회의록 중복 색인"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meetings (
+        id INTEGER PRIMARY KEY,
+        source TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        meeting_key TEXT,
+        council TEXT,
+        meeting_date TEXT,
+        simhash INTEGER,
+        UNIQUE (source, source_id)
+    );
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DEDUP_PATH,
+                 max_distance: int = 3, commit_every: int = 200):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self.max_distance = max_distance
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+
+        # 메모리 색인: 키 → {출처: 회의 번호}, (밴드, 값) → 회의 번호 목록
+        self._meetings: List[Tuple[str, str, str, str, int]] = []  # source, source_id, council, date, simhash
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._keys: Dict[str, Dict[str, int]] = {}
+        self._bands: Dict[Tuple[int, int], List[int]] = {}
+        self._load()
+
+    def _load(self):
+        rows = self.conn.execute(
+            "SELECT source, source_id, meeting_key, council, meeting_date, simhash FROM meetings ORDER BY id"
+        )
+        for source, source_id, key, council, meeting_date, signed_hash in rows:
+            self._index(source, source_id, key, council, meeting_date, signed_hash & ((1 << 64) - 1))
+
+    def _index(self, source: str, source_id: str, key: Optional[str],
+               council: str, meeting_date: str, hash_value: int):
+        idx = len(self._meetings)
+        self._meetings.append((source, source_id, council, meeting_date, hash_value))
+        self._ids[(source, source_id)] = idx
+        if key:
+            self._keys.setdefault(key, {}).setdefault(source, idx)
+        if hash_value:
+            for band in _bands(hash_value):
+                self._bands.setdefault(band, []).append(idx)
+
+    def find(self, record: Dict[str, Any], exclude_source: Optional[str] = None) -> Optional[DedupMatch]:
+        """같은 회의가 이미 색인되어 있으면 DedupMatch 반환
+
+        exclude_source를 주면 같은 출처의 항목은 무시한다 (다른 출처 중복만 확인).
+        """
+        fields = normalize_record(record)
+        key = meeting_key(fields)
+
+        with self._lock:
+            for source, idx in self._keys.get(key, {}).items() if key else ():
+                if source != exclude_source:
+                    return DedupMatch(source=source, source_id=self._meetings[idx][1], reason="key")
+
+            hash_value = simhash(fields["text"])
+            if not hash_value or not fields["council"]:
+                return None
+
+            best: Optional[Tuple[int, int]] = None
+            for band in _bands(hash_value):
+                for idx in self._bands.get(band, ()):
+                    source, _, council, meeting_date, other = self._meetings[idx]
+                    if source == exclude_source or council != fields["council"]:
+                        continue
+                    if fields["date"] and meeting_date and meeting_date != fields["date"]:
+                        continue
+                    distance = bin(hash_value ^ other).count("1")
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, idx)
+
+        if best is None:
+            return None
+        source, source_id, *_ = self._meetings[best[1]]
+        return DedupMatch(source=source, source_id=source_id, reason="simhash", distance=best[0])
+
+    def add(self, record: Dict[str, Any], source: str, source_id: str) -> bool:
+        """회의 색인 (이미 있는 (source, source_id)면 False)"""
+        fields = normalize_record(record)
+        key = meeting_key(fields)
+        hash_value = simhash(fields["text"])
+
+        with self._lock:
+            if (source, source_id) in self._ids:
+                return False
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meetings (source, source_id, meeting_key, council, meeting_date, simhash) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (source, source_id, key, fields["council"], fields["date"], _to_signed(hash_value)),
+            )
+            self._index(source, source_id, key, fields["council"], fields["date"], hash_value)
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.conn.commit()
+                self._uncommitted = 0
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "meetings": len(self._meetings),
+                "sources": dict(Counter(meeting[0] for meeting in self._meetings)),
+                "keys": len(self._keys),
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+def record_source(record: Dict[str, Any]) -> Tuple[str, str]:
+    """JSONL 레코드의 (출처, 출처 내 ID)"""
+    if "control_no" in record:
+        return "clik", record.get("control_no") or record.get("source_url", "")
+    meeting_id = record.get("meeting_id") or record.get("source_url", "")
+    return "council", f"{record.get('council_code', '')}:{meeting_id}"
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def _iter_jsonl(paths: Iterable[str]) -> Iterable[Dict[str, Any]]:
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="CLIK ↔ 의회 크롤링 회의록 중복 색인")
+    parser.add_argument("--db", type=str, default=DEFAULT_DEDUP_PATH, help=f"색인 DB 경로 (기본: {DEFAULT_DEDUP_PATH})")
+    parser.add_argument("--max-distance", type=int, default=3, help="SimHash 허용 해밍 거리 (기본: 3)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = sub.add_parser("build", help="JSONL 결과 파일을 색인에 추가")
+    build_parser.add_argument("files", nargs="+")
+
+    check_parser = sub.add_parser("check", help="JSONL 결과 파일에서 다른 출처와 중복되는 회의 확인")
+    check_parser.add_argument("files", nargs="+")
+
+    sub.add_parser("stats", help="색인 통계")
+
+    args = parser.parse_args()
+    index = DedupIndex(args.db, max_distance=args.max_distance)
+
+    try:
+        if args.command == "build":
+            added = duplicates = 0
+            for record in _iter_jsonl(args.files):
+                source, source_id = record_source(record)
+                if index.find(record, exclude_source=source):
+                    duplicates += 1
+                added += index.add(record, source, source_id)
+            logger.info(f"색인 추가 {added}건 (다른 출처와 중복 {duplicates}건)")
+        elif args.command == "check":
+            total = duplicates = 0
+            for record in _iter_jsonl(args.files):
+                total += 1
+                source, source_id = record_source(record)
+                match = index.find(record, exclude_source=source)
+                if match:
+                    duplicates += 1
+                    print(f"{source}:{source_id} = {match.source}:{match.source_id} ({match.reason}, {match.distance})")
+            logger.info(f"{total}건 중 {duplicates}건 중복")
+        elif args.command == "stats":
+            print(json.dumps(index.stats(), ensure_ascii=False, indent=2))
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
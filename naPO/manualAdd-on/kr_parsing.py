@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+회의록 목록용 한국어 날짜/회기 파싱
+==================================
+- 의회 크롤러와 CLIK 크롤러가 공유하는 미리 컴파일된 정규식
+- 목록 페이지마다 같은 날짜/회기 문자열이 반복되므로 결과를 lru_cache로 memoize
+- 반환값은 모두 불변 (str, NamedTuple) - 캐시된 값을 호출자가 바꿀 수 없음
+
+Usage:
+    from kr_parsing import normalize_date, extract_date, parse_session_text
+
+    normalize_date("2025.03.05")                    # '2025-03-05'
+    extract_date("2025.11.20 Thu요일")               # '2025-11-20'
+    parse_session_text("제12대 422회 [임시회] 2차")   # SessionInfo(assembly='제12대', ...)
+
+    python kr_parsing.py --bench                    # 기존 행 단위 파싱 대비 속도 측정
+"""
+
+import argparse
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import NamedTuple
+
+CACHE_SIZE = 4096
+
+
+# ============================================================================
+# 날짜
+# ============================================================================
+# "2025-03-05", "2025.3.5", "2025/03/05", "2025년 3월 5일", "2025. 3. 5." 등
+DATE_PATTERN = re.compile(r"(?<!\d)(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})(?!\d)")
+
+# 인식 못 한 문자열 정리 규칙 (기존 BaseCouncilCrawler._normalize_date와 동일)
+_YEAR_MONTH_MARK = re.compile(r"[년월]")
+_DAY_SUFFIX = re.compile(r"[일\s].*")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_date(value: str) -> str:
+    """날짜 문자열 정규화 (YYYY-MM-DD)
+
+    문자열 앞부분이 날짜면 YYYY-MM-DD, 아니면 기존 규칙(년/월 → '-', '일'/공백 이후 제거,
+    '.' → '-')으로 정리한 문자열을 그대로 돌려준다.
+    """
+    if not value:
+        return ""
+    match = DATE_PATTERN.match(value.strip())
+    if match:
+        year, month, day = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+    value = _DAY_SUFFIX.sub("", _YEAR_MONTH_MARK.sub("-", value))
+    return value.replace(".", "-").strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_date(text: str) -> str:
+    """문자열 안의 첫 날짜 (YYYY-MM-DD, 없으면 빈 문자열)"""
+    match = DATE_PATTERN.search(text or "")
+    if not match:
+        return ""
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+# ============================================================================
+# 대수/회기/차수/위원회
+# ============================================================================
+ASSEMBLY_PATTERN = re.compile(r"제(\d+)대")
+SESSION_PATTERN = re.compile(r"제(\d+)회")
+SESSION_NUMBER_PATTERN = re.compile(r"(\d+)회")
+SESSION_KIND_PATTERN = re.compile(r"\[(정례회|임시회)\]")
+ORDER_PATTERN = re.compile(r"(\d+)차")
+ORDER_LABEL_PATTERN = re.compile(r"(제?\d+차)")
+COMMITTEE_KIND_PATTERN = re.compile(r"(본회의|위원회)")
+COMMITTEE_NAME_PATTERN = re.compile(r"(본회의|\w+위원회)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class SessionInfo(NamedTuple):
+    """회의 목록 문구에서 뽑은 회의 정보 (없는 항목은 빈 문자열)"""
+    assembly: str       # 제12대
+    session: str        # 422회
+    meeting_type: str   # 정례회 / 임시회
+    order: str          # 2차
+    committee: str      # 본회의 / 위원회
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_session_text(text: str) -> SessionInfo:
+    """"제12대 422회 [임시회] 2차 본회의" 형태 문구 파싱 (전북/전남 목록)"""
+    assembly = ASSEMBLY_PATTERN.search(text)
+    session = SESSION_NUMBER_PATTERN.search(text)
+    kind = SESSION_KIND_PATTERN.search(text)
+    order = ORDER_PATTERN.search(text)
+    committee = COMMITTEE_KIND_PATTERN.search(text)
+    return SessionInfo(
+        assembly=f"제{assembly.group(1)}대" if assembly else "",
+        session=f"{session.group(1)}회" if session else "",
+        meeting_type=kind.group(1) if kind else "",
+        order=f"{order.group(1)}차" if order else "",
+        committee=committee.group(1) if committee else "",
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def session_number(text: str) -> str:
+    """"[임시]제300회 본회의 제3차" → "제300회" (없으면 빈 문자열)"""
+    match = SESSION_PATTERN.search(text)
+    return f"제{match.group(1)}회" if match else ""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_meeting_title(title: str) -> tuple:
+    """"제2차 의회운영위원회" → ("제2차", "의회운영위원회") - (차수, 위원회명)"""
+    order = ORDER_LABEL_PATTERN.search(title)
+    committee = COMMITTEE_NAME_PATTERN.search(title)
+    return (order.group(1) if order else "", committee.group(1) if committee else "")
+
+
+def collapse_whitespace(text: str) -> str:
+    """연속 공백을 공백 하나로"""
+    return WHITESPACE_PATTERN.sub(" ", text)
+
+
+def cache_info() -> dict:
+    """함수별 lru_cache 적중 통계"""
+    return {
+        func.__name__: func.cache_info()._asdict()
+        for func in (normalize_date, extract_date, parse_session_text, session_number, split_meeting_title)
+    }
+
+
+# ============================================================================
+# 마이크로벤치마크
+# ============================================================================
+def _legacy_normalize_date(date_str: str) -> str:
+    """기존 BaseCouncilCrawler._normalize_date (비교용)"""
+    if not date_str:
+        return ""
+    date_str = re.sub(r"[년월]", "-", date_str)
+    date_str = re.sub(r"[일\s].*", "", date_str)
+    date_str = re.sub(r"\.", "-", date_str)
+    date_str = date_str.strip()
+    if re.match(r"^\d{4}-\d{1,2}-\d{1,2}$", date_str):
+        parts = date_str.split("-")
+        return f"{parts[0]}-{int(parts[1]):02d}-{int(parts[2]):02d}"
+    return date_str
+
+
+def _legacy_session_text(text: str) -> tuple:
+    """기존 전북/전남 목록 행 파싱 (비교용)"""
+    import re
+    assembly_match = re.search(r'제(\d+)대', text)
+    session_match = re.search(r'(\d+)회', text)
+    type_match = re.search(r'\[(정례회|임시회)\]', text)
+    order_match = re.search(r'(\d+)차', text)
+    committee_match = re.search(r'(본회의|위원회)', text)
+    return (
+        f"제{assembly_match.group(1)}대" if assembly_match else "",
+        f"{session_match.group(1)}회" if session_match else "",
+        type_match.group(1) if type_match else "",
+        f"{order_match.group(1)}차" if order_match else "",
+        committee_match.group(1) if committee_match else "",
+    )
+
+
+def _sample_rows(count: int) -> list:
+    """목록 페이지 행과 비슷한 분포 - 회기/날짜가 여러 행에 반복"""
+    date_forms = ("{y}-{m:02d}-{d:02d}", "{y}.{m:02d}.{d:02d}", "{y}.{m}.{d}", "{y}-{m:02d}-{d:02d} (수)",
+                  "{y}.{m:02d}.{d:02d} Thu요일")
+    rows = []
+    for i in range(count):
+        y, m, d = 2020 + i % 6, i % 12 + 1, (i // 12) % 28 + 1
+        date = date_forms[i % len(date_forms)].format(y=y, m=m, d=d)
+        session = f"제{10 + i % 3}대 {300 + (i // 40) % 150}회 [{'정례회' if i % 7 == 0 else '임시회'}] {i % 5 + 1}차 " \
+                  f"{'본회의' if i % 3 == 0 else '행정자치위원회'}"
+        rows.append((date, session))
+    return rows
+
+
+def run_bench(rows: int, repeat: int):
+    samples = _sample_rows(rows)
+    checks = [(date, _legacy_normalize_date(date), normalize_date(date)) for date, _ in samples]
+    mismatches = [(date, old, new) for date, old, new in checks if old != new]
+    if mismatches:
+        print(f"경고: 기존 결과와 다른 날짜 {len(mismatches)}건 (예: {mismatches[0]})")
+    for _, text in samples:
+        if tuple(parse_session_text(text)) != _legacy_session_text(text):
+            print(f"경고: 기존 결과와 다른 회기 파싱: {text}")
+            break
+
+    def measure(func, column):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for row in samples:
+                func(row[column])
+            best = min(best, time.perf_counter() - start)
+        return best / len(samples) * 1e6  # µs/row
+
+    for func in (normalize_date, parse_session_text):
+        func.cache_clear()
+    results = [
+        ("날짜 정규화", measure(_legacy_normalize_date, 0),
+         measure(normalize_date.__wrapped__, 0), measure(normalize_date, 0)),
+        ("회기 문구 파싱", measure(_legacy_session_text, 1),
+         measure(parse_session_text.__wrapped__, 1), measure(parse_session_text, 1)),
+    ]
+    print(f"{rows:,}행 x {repeat}회 (최선값)")
+    for name, old, compiled, cached in results:
+        print(f"  {name:<10} 기존 {old:6.2f} µs/행 → 컴파일 {compiled:6.2f} µs/행 ({old / compiled:4.1f}배)"
+              f" → 캐시 {cached:6.2f} µs/행 ({old / cached:4.1f}배)")
+    print(f"  캐시: {cache_info()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한국어 날짜/회기 파싱 마이크로벤치마크")
+    parser.add_argument("--bench", action="store_true", help="기존 행 단위 파싱 대비 속도 측정")
+    parser.add_argument("--rows", type=int, default=20000, help="측정 행 수 (기본: 20000)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본: 5)")
+    args = parser.parse_args()
+
+    if not args.bench:
+        parser.print_help()
+        return 0
+    run_bench(args.rows, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+지방의회 회의록 첨부파일 본문 추출기
+====================================
+- attachment_downloader.py로 받은 PDF/HWP에서 본문 텍스트 추출
+- 프로세스 풀로 CPU 코어 수만큼 병렬 추출
+- 추출 결과는 파일 해시(SHA-256) 기준으로 캐시 (<cache>/<해시 앞 2자리>/<해시>.txt.gz)
+- 추출한 전문으로 minutes_store 본문과 FTS 색인 갱신
+- 처리량(pages/sec) 보고
+
+선택 의존성:
+    pip install PyMuPDF   # PDF
+    pip install olefile   # HWP 5.x
+
+Usage:
+    python minutes_extractor.py --db output/minutes.db
+    python minutes_extractor.py --workers 8 --limit 1000
+"""
+
+import argparse
+import gzip
+import itertools
+import logging
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from minutes_store import DEFAULT_DB_PATH, MAX_EXTRACTION_ATTEMPTS, MinutesStore
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover - 선택 의존성
+    fitz = None
+
+try:
+    import olefile
+except ImportError:  # pragma: no cover - 선택 의존성
+    olefile = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "output/text_cache"
+
+
+# ============================================================================
+# 추출 결과 모델
+# ============================================================================
+@dataclass
+class ExtractionResult:
+    """첨부파일 1건 추출 결과"""
+    doc_key: str
+    sha256: str
+    kind: str
+    text: str = ""
+    pages: int = 0
+    seconds: float = 0.0
+    cached: bool = False
+    error: str = ""
+
+
+# ============================================================================
+# PDF
+# ============================================================================
+def extract_pdf(path: str) -> Tuple[str, int]:
+    """PyMuPDF로 PDF 본문 추출 - (텍스트, 페이지 수)"""
+    if fitz is None:
+        raise RuntimeError("PyMuPDF가 설치되어 있지 않습니다 (pip install PyMuPDF)")
+    with fitz.open(path) as doc:
+        pages = [page.get_text("text") for page in doc]
+    return "\n".join(pages), len(pages)
+
+
+# ============================================================================
+# HWP 5.x (OLE 복합 문서)
+# ============================================================================
+HWPTAG_PARA_TEXT = 67
+
+# 1 WCHAR 크기 제어 문자 (나머지 0x00~0x1F 제어 문자는 8 WCHAR를 차지)
+HWP_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+
+
+def _hwp_para_text(data: bytes) -> str:
+    """HWPTAG_PARA_TEXT 레코드를 문자열로 변환 (인라인/확장 제어 문자 제거)"""
+    chars: List[str] = []
+    i, end = 0, len(data) - 1
+    while i < end:
+        code = data[i] | (data[i + 1] << 8)
+        if code >= 32:
+            chars.append(chr(code))
+            i += 2
+        elif code in HWP_CHAR_CONTROLS:
+            if code in (10, 13):
+                chars.append("\n")
+            i += 2
+        else:
+            if code == 9:
+                chars.append("\t")
+            i += 16
+    return "".join(chars)
+
+
+def _hwp_records(data: bytes):
+    """BodyText 섹션 레코드 순회 - (tag_id, payload)"""
+    pos, size = 0, len(data)
+    while pos + 4 <= size:
+        header = struct.unpack_from("<I", data, pos)[0]
+        pos += 4
+        tag_id = header & 0x3FF
+        length = (header >> 20) & 0xFFF
+        if length == 0xFFF:
+            length = struct.unpack_from("<I", data, pos)[0]
+            pos += 4
+        yield tag_id, data[pos:pos + length]
+        pos += length
+
+
+def extract_hwp(path: str) -> Tuple[str, int]:
+    """olefile로 HWP 5.x 본문 추출 - (텍스트, 섹션 수)
+
+    HWP는 페이지 정보가 본문 스트림에 없으므로 섹션 수를 페이지 수 대신 사용한다.
+    """
+    if olefile is None:
+        raise RuntimeError("olefile이 설치되어 있지 않습니다 (pip install olefile)")
+
+    with olefile.OleFileIO(path) as ole:
+        header = ole.openstream("FileHeader").read()
+        compressed = bool(header[36] & 0x01)
+
+        sections = sorted(
+            (entry for entry in ole.listdir() if len(entry) == 2 and entry[0] == "BodyText"),
+            key=lambda entry: int(entry[1].replace("Section", "") or 0),
+        )
+        paragraphs: List[str] = []
+        for entry in sections:
+            data = ole.openstream(entry).read()
+            if compressed:
+                data = zlib.decompress(data, -15)
+            for tag_id, payload in _hwp_records(data):
+                if tag_id == HWPTAG_PARA_TEXT:
+                    paragraphs.append(_hwp_para_text(payload).rstrip())
+
+    return "\n".join(paragraphs), len(sections)
+
+
+EXTRACTORS = {
+    "pdf": extract_pdf,
+    "hwp": extract_hwp,
+}
+
+
+# ============================================================================
+# 해시 기반 텍스트 캐시
+# ============================================================================
+def cache_path(cache_dir: str, sha256: str) -> Path:
+    return Path(cache_dir) / sha256[:2] / f"{sha256}.txt.gz"
+
+
+def read_cache(cache_dir: str, sha256: str) -> Optional[Tuple[str, int]]:
+    """캐시된 추출 결과 - 첫 줄은 페이지 수, 나머지는 본문"""
+    path = cache_path(cache_dir, sha256)
+    if not path.exists():
+        return None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        pages = int(f.readline().strip() or 0)
+        return f.read(), pages
+
+
+def write_cache(cache_dir: str, sha256: str, text: str, pages: int):
+    path = cache_path(cache_dir, sha256)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        f.write(f"{pages}\n")
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def extract_job(job: Dict[str, str], cache_dir: str) -> ExtractionResult:
+    """작업자 프로세스에서 실행 - 캐시 확인 후 추출"""
+    result = ExtractionResult(doc_key=job["doc_key"], sha256=job["sha256"], kind=job["kind"])
+    start = time.perf_counter()
+    try:
+        cached = read_cache(cache_dir, job["sha256"])
+        if cached:
+            result.text, result.pages = cached
+            result.cached = True
+        else:
+            result.text, result.pages = EXTRACTORS[job["kind"]](job["path"])
+            write_cache(cache_dir, job["sha256"], result.text, result.pages)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+# ============================================================================
+# 배치 추출기
+# ============================================================================
+class MinutesExtractor:
+    """프로세스 풀 기반 첨부파일 본문 추출 + 저장소 반영"""
+
+    def __init__(self, store: MinutesStore, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_workers: Optional[int] = None, batch_size: int = 50):
+        self.store = store
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def run(self, jobs: List[Dict[str, str]]) -> Dict[str, float]:
+        """추출 실행 - 결과(실패 포함)는 batch_size 단위로 저장소에 반영
+
+        동시에 제출하는 작업은 작업자 수의 2배로 제한한다 (결과마다 전문을 담고 있으므로
+        전체를 한 번에 제출하면 메모리가 실행 전체 텍스트 양만큼 커짐).
+        pages는 실제로 추출한 페이지, cached_pages는 캐시에서 읽은 페이지 (처리량은 pages 기준).
+        """
+        stats = {"documents": 0, "cached": 0, "failed": 0, "pages": 0, "cached_pages": 0, "seconds": 0.0}
+        pending: List[Dict[str, object]] = []
+        failures: List[Dict[str, str]] = []
+        start = time.perf_counter()
+        max_in_flight = self.max_workers * 2
+        remaining = iter(jobs)
+        done = 0
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight: Set[Future] = set()
+            while True:
+                for job in itertools.islice(remaining, max_in_flight - len(in_flight)):
+                    in_flight.add(executor.submit(extract_job, job, self.cache_dir))
+                if not in_flight:
+                    break
+
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done += 1
+                    result = future.result()
+                    if result.error:
+                        stats["failed"] += 1
+                        logger.warning(f"추출 실패: {result.doc_key} ({result.kind}) - {result.error}")
+                        failures.append({
+                            "doc_key": result.doc_key, "kind": result.kind,
+                            "sha256": result.sha256, "error": result.error,
+                        })
+                    else:
+                        stats["documents"] += 1
+                        stats["cached"] += int(result.cached)
+                        stats["cached_pages" if result.cached else "pages"] += result.pages
+                        pending.append({
+                            "doc_key": result.doc_key, "sha256": result.sha256,
+                            "text": result.text, "pages": result.pages,
+                        })
+
+                    if len(pending) >= self.batch_size:
+                        self.store.set_full_texts(pending)
+                        pending = []
+                    if len(failures) >= self.batch_size:
+                        self.store.record_extraction_failures(failures)
+                        failures = []
+
+                    if done % 100 == 0 or done == len(jobs):
+                        elapsed = time.perf_counter() - start
+                        logger.info(
+                            f"[{done}/{len(jobs)}] 추출 {stats['documents']} (캐시 {stats['cached']}) / "
+                            f"실패 {stats['failed']} - 추출 {stats['pages']}페이지 "
+                            f"(캐시 {stats['cached_pages']}페이지), "
+                            f"{stats['pages'] / elapsed if elapsed else 0:.1f} pages/sec"
+                        )
+
+        if pending:
+            self.store.set_full_texts(pending)
+        if failures:
+            self.store.record_extraction_failures(failures)
+
+        stats["seconds"] = round(time.perf_counter() - start, 2)
+        stats["pages_per_sec"] = round(stats["pages"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+        return stats
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="회의록 첨부파일 본문 추출기")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"회의록 DB 경로 (기본: {DEFAULT_DB_PATH})")
+    parser.add_argument("--cache", type=str, default=DEFAULT_CACHE_DIR, help=f"추출 텍스트 캐시 디렉토리 (기본: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="작업자 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--limit", "-n", type=int, default=None, help="최대 추출 건수")
+    parser.add_argument("--max-attempts", type=int, default=MAX_EXTRACTION_ATTEMPTS,
+                        help=f"이 횟수 이상 실패한 파일은 건너뜀 (기본: {MAX_EXTRACTION_ATTEMPTS}, 의존성 설치 후 재시도 시 늘림)")
+
+    args = parser.parse_args()
+
+    missing = [name for name, module in (("PyMuPDF", fitz), ("olefile", olefile)) if module is None]
+    if missing:
+        logger.warning(f"선택 의존성 미설치: {', '.join(missing)} - 해당 형식은 추출 실패로 기록됩니다 (--max-attempts회 실패 후 제외).")
+
+    store = MinutesStore(args.db)
+    try:
+        jobs = store.pending_extractions(limit=args.limit, max_attempts=args.max_attempts)
+        logger.info(f"추출 대상: {len(jobs)}건")
+        if jobs:
+            stats = MinutesExtractor(store, args.cache, max_workers=args.workers).run(jobs)
+            logger.info(f"추출 종료: {stats}")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+지방의회 회의록 발언자(speaker turn) 분할 + 발언 색인
+====================================================
+- 회의록 본문을 "○의장 김철수", "○홍길동 의원" 형식의 발언자 표시로 분할
+- 발언자는 의회별 사전 테이블(speakers)로, 발언은 (문서, 순번, 발언자, 오프셋)만
+  저장하는 compact 테이블(speaker_turns)로 보관 - 발언 본문은 documents.content를 잘라 사용
+- 발언자별 / 의회별 인덱스로 문서를 다시 파싱하지 않고 조회
+
+Usage:
+    python minutes_speakers.py index
+    python minutes_speakers.py query 김철수 --year 2024 --council seoul
+    python minutes_speakers.py speakers --council seoul --year 2024
+"""
+
+import argparse
+import logging
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from minutes_store import DEFAULT_DB_PATH, MinutesStore
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# 발언자 분할
+# ============================================================================
+# 줄 첫머리의 ○/◯ 표시 (라벨 끝은 _label_end가 직책/이름 패턴으로 결정)
+SPEAKER_MARK = re.compile(r"^[ \t]*[○◯〇][ \t]*", re.MULTILINE)
+# 패턴으로 라벨을 정할 수 없을 때: 라벨 뒤가 공백 2칸 이상, 탭, 또는 줄바꿈인 레이아웃
+SPACED_LABEL = re.compile(r"(?P<label>[가-힣A-Za-z·ㆍ() ]{1,30}?)[ \t]*(?:[ \t]{2,}|\t|$)")
+TOKEN_PATTERN = re.compile(r"[^\s]+")
+NAME_PATTERN = re.compile(r"^[가-힣]{2,4}$")
+
+# 발언자가 아닌 ○ 항목 (출석의원 명단, 회의 개요 등)
+NON_SPEAKER_WORDS = ("출석", "참석", "결석", "일시", "장소", "안건", "의사일정", "회의록", "서명", "상정된")
+
+ROLE_SUFFIXES = (
+    "위원장", "부의장", "의장", "의원", "위원", "교육감", "부교육감", "시장", "부시장",
+    "군수", "부군수", "구청장", "부구청장", "지사", "부지사", "실장", "국장", "과장",
+    "본부장", "단장", "청장", "소장", "감사관", "전문위원", "사무처장", "사무국장", "관장",
+    "대표", "참고인", "진술인", "증인", "간사", "팀장", "원장", "이사장", "사장",
+)
+
+# 이름 판별용 성씨 (두 글자 성 포함) - "다음은", "감사합니다" 같은 본문 첫 단어와 구분
+SURNAMES = frozenset(
+    "김이박최정강조윤장임한오서신권황안송류유전홍고문양손배백허남심노하곽성차주우구민진나지엄채"
+    "원천방공현함변염여추도소석선설마길연위표명기반라왕금옥육인맹제모탁국어은편용예경봉사부가복태"
+    "목형계피두감음빈동온호범좌팽승간상시갈견당화창"
+)
+COMPOUND_SURNAMES = ("남궁", "황보", "제갈", "선우", "독고", "사공", "서문", "동방")
+
+
+@dataclass
+class SpeakerTurn:
+    """발언 1건 (본문 내 문자 오프셋)"""
+    turn_no: int
+    speaker: str
+    role: str
+    start: int
+    end: int
+
+
+def is_person_name(token: str) -> bool:
+    """2~4자 한글 + 성씨로 시작 + 직책어가 아님 (예: 김철수, 남궁민)"""
+    return (
+        bool(NAME_PATTERN.match(token))
+        and (token[0] in SURNAMES or token.startswith(COMPOUND_SURNAMES))
+        and not token.endswith(ROLE_SUFFIXES)
+    )
+
+
+def _is_role(token: str) -> bool:
+    return token.endswith(ROLE_SUFFIXES) and not token.startswith(NON_SPEAKER_WORDS)
+
+
+def _is_glued_member(token: str) -> bool:
+    """"홍길동의원" / "홍길동위원장"처럼 이름과 직책이 붙은 토큰"""
+    return any(
+        token.endswith(role) and is_person_name(token[:-len(role)])
+        for role in ("위원장", "의원", "위원")
+    )
+
+
+def _label_end(line: str) -> Optional[int]:
+    """○ 뒤 한 줄에서 발언자 라벨이 끝나는 위치 (공백 수와 무관하게 패턴으로 판단)
+
+    직책 우선: "의장 김철수", "기획조정실장 이영희", "간사 김철수", "의장"
+    이름 우선: "홍길동 의원", "홍길동의원", "홍길동 위원장"
+    어느 패턴에도 맞지 않으면 라벨 뒤 공백 2칸/탭/줄바꿈 레이아웃으로 판단
+    """
+    tokens = TOKEN_PATTERN.findall(line)[:2]
+    positions = [m.end() for m in TOKEN_PATTERN.finditer(line)][:2]
+    if tokens:
+        first = tokens[0]
+        second = tokens[1] if len(tokens) > 1 else ""
+        if _is_glued_member(first):
+            return positions[0]
+        if is_person_name(first) and second and _is_role(second):
+            return positions[1]
+        if _is_role(first):
+            return positions[1] if is_person_name(second) else positions[0]
+        # 목록에 없는 직책 + 이름 ("간사 김철수"처럼 직책어가 ROLE_SUFFIXES에 없는 경우)
+        if NAME_PATTERN.match(first) and not is_person_name(first) and is_person_name(second):
+            return positions[1]
+
+    spaced = SPACED_LABEL.match(line)
+    return spaced.end("label") if spaced else None
+
+
+def parse_label(label: str) -> Tuple[str, str]:
+    """발언자 라벨 → (이름, 직책)
+
+    "의장 김철수" / "김철수 의원" / "김철수의원" / "기획조정실장 이영희" / "간사 김철수" / "의장"
+    """
+    tokens = label.replace("ㆍ", "·").split()
+    name, roles = "", []
+    for token in tokens:
+        if not name and is_person_name(token):
+            name = token
+        elif not name and _is_glued_member(token):
+            role = next(role for role in ("위원장", "의원", "위원") if token.endswith(role))
+            name, roles = token[:-len(role)], roles + [role]
+        else:
+            roles.append(token)
+    return name, " ".join(roles)
+
+
+def segment_turns(text: str) -> List[SpeakerTurn]:
+    """회의록 본문을 발언 단위로 분할 (첫 발언 이전 머리말은 제외)"""
+    turns: List[SpeakerTurn] = []
+    names_by_role: Dict[str, str] = {}
+    marks = []
+    for match in SPEAKER_MARK.finditer(text):
+        line_end = text.find("\n", match.end())
+        line = text[match.end():line_end if line_end != -1 else len(text)]
+        label_end = _label_end(line)
+        if label_end is not None:
+            marks.append((match.start(), match.end() + label_end, line[:label_end].strip()))
+
+    for i, (_, label_stop, label) in enumerate(marks):
+        end = marks[i + 1][0] if i + 1 < len(marks) else len(text)
+        if not label or any(word in label for word in NON_SPEAKER_WORDS):
+            continue
+
+        name, role = parse_label(label)
+        if not name and not role:
+            continue
+        # "○의장"처럼 직책만 있으면 같은 문서에서 앞서 나온 같은 직책의 이름을 사용
+        if name:
+            names_by_role[role] = name
+        else:
+            name = names_by_role.get(role, "")
+
+        start = label_stop
+        # 앞뒤 공백은 오프셋에서 제외
+        while start < end and text[start].isspace():
+            start += 1
+        stop = end
+        while stop > start and text[stop - 1].isspace():
+            stop -= 1
+        if stop <= start:
+            continue
+
+        turns.append(SpeakerTurn(turn_no=len(turns), speaker=name, role=role, start=start, end=stop))
+
+    return turns
+
+
+# ============================================================================
+# 발언 색인
+# ============================================================================
+@dataclass
+class Utterance:
+    """발언 조회 결과"""
+    doc_key: str
+    council_code: str
+    council_name: str
+    meeting_date: str
+    title: str
+    turn_no: int
+    speaker: str
+    role: str
+    text: str
+
+
+class SpeakerIndex:
+    """MinutesStore DB에 발언자 사전 + 발언 테이블을 두고 조회하는 색인"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS speakers (
+        id INTEGER PRIMARY KEY,
+        council_code TEXT NOT NULL,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        UNIQUE (council_code, name, role)
+    );
+    CREATE INDEX IF NOT EXISTS idx_speakers_name ON speakers(name, council_code);
+    CREATE TABLE IF NOT EXISTS speaker_turns (
+        doc_id INTEGER NOT NULL,
+        turn_no INTEGER NOT NULL,
+        speaker_id INTEGER NOT NULL,
+        start INTEGER NOT NULL,
+        end INTEGER NOT NULL,
+        PRIMARY KEY (doc_id, turn_no)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_turns_speaker ON speaker_turns(speaker_id, doc_id);
+    CREATE TABLE IF NOT EXISTS speaker_docs (
+        doc_id INTEGER PRIMARY KEY,
+        indexed_at TEXT NOT NULL,
+        turns INTEGER NOT NULL
+    );
+    """
+
+    def __init__(self, store: MinutesStore):
+        self.store = store
+        self.conn = store.conn
+        self.conn.executescript(self.SCHEMA)
+        self._speaker_ids: Dict[Tuple[str, str, str], int] = {}
+
+    def _speaker_id(self, council_code: str, name: str, role: str) -> int:
+        key = (council_code, name, role)
+        speaker_id = self._speaker_ids.get(key)
+        if speaker_id is None:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO speakers (council_code, name, role) VALUES (?, ?, ?)", key
+            )
+            speaker_id = self.conn.execute(
+                "SELECT id FROM speakers WHERE council_code = ? AND name = ? AND role = ?", key
+            ).fetchone()[0]
+            self._speaker_ids[key] = speaker_id
+        return speaker_id
+
+    def index_documents(self, batch_size: int = 500, reindex: bool = False) -> Dict[str, int]:
+        """본문이 바뀐(또는 아직 색인되지 않은) 문서를 발언 단위로 색인"""
+        sql = (
+            "SELECT d.id, d.council_code, d.content FROM documents d "
+            "LEFT JOIN speaker_docs s ON s.doc_id = d.id"
+        )
+        if not reindex:
+            sql += " WHERE s.doc_id IS NULL OR s.indexed_at < d.indexed_at"
+
+        with self.store._lock:
+            rows = self.conn.execute(sql).fetchall()
+
+        stats = {"documents": 0, "turns": 0}
+        for offset in range(0, len(rows), batch_size):
+            with self.store._lock, self.conn:
+                for row in rows[offset:offset + batch_size]:
+                    turns = segment_turns(row["content"] or "")
+                    self.conn.execute("DELETE FROM speaker_turns WHERE doc_id = ?", (row["id"],))
+                    self.conn.executemany(
+                        "INSERT INTO speaker_turns (doc_id, turn_no, speaker_id, start, end) VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (row["id"], turn.turn_no,
+                             self._speaker_id(row["council_code"], turn.speaker, turn.role),
+                             turn.start, turn.end)
+                            for turn in turns
+                        ],
+                    )
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO speaker_docs (doc_id, indexed_at, turns) VALUES (?, ?, ?)",
+                        (row["id"], datetime.now().isoformat(), len(turns)),
+                    )
+                    stats["documents"] += 1
+                    stats["turns"] += len(turns)
+        return stats
+
+    @staticmethod
+    def _filters(speaker: Optional[str], role: Optional[str], council_code: Optional[str],
+                 year: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if speaker:
+            clauses.append("sp.name = ?")
+            params.append(speaker)
+        if role:
+            clauses.append("sp.role LIKE ?")
+            params.append(f"%{role}%")
+        if council_code:
+            clauses.append("sp.council_code = ?")
+            params.append(council_code)
+        if year:
+            clauses.append("d.meeting_date >= ? AND d.meeting_date < ?")
+            params.extend([f"{year}", f"{int(year) + 1}"])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def utterances(self, speaker: Optional[str] = None, *, role: Optional[str] = None,
+                   council_code: Optional[str] = None, year: Optional[str] = None,
+                   limit: int = 50) -> List[Utterance]:
+        """발언 조회 (예: 2024년 김철수 의원의 모든 발언)"""
+        where, params = self._filters(speaker, role, council_code, year)
+        sql = (
+            "SELECT d.doc_key, d.council_code, d.council_name, d.meeting_date, d.title, "
+            "t.turn_no, sp.name, sp.role, substr(d.content, t.start + 1, t.end - t.start) AS text "
+            "FROM speakers sp "
+            "JOIN speaker_turns t ON t.speaker_id = sp.id "
+            "JOIN documents d ON d.id = t.doc_id"
+            f"{where} ORDER BY d.meeting_date, d.id, t.turn_no LIMIT ?"
+        )
+        with self.store._lock:
+            rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [
+            Utterance(
+                doc_key=row["doc_key"], council_code=row["council_code"],
+                council_name=row["council_name"], meeting_date=row["meeting_date"],
+                title=row["title"], turn_no=row["turn_no"], speaker=row["name"],
+                role=row["role"], text=row["text"],
+            )
+            for row in rows
+        ]
+
+    def top_speakers(self, *, council_code: Optional[str] = None, year: Optional[str] = None,
+                     limit: int = 20) -> List[Dict[str, Any]]:
+        """발언 수/분량 기준 상위 발언자"""
+        where, params = self._filters(None, None, council_code, year)
+        sql = (
+            "SELECT sp.council_code, sp.name, sp.role, COUNT(*) AS turns, "
+            "SUM(t.end - t.start) AS chars, COUNT(DISTINCT t.doc_id) AS meetings "
+            "FROM speakers sp "
+            "JOIN speaker_turns t ON t.speaker_id = sp.id "
+            "JOIN documents d ON d.id = t.doc_id"
+            f"{where} GROUP BY sp.id ORDER BY turns DESC LIMIT ?"
+        )
+        with self.store._lock:
+            rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="회의록 발언자 분할 + 발언 색인")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"DB 경로 (기본: {DEFAULT_DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = sub.add_parser("index", help="본문이 바뀐 문서를 발언 단위로 색인")
+    index_parser.add_argument("--reindex", action="store_true", help="전체 문서 다시 색인")
+
+    query_parser = sub.add_parser("query", help="발언자별 발언 조회")
+    query_parser.add_argument("speaker", help="발언자 이름")
+    query_parser.add_argument("--role", help="직책 (부분 일치)")
+    query_parser.add_argument("--council", help="의회 코드")
+    query_parser.add_argument("--year", help="회의 연도 (예: 2024)")
+    query_parser.add_argument("--limit", "-n", type=int, default=50)
+
+    speakers_parser = sub.add_parser("speakers", help="발언 수 상위 발언자")
+    speakers_parser.add_argument("--council", help="의회 코드")
+    speakers_parser.add_argument("--year", help="회의 연도 (예: 2024)")
+    speakers_parser.add_argument("--limit", "-n", type=int, default=20)
+
+    args = parser.parse_args()
+
+    store = MinutesStore(args.db)
+    index = SpeakerIndex(store)
+    try:
+        if args.command == "index":
+            stats = index.index_documents(reindex=args.reindex)
+            logger.info(f"발언 색인 완료: 문서 {stats['documents']}건, 발언 {stats['turns']}건")
+        elif args.command == "query":
+            utterances = index.utterances(
+                args.speaker, role=args.role, council_code=args.council, year=args.year, limit=args.limit
+            )
+            for u in utterances:
+                print(f"[{u.meeting_date}] {u.council_name} {u.title} #{u.turn_no}")
+                print(f"  {u.role} {u.speaker}: {u.text[:200]}")
+            if not utterances:
+                print("발언이 없습니다.")
+        elif args.command == "speakers":
+            for row in index.top_speakers(council_code=args.council, year=args.year, limit=args.limit):
+                print(f"{row['council_code']:15} {row['name'] or '-':6} {row['role']:12} "
+                      f"발언 {row['turns']:5}회 / 회의 {row['meetings']:4}건 / {row['chars']:8}자")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+지방의회 회의록 저장소 + 전문(full-text) 검색 인덱스
+=====================================================
+- SQLite FTS5 기반 증분 역색인 (추가 의존성 없음)
+- 한국어는 형태소 분석기 없이 음절 bigram으로 색인 (n-gram fallback)
+- 백그라운드 writer 스레드로 배치 크롤링 중 fetch를 막지 않고 색인
+- 검색 결과는 BM25 순위 + 본문 스니펫으로 반환
+- 첨부파일(PDF/HWP) 다운로드 메타데이터 보관 (attachment_downloader.py)
+- 첨부파일에서 추출한 전문으로 본문/색인 갱신 (minutes_extractor.py)
+
+Usage:
+    python minutes_store.py index output/*.jsonl
+    python minutes_store.py search "예산 심사" --council gyeonggi --limit 10
+    python minutes_store.py stats
+"""
+
+import argparse
+import json
+import logging
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "output/minutes.db"
+MAX_EXTRACTION_ATTEMPTS = 3  # 같은 파일(sha256) 추출이 이만큼 실패하면 pending_extractions에서 제외
+
+# ============================================================================
+# 한국어 n-gram 토크나이저
+# ============================================================================
+HANGUL_RUN = re.compile(r"[가-힣]+")
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[0-9A-Za-z]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """색인용 토큰 생성 - 한글은 음절 bigram, 영숫자는 소문자 단어"""
+    tokens: List[str] = []
+    for match in TOKEN_PATTERN.finditer(text or ""):
+        word = match.group(0)
+        if HANGUL_RUN.fullmatch(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+def build_match_query(query: str) -> str:
+    """사용자 검색어를 FTS5 MATCH 구문으로 변환 (단어별 bigram phrase AND)"""
+    clauses = []
+    for match in TOKEN_PATTERN.finditer(query or ""):
+        word = match.group(0)
+        if HANGUL_RUN.fullmatch(word) and len(word) == 1:
+            # 한 글자 검색어는 bigram 앞글자 prefix 검색
+            clauses.append(f'"{word}"*')
+            continue
+        grams = tokenize(word)
+        clauses.append('"' + " ".join(grams) + '"')
+    return " AND ".join(clauses)
+
+
+def make_snippet(content: str, query: str, width: int = 80) -> str:
+    """검색어 주변 본문 일부를 잘라 스니펫 생성"""
+    if not content:
+        return ""
+    terms = [m.group(0) for m in TOKEN_PATTERN.finditer(query or "")]
+    lowered = content.lower()
+    pos = -1
+    for term in terms:
+        pos = lowered.find(term.lower())
+        if pos >= 0:
+            break
+    if pos < 0:
+        return content[:width * 2]
+    start = max(0, pos - width)
+    end = min(len(content), pos + width)
+    snippet = content[start:end]
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(content):
+        snippet = snippet + "…"
+    return snippet
+
+
+# ============================================================================
+# 검색 결과 모델
+# ============================================================================
+@dataclass
+class SearchHit:
+    """검색 결과 한 건"""
+    doc_key: str
+    council_code: str
+    council_name: str
+    meeting_date: str
+    title: str
+    source_url: str
+    score: float
+    snippet: str
+
+
+# ============================================================================
+# 회의록 저장소
+# ============================================================================
+class MinutesStore:
+    """회의록 문서 + FTS5 역색인 저장소"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS documents (
+        id INTEGER PRIMARY KEY,
+        doc_key TEXT NOT NULL UNIQUE,
+        council_code TEXT NOT NULL,
+        council_name TEXT,
+        meeting_id TEXT,
+        assembly_number TEXT,
+        session_number TEXT,
+        meeting_type TEXT,
+        committee_name TEXT,
+        meeting_date TEXT,
+        title TEXT,
+        content TEXT,
+        pdf_url TEXT,
+        hwp_url TEXT,
+        source_url TEXT,
+        scraped_at TEXT,
+        indexed_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_documents_council ON documents(council_code, meeting_date);
+    CREATE VIRTUAL TABLE IF NOT EXISTS minutes_fts USING fts5(
+        title, body, tokenize='unicode61'
+    );
+    CREATE TABLE IF NOT EXISTS attachments (
+        doc_key TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        url TEXT NOT NULL,
+        sha256 TEXT,
+        path TEXT,
+        bytes INTEGER,
+        content_type TEXT,
+        status TEXT NOT NULL,
+        error TEXT,
+        downloaded_at TEXT,
+        PRIMARY KEY (doc_key, kind)
+    );
+    CREATE INDEX IF NOT EXISTS idx_attachments_sha ON attachments(sha256);
+    CREATE TABLE IF NOT EXISTS document_texts (
+        doc_key TEXT PRIMARY KEY,
+        sha256 TEXT NOT NULL,
+        pages INTEGER,
+        chars INTEGER,
+        extracted_at TEXT
+    );
+    CREATE TABLE IF NOT EXISTS extraction_failures (
+        doc_key TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        sha256 TEXT NOT NULL,
+        attempts INTEGER NOT NULL,
+        error TEXT,
+        failed_at TEXT,
+        PRIMARY KEY (doc_key, kind, sha256)
+    );
+    """
+
+    DOC_FIELDS = (
+        "council_code", "council_name", "meeting_id", "assembly_number",
+        "session_number", "meeting_type", "committee_name", "meeting_date",
+        "title", "pdf_url", "hwp_url", "source_url", "scraped_at",
+    )
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def doc_key_for(record: Dict[str, Any]) -> str:
+        """문서 고유키 (의회코드:회의ID, ID가 없으면 원문 URL)"""
+        meeting_id = record.get("meeting_id") or record.get("source_url", "")
+        return f"{record.get('council_code', '')}:{meeting_id}"
+
+    def _upsert(self, record: Dict[str, Any]) -> int:
+        """문서 1건 저장 + 색인 갱신 (트랜잭션은 호출자가 관리)"""
+        doc_key = self.doc_key_for(record)
+        content = record.get("content_text") or record.get("content_preview") or ""
+        values = [record.get(field) or "" for field in self.DOC_FIELDS]
+
+        row = self.conn.execute(
+            "SELECT d.id, d.content, t.doc_key AS has_text FROM documents d "
+            "LEFT JOIN document_texts t ON t.doc_key = d.doc_key WHERE d.doc_key = ?",
+            (doc_key,),
+        ).fetchone()
+        if row:
+            doc_id = row["id"]
+            if row["has_text"] and not record.get("content_text"):
+                # 첨부파일에서 추출한 전문을 재크롤링 미리보기로 덮어쓰지 않음
+                content = row["content"]
+            assignments = ", ".join(f"{field} = ?" for field in self.DOC_FIELDS)
+            self.conn.execute(
+                f"UPDATE documents SET {assignments}, content = ?, indexed_at = ? WHERE id = ?",
+                values + [content, datetime.now().isoformat(), doc_id],
+            )
+            self.conn.execute("DELETE FROM minutes_fts WHERE rowid = ?", (doc_id,))
+        else:
+            columns = ", ".join(self.DOC_FIELDS)
+            placeholders = ", ".join("?" for _ in self.DOC_FIELDS)
+            cursor = self.conn.execute(
+                f"INSERT INTO documents (doc_key, {columns}, content, indexed_at) "
+                f"VALUES (?, {placeholders}, ?, ?)",
+                [doc_key] + values + [content, datetime.now().isoformat()],
+            )
+            doc_id = cursor.lastrowid
+
+        self.conn.execute(
+            "INSERT INTO minutes_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (doc_id, " ".join(tokenize(record.get("title", ""))), " ".join(tokenize(content))),
+        )
+        return doc_id
+
+    def add_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """여러 문서를 한 트랜잭션으로 저장"""
+        count = 0
+        with self._lock, self.conn:
+            for record in records:
+                self._upsert(record)
+                count += 1
+        return count
+
+    def search(self, query: str, *, council_code: Optional[str] = None,
+               date_from: Optional[str] = None, date_to: Optional[str] = None,
+               limit: int = 20) -> List[SearchHit]:
+        """전문 검색 - BM25 순위(제목 가중치 3배) + 스니펫"""
+        match_query = build_match_query(query)
+        if not match_query:
+            return []
+
+        sql = (
+            "SELECT d.*, bm25(minutes_fts, 3.0, 1.0) AS score "
+            "FROM minutes_fts JOIN documents d ON d.id = minutes_fts.rowid "
+            "WHERE minutes_fts MATCH ?"
+        )
+        params: List[Any] = [match_query]
+        if council_code:
+            sql += " AND d.council_code = ?"
+            params.append(council_code)
+        if date_from:
+            sql += " AND d.meeting_date >= ?"
+            params.append(date_from)
+        if date_to:
+            sql += " AND d.meeting_date <= ?"
+            params.append(date_to)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        return [
+            SearchHit(
+                doc_key=row["doc_key"],
+                council_code=row["council_code"],
+                council_name=row["council_name"],
+                meeting_date=row["meeting_date"],
+                title=row["title"],
+                source_url=row["source_url"],
+                score=-row["score"],  # bm25()는 낮을수록 관련도 높음
+                snippet=make_snippet(row["content"], query),
+            )
+            for row in rows
+        ]
+
+    def pending_attachments(self, kinds: Iterable[str] = ("pdf", "hwp"),
+                            limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """아직 다운로드 완료되지 않은 첨부파일 목록 [{doc_key, kind, url}]"""
+        jobs: List[Dict[str, str]] = []
+        with self._lock:
+            for kind in kinds:
+                column = f"{kind}_url"
+                if column not in ("pdf_url", "hwp_url"):
+                    continue
+                rows = self.conn.execute(
+                    f"SELECT d.doc_key, d.{column} AS url FROM documents d "
+                    f"LEFT JOIN attachments a ON a.doc_key = d.doc_key AND a.kind = ? "
+                    f"WHERE d.{column} != '' AND (a.status IS NULL OR a.status != 'ok')",
+                    (kind,),
+                ).fetchall()
+                jobs.extend({"doc_key": row["doc_key"], "kind": kind, "url": row["url"]} for row in rows)
+        return jobs[:limit] if limit else jobs
+
+    def record_attachment(self, doc_key: str, kind: str, url: str, *, status: str,
+                          sha256: str = "", path: str = "", size: int = 0,
+                          content_type: str = "", error: str = ""):
+        """첨부파일 다운로드 결과 기록"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO attachments "
+                "(doc_key, kind, url, sha256, path, bytes, content_type, status, error, downloaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_key, kind, url, sha256, path, size, content_type, status, error,
+                 datetime.now().isoformat()),
+            )
+
+    def pending_extractions(self, limit: Optional[int] = None,
+                            max_attempts: int = MAX_EXTRACTION_ATTEMPTS) -> List[Dict[str, str]]:
+        """다운로드는 끝났지만 본문이 아직 추출되지 않은 첨부파일 [{doc_key, kind, sha256, path}]
+
+        문서당 PDF를 우선하고, PDF가 없을 때만 HWP를 사용한다.
+        같은 파일로 max_attempts번 이상 실패한 첨부파일은 제외한다 (파일이 바뀌면 다시 시도).
+        """
+        sql = (
+            "SELECT a.doc_key, a.kind, a.sha256, a.path FROM attachments a "
+            "LEFT JOIN document_texts t ON t.doc_key = a.doc_key "
+            "LEFT JOIN extraction_failures f "
+            "  ON f.doc_key = a.doc_key AND f.kind = a.kind AND f.sha256 = a.sha256 "
+            "WHERE a.status = 'ok' AND a.path != '' AND (t.sha256 IS NULL OR t.sha256 != a.sha256) "
+            "AND (f.attempts IS NULL OR f.attempts < ?) "
+            "AND (a.kind = 'pdf' OR NOT EXISTS ("
+            "  SELECT 1 FROM attachments p WHERE p.doc_key = a.doc_key AND p.kind = 'pdf' AND p.status = 'ok'"
+            ")) ORDER BY a.doc_key"
+        )
+        params: List[Any] = [max_attempts]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def record_extraction_failures(self, items: Iterable[Dict[str, Any]]):
+        """추출 실패 기록 (시도 횟수 누적) - items: [{doc_key, kind, sha256, error}]"""
+        now = datetime.now().isoformat()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO extraction_failures (doc_key, kind, sha256, attempts, error, failed_at) "
+                "VALUES (?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (doc_key, kind, sha256) DO UPDATE SET "
+                "attempts = attempts + 1, error = excluded.error, failed_at = excluded.failed_at",
+                [(item["doc_key"], item["kind"], item["sha256"], item.get("error", ""), now) for item in items],
+            )
+
+    def set_full_texts(self, items: Iterable[Dict[str, Any]]) -> int:
+        """추출한 전문으로 본문/색인 갱신 - items: [{doc_key, sha256, text, pages}]"""
+        count = 0
+        now = datetime.now().isoformat()
+        with self._lock, self.conn:
+            for item in items:
+                row = self.conn.execute(
+                    "SELECT id, title FROM documents WHERE doc_key = ?", (item["doc_key"],)
+                ).fetchone()
+                if not row:
+                    continue
+                text = item["text"]
+                self.conn.execute(
+                    "UPDATE documents SET content = ?, indexed_at = ? WHERE id = ?", (text, now, row["id"])
+                )
+                self.conn.execute("DELETE FROM minutes_fts WHERE rowid = ?", (row["id"],))
+                self.conn.execute(
+                    "INSERT INTO minutes_fts (rowid, title, body) VALUES (?, ?, ?)",
+                    (row["id"], " ".join(tokenize(row["title"] or "")), " ".join(tokenize(text))),
+                )
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO document_texts (doc_key, sha256, pages, chars, extracted_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (item["doc_key"], item["sha256"], item.get("pages", 0), len(text), now),
+                )
+                self.conn.execute("DELETE FROM extraction_failures WHERE doc_key = ?", (item["doc_key"],))
+                count += 1
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        with self._lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            councils = self.conn.execute(
+                "SELECT council_code, COUNT(*) AS n FROM documents GROUP BY council_code ORDER BY n DESC"
+            ).fetchall()
+            attachments = self.conn.execute(
+                "SELECT status, COUNT(*) AS n, COALESCE(SUM(bytes), 0) AS size FROM attachments GROUP BY status"
+            ).fetchall()
+            full_texts = self.conn.execute("SELECT COUNT(*) FROM document_texts").fetchone()[0]
+            extraction_failures = self.conn.execute(
+                "SELECT COUNT(*) FROM extraction_failures WHERE attempts >= ?", (MAX_EXTRACTION_ATTEMPTS,)
+            ).fetchone()[0]
+        return {
+            "documents": total,
+            "councils": {row["council_code"]: row["n"] for row in councils},
+            "attachments": {row["status"]: {"count": row["n"], "bytes": row["size"]} for row in attachments},
+            "full_texts": full_texts,
+            "extraction_failures": extraction_failures,
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+# ============================================================================
+# 백그라운드 색인 writer
+# ============================================================================
+class IndexWriter:
+    """크롤링 스레드를 막지 않도록 큐에 쌓아 배치로 색인하는 writer"""
+
+    _STOP = object()
+
+    def __init__(self, store: MinutesStore, batch_size: int = 200, flush_interval: float = 1.0):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.indexed = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="minutes-index-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, item: Any):
+        """MeetingMinutes 또는 dict를 색인 큐에 추가 (즉시 반환)"""
+        record = item.to_dict() if hasattr(item, "to_dict") else dict(item)
+        self._queue.put(record)
+
+    def _run(self):
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is self._STOP
+            if item is not None and not stop:
+                batch.append(item)
+
+            if batch and (stop or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                try:
+                    self.indexed += self.store.add_many(batch)
+                except sqlite3.Error as e:
+                    logger.error(f"색인 실패 ({len(batch)}건): {e}")
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+            if stop:
+                return
+
+    def close(self):
+        """남은 큐를 모두 색인하고 스레드 종료"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        logger.info(f"색인 완료: {self.indexed}건")
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def iter_jsonl(paths: Iterable[str]) -> Iterable[Dict[str, Any]]:
+    """JSONL 결과 파일들에서 레코드 순회"""
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(description="회의록 전문 검색 인덱스")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"DB 경로 (기본: {DEFAULT_DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    index_cmd = sub.add_parser("index", help="JSONL 결과 파일 색인")
+    index_cmd.add_argument("files", nargs="+", help="council_crawler/batch_crawl JSONL 파일")
+
+    search_cmd = sub.add_parser("search", help="전문 검색")
+    search_cmd.add_argument("query", type=str, help="검색어")
+    search_cmd.add_argument("--council", "-c", type=str, help="의회 코드 필터")
+    search_cmd.add_argument("--date-from", type=str, help="회의일 시작 (YYYY-MM-DD)")
+    search_cmd.add_argument("--date-to", type=str, help="회의일 종료 (YYYY-MM-DD)")
+    search_cmd.add_argument("--limit", "-n", type=int, default=20, help="최대 결과 수 (기본: 20)")
+    search_cmd.add_argument("--json", action="store_true", help="JSON으로 출력")
+
+    sub.add_parser("stats", help="저장소 통계")
+
+    args = parser.parse_args()
+    store = MinutesStore(args.db)
+
+    try:
+        if args.command == "index":
+            start = time.time()
+            count = store.add_many(iter_jsonl(args.files))
+            elapsed = time.time() - start
+            logger.info(f"{count}건 색인 ({elapsed:.2f}초, {count / elapsed if elapsed else 0:.0f}건/초)")
+        elif args.command == "search":
+            hits = store.search(
+                args.query,
+                council_code=args.council,
+                date_from=args.date_from,
+                date_to=args.date_to,
+                limit=args.limit,
+            )
+            if args.json:
+                print(json.dumps([hit.__dict__ for hit in hits], ensure_ascii=False, indent=2))
+            else:
+                for rank, hit in enumerate(hits, 1):
+                    print(f"[{rank}] {hit.council_name} | {hit.meeting_date} | {hit.title} (score={hit.score:.2f})")
+                    print(f"    {hit.snippet}")
+                    print(f"    {hit.source_url}")
+                print(f"\n총 {len(hits)}건")
+        elif args.command == "stats":
+            print(json.dumps(store.stats(), ensure_ascii=False, indent=2))
+    finally:
+        store.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
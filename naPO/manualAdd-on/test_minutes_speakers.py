@@ -0,0 +1,50 @@
+"""minutes_speakers 발언자 분할 테스트 (python -m pytest test_minutes_speakers.py)"""
+
+from minutes_speakers import parse_label, segment_turns
+
+
+def _turns(text):
+    return [(turn.speaker, turn.role, text[turn.start:turn.end]) for turn in segment_turns(text)]
+
+
+def test_single_space_labels():
+    text = (
+        "○의장 김철수 의석을 정돈하여 주시기 바랍니다.\n"
+        "○홍길동 의원 감사합니다.\n"
+        "○기획조정실장 이영희  답변드리겠습니다.\n"
+        "○의장 다음은 의사일정 제2항입니다.\n"
+    )
+    assert _turns(text) == [
+        ("김철수", "의장", "의석을 정돈하여 주시기 바랍니다."),
+        ("홍길동", "의원", "감사합니다."),
+        ("이영희", "기획조정실장", "답변드리겠습니다."),
+        ("김철수", "의장", "다음은 의사일정 제2항입니다."),
+    ]
+
+
+def test_name_first_labels():
+    text = "○홍길동 위원장 회의를 시작하겠습니다.\n○박영수의원 질의하겠습니다.\n이어서 말씀드리면\n"
+    assert _turns(text) == [
+        ("홍길동", "위원장", "회의를 시작하겠습니다."),
+        ("박영수", "의원", "질의하겠습니다.\n이어서 말씀드리면"),
+    ]
+
+
+def test_role_first_labels():
+    text = "○간사 박민수 보고드립니다.\n○위원장\n의사일정을 변경하겠습니다.\n"
+    assert _turns(text) == [
+        ("박민수", "간사", "보고드립니다."),
+        ("", "위원장", "의사일정을 변경하겠습니다."),
+    ]
+
+
+def test_non_speaker_items_are_skipped():
+    text = "○출석의원(15인)\n김철수 이영희\n○의장 김철수 개의를 선포합니다.\n"
+    assert _turns(text) == [("김철수", "의장", "개의를 선포합니다.")]
+
+
+def test_parse_label():
+    assert parse_label("의장 김철수") == ("김철수", "의장")
+    assert parse_label("김철수의원") == ("김철수", "의원")
+    assert parse_label("간사 김철수") == ("김철수", "간사")
+    assert parse_label("의장") == ("", "의장")
@@ -0,0 +1,251 @@
+"""
+Response cache for ai_client calls.
+
+- Keys: sha256 of namespace + model + whitespace-normalised messages + response schema
+- `MemoryCache` (LRU) in front of `SQLiteCache` (on disk), both with per-entry TTL
+- `get_or_compute` coalesces concurrent identical requests into one API call
+
+Swap or disable the process-wide cache with `set_cache` (any `ResponseCache` subclass).
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "ai_cache.sqlite3"
+DEFAULT_TTL = 24 * 3600
+MEMORY_ENTRIES = 512
+
+LOGGER = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def make_key(
+    model: str,
+    messages: Iterable[Dict[str, str]],
+    response_format: Optional[Dict] = None,
+    *,
+    namespace: str = "",
+) -> str:
+    """Cache key for a chat completion; whitespace differences in prompts don't matter."""
+    normalised = [
+        [message.get("role", ""), _WHITESPACE.sub(" ", message.get("content") or "").strip()]
+        for message in messages
+    ]
+    payload = json.dumps(
+        [namespace, model, normalised, response_format], ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Base class: subclasses implement get/set/discard, coalescing comes for free."""
+
+    def __init__(self):
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        """Store `value` for `ttl` seconds."""
+
+    @abstractmethod
+    def discard(self, key: str) -> None:
+        """Drop `key` if present."""
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Optional[str]],
+        *,
+        ttl: float = DEFAULT_TTL,
+        cacheable: Callable[[Optional[str]], bool] = lambda value: value is not None,
+    ) -> Optional[str]:
+        """Cached value, else `compute()` — called once even if several threads ask at once.
+
+        Waiting callers get the same result or exception; only values passing
+        `cacheable` are stored, and exceptions are never cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            # A leader that finished just before we registered may already have stored it
+            value = self.get(key)
+            if value is not None:
+                future.set_result(value)
+                return value
+            value = compute()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            if cacheable(value):
+                self.set(key, value, ttl)  # type: ignore[arg-type]
+            future.set_result(value)
+            return value
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+
+class MemoryCache(ResponseCache):
+    """Process-local LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = MEMORY_ENTRIES):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCache(ResponseCache):
+    """On-disk cache shared by every process using the same file."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    """
+    PURGE_EVERY = 100  # writes between deletions of expired rows
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        super().__init__()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def get(self, key: str) -> Optional[str]:
+        row = self.get_with_expiry(key)
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, value, now + ttl))
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self.conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+
+    def discard(self, key: str) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class TieredCache(ResponseCache):
+    """Memory LRU in front of a persistent layer; disk hits are promoted to memory."""
+
+    def __init__(self, memory: MemoryCache, disk: Optional[SQLiteCache] = None):
+        super().__init__()
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None or self.disk is None:
+            return value
+        row = self.disk.get_with_expiry(key)
+        if row is None:
+            return None
+        value, expires_at = row
+        self.memory.set(key, value, expires_at - time.time())
+        return value
+
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    def discard(self, key: str) -> None:
+        self.memory.discard(key)
+        if self.disk is not None:
+            self.disk.discard(key)
+
+
+_cache_lock = threading.Lock()
+_cache: List[Optional[ResponseCache]] = []  # empty until first use
+
+
+def _default_cache() -> ResponseCache:
+    try:
+        disk: Optional[SQLiteCache] = SQLiteCache()
+    except (OSError, sqlite3.Error) as exc:  # read-only deployments keep the memory layer
+        LOGGER.warning("AI response cache on disk unavailable: %s", exc)
+        disk = None
+    return TieredCache(MemoryCache(), disk)
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Process-wide response cache (memory + SQLite by default, None if disabled)."""
+    with _cache_lock:
+        if not _cache:
+            _cache.append(_default_cache())
+        return _cache[0]
+
+
+def set_cache(cache: Optional[ResponseCache]) -> None:
+    """Replace the process-wide cache; None disables caching and coalescing."""
+    with _cache_lock:
+        _cache[:] = [cache]
+
@@ -1,10 +1,17 @@
 import json
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from openai import OpenAI
 
+from .ai_cache import get_cache, make_key as make_cache_key
+from .translation_memory import TMKey, TranslationMemory, make_key
+from .vocab_manager import load_vocab
+
 try:
     import streamlit as st  # type: ignore
 except ImportError:  # Fallback for CLI usage outside Streamlit
@@ -14,11 +21,40 @@ except ImportError:  # Fallback for CLI usage outside Streamlit
 DEFAULT_MODEL = "gpt-4o-mini"
 TUTOR_MODEL = "gpt-4o-mini"
 
+# translate_vocab_entries: items per request, concurrent requests, attempts per batch
+TRANSLATION_BATCH_SIZE = 25
+TRANSLATION_WORKERS = 4
+TRANSLATION_RETRIES = 3
+TRANSLATED_FIELDS = ("english", "korean", "example_sentence_eng", "notes")
+
+# How long a cached response is reused, per call type (see _chat_completion)
+CACHE_TTLS = {
+    "vocab_from_context": 7 * 24 * 3600,
+    "lesson": 24 * 3600,
+    "quiz_feedback": 7 * 24 * 3600,
+    "tutor": 3600,
+}
+
+LOGGER = logging.getLogger(__name__)
+
 
 class AIClientError(RuntimeError):
     """Raised when the AI client cannot complete a request."""
 
 
+class TranslationIncomplete(AIClientError):
+    """Some entries could not be translated after retries.
+
+    `entries` holds every entry (translated where possible), `failed` the indexes
+    of the ones left untranslated.
+    """
+
+    def __init__(self, message: str, entries: List[Dict], failed: List[int]):
+        super().__init__(message)
+        self.entries = entries
+        self.failed = failed
+
+
 def _resolve_api_key() -> str:
     """Resolve the OpenAI API key from Streamlit secrets or environment variables."""
     key: Optional[str] = None
@@ -67,6 +103,46 @@ def _create_json_schema(schema_name: str, properties: Dict, required: Optional[L
     }
 
 
+def _is_json(content: Optional[str]) -> bool:
+    try:
+        json.loads(content)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _chat_completion(
+    kind: str,
+    *,
+    model: str,
+    messages: List[Dict[str, str]],
+    failure: str,
+    response_format: Optional[Dict] = None,
+) -> Optional[str]:
+    """Message content of a chat completion, shared through the response cache.
+
+    `kind` selects the TTL (CACHE_TTLS) and keeps call types apart in the key.
+    Identical concurrent requests share one API call; empty or (for JSON calls)
+    unparsable responses are returned but not cached.
+    """
+
+    def request() -> Optional[str]:
+        client = _get_client()
+        extra = {"response_format": response_format} if response_format else {}
+        try:
+            response = client.chat.completions.create(model=model, messages=messages, **extra)
+            return response.choices[0].message.content
+        except Exception as exc:  # pragma: no cover - network code
+            raise AIClientError(f"{failure}: {exc}") from exc
+
+    cache = get_cache()
+    if cache is None:
+        return request()
+    key = make_cache_key(model, messages, response_format, namespace=kind)
+    cacheable = _is_json if response_format else (lambda content: bool(content and content.strip()))
+    return cache.get_or_compute(key, request, ttl=CACHE_TTLS[kind], cacheable=cacheable)
+
+
 def generate_vocab_from_context(
     context_text: str,
     *,
@@ -85,7 +161,6 @@ def generate_vocab_from_context(
     if not context_text.strip():
         return {"entries": [], "notes": "No context text provided."}
 
-    client = _get_client()
     topic_summary = ", ".join(topics or [])
     schema = _create_json_schema(
         "vocabulary_batch",
@@ -134,20 +209,18 @@ def generate_vocab_from_context(
         f"{context_text[:7000]}"
     )
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": instruction},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format=schema,
-        )
-    except Exception as exc:  # pragma: no cover - network code
-        raise AIClientError(f"Failed to call OpenAI API: {exc}") from exc
+    content = _chat_completion(
+        "vocab_from_context",
+        model=model,
+        messages=[
+            {"role": "system", "content": instruction},
+            {"role": "user", "content": user_prompt},
+        ],
+        response_format=schema,
+        failure="Failed to call OpenAI API",
+    )
 
     try:
-        content = response.choices[0].message.content
         if content is None:
             raise AIClientError("OpenAI response content is empty.")
         payload = json.loads(content)
@@ -175,7 +248,6 @@ def generate_lesson_scaffolding(
     if not vocab_entries:
         return {}
 
-    client = _get_client()
     schema = _create_json_schema(
         "lesson_scaffold",
         properties={
@@ -200,23 +272,21 @@ def generate_lesson_scaffolding(
         f"Focus: {focus}\n"
         f"Learner level: {proficiency}\n"
         "Vocabulary JSON:\n"
-        f"{json.dumps(vocab_entries, ensure_ascii=False)}"
+        f"{json.dumps([dict(entry) for entry in vocab_entries], ensure_ascii=False)}"
     )
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format=schema,
-        )
-    except Exception as exc:  # pragma: no cover
-        raise AIClientError(f"Lesson generation failed: {exc}") from exc
+    content = _chat_completion(
+        "lesson",
+        model=model,
+        messages=[
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        response_format=schema,
+        failure="Lesson generation failed",
+    )
 
     try:
-        content = response.choices[0].message.content
         if content is None:
             raise AIClientError("Lesson scaffold response is empty.")
         return json.loads(content)
@@ -224,13 +294,17 @@ def generate_lesson_scaffolding(
         raise AIClientError("Lesson scaffold response was not valid JSON.") from exc
 
 
-def translate_vocab_entries(entries: List[Dict], *, model: str = DEFAULT_MODEL) -> List[Dict]:
-    """Translate Ukrainian terms and sample sentences into English and Korean."""
-    if not entries:
-        return []
+@lru_cache(maxsize=1)
+def _get_translation_memory() -> Optional[TranslationMemory]:
+    try:
+        return TranslationMemory()
+    except Exception as exc:  # read-only deployments translate without memory
+        LOGGER.warning("Translation memory unavailable: %s", exc)
+        return None
 
-    client = _get_client()
-    schema = _create_json_schema(
+
+def _translation_schema() -> Dict:
+    return _create_json_schema(
         "translation_batch",
         properties={
             "items": {
@@ -253,6 +327,10 @@ def translate_vocab_entries(entries: List[Dict], *, model: str = DEFAULT_MODEL)
         required=["items"],
     )
 
+
+def _request_translations(entries: Sequence[Dict], model: str) -> Dict[int, Dict]:
+    """One API request for `entries`; returns {position in entries: translated fields}."""
+    client = _get_client()
     instruction = (
         "You are a bilingual translator specialising in Ukrainian operational vocabulary. "
         "For each entry, supply concise English and Korean translations and translate the sample sentence into English. "
@@ -279,7 +357,7 @@ def translate_vocab_entries(entries: List[Dict], *, model: str = DEFAULT_MODEL)
                 {"role": "system", "content": instruction},
                 {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
             ],
-            response_format=schema,
+            response_format=_translation_schema(),
         )
     except Exception as exc:  # pragma: no cover
         raise AIClientError(f"Translation request failed: {exc}") from exc
@@ -292,42 +370,148 @@ def translate_vocab_entries(entries: List[Dict], *, model: str = DEFAULT_MODEL)
     except (json.JSONDecodeError, AttributeError) as exc:
         raise AIClientError("Translation response could not be parsed as JSON.") from exc
 
-    lookup = {
-        item.get("index"): item for item in translation_payload.get("items", []) if isinstance(item, dict)
-    }
+    translations: Dict[int, Dict] = {}
+    for item in translation_payload.get("items", []):
+        if isinstance(item, dict) and item.get("index") in range(len(entries)):
+            translations[item["index"]] = {field: item[field] for field in TRANSLATED_FIELDS if item.get(field)}
+    return translations
+
 
-    enriched: List[Dict] = []
-    for idx, entry in enumerate(entries):
-        enriched_entry = dict(entry)
-        data = lookup.get(idx)
-        if data:
-            enriched_entry["english"] = data.get("english", enriched_entry.get("english", ""))
-            enriched_entry["korean"] = data.get("korean", enriched_entry.get("korean", ""))
-            enriched_entry["example_sentence_eng"] = data.get(
-                "example_sentence_eng", enriched_entry.get("example_sentence_eng", "")
-            )
-            notes = data.get("notes")
-            if notes:
-                existing = enriched_entry.get("notes", "")
-                enriched_entry["notes"] = f"{existing}\n{notes}".strip() if existing else notes
-        enriched.append(enriched_entry)
+def _translate_batch(entries: List[Dict], model: str) -> Tuple[Dict[int, Dict], Optional[AIClientError]]:
+    """Translate one batch, re-requesting items missing from the response (with backoff).
+
+    Returns the translations found and the last error if some items never came back.
+    """
+    translations: Dict[int, Dict] = {}
+    pending = list(range(len(entries)))
+    error: Optional[AIClientError] = None
+    for attempt in range(TRANSLATION_RETRIES):
+        if attempt:
+            time.sleep(2 ** (attempt - 1))
+        try:
+            found = _request_translations([entries[idx] for idx in pending], model)
+        except AIClientError as exc:
+            error = exc
+            continue
+        for position, data in found.items():
+            translations[pending[position]] = data
+        pending = [idx for idx in pending if idx not in translations]
+        if not pending:
+            return translations, None
+        error = AIClientError(f"{len(pending)} item(s) missing from the translation response.")
+    return translations, error
+
+
+def _known_translations(entries: Sequence[Dict], keys: Sequence[TMKey]) -> Dict[int, Dict]:
+    """Translations that need no request: translation memory, then the saved vocabulary."""
+    memory = _get_translation_memory()
+    remembered = memory.get_many(keys) if memory is not None else {}
+
+    saved: Dict[Tuple[str, str], Dict] = {}
+    for entry in load_vocab():
+        if entry.get("english") and entry.get("korean"):
+            term, context, _ = make_key(entry.get("ukrainian", ""), entry.get("example_sentence_ukr", ""), "")
+            saved.setdefault((term.lower(), context), entry)
+
+    known: Dict[int, Dict] = {}
+    for idx, (entry, key) in enumerate(zip(entries, keys)):
+        if key in remembered:
+            known[idx] = remembered[key]
+            continue
+        match = saved.get((key[0].lower(), key[1]))
+        if match and (match.get("example_sentence_eng") or not key[1]):
+            known[idx] = {field: match.get(field) for field in ("english", "korean", "example_sentence_eng")}
+    return known
+
+
+def _apply_translation(entry: Dict, data: Optional[Dict]) -> Dict:
+    enriched_entry = dict(entry)
+    if data:
+        enriched_entry["english"] = data.get("english") or enriched_entry.get("english", "")
+        enriched_entry["korean"] = data.get("korean") or enriched_entry.get("korean", "")
+        enriched_entry["example_sentence_eng"] = data.get("example_sentence_eng") or enriched_entry.get(
+            "example_sentence_eng", ""
+        )
+        notes = data.get("notes")
+        if notes:
+            existing = enriched_entry.get("notes", "")
+            enriched_entry["notes"] = f"{existing}\n{notes}".strip() if existing else notes
+    return enriched_entry
+
+
+def translate_vocab_entries(
+    entries: List[Dict],
+    *,
+    model: str = DEFAULT_MODEL,
+    batch_size: int = TRANSLATION_BATCH_SIZE,
+    max_workers: int = TRANSLATION_WORKERS,
+) -> List[Dict]:
+    """Translate Ukrainian terms and sample sentences into English and Korean.
+
+    Terms already in the translation memory (same term, context sentence and model)
+    or already translated in the saved vocabulary are filled in without a request;
+    duplicates are requested once. The rest go out in batches of `batch_size`,
+    `max_workers` at a time, and every new translation is remembered.
+
+    Raises `TranslationIncomplete` (with the partial results) if some entries
+    still failed after retries.
+    """
+    if not entries:
+        return []
 
+    keys = [make_key(entry.get("ukrainian", ""), entry.get("example_sentence_ukr", ""), model) for entry in entries]
+    translations = _known_translations(entries, keys)
+
+    # One request per distinct (term, context) among the remaining entries
+    to_request: Dict[TMKey, int] = {}
+    for idx, key in enumerate(keys):
+        if idx not in translations and key[0]:
+            to_request.setdefault(key, idx)
+    request_ids = list(to_request.values())
+
+    errors: List[AIClientError] = []
+    learned: Dict[TMKey, Dict] = {}
+    if request_ids:
+        try:
+            _get_client()  # a missing API key fails every batch; don't retry it
+        except AIClientError as exc:
+            errors.append(exc)
+            request_ids = []
+
+    if request_ids:
+        batches = [request_ids[i : i + batch_size] for i in range(0, len(request_ids), batch_size)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            results = executor.map(lambda batch: _translate_batch([entries[idx] for idx in batch], model), batches)
+            for batch, (found, error) in zip(batches, results):
+                if error:
+                    errors.append(error)
+                for position, data in found.items():
+                    learned[keys[batch[position]]] = data
+
+        memory = _get_translation_memory()
+        if memory is not None:
+            memory.put_many(learned)
+        for idx, key in enumerate(keys):
+            if key in learned:
+                translations[idx] = learned[key]
+
+    enriched = [_apply_translation(entry, translations.get(idx)) for idx, entry in enumerate(entries)]
+
+    failed = [idx for idx, key in enumerate(keys) if idx not in translations and key in to_request]
+    if failed:
+        if len(failed) == len(entries):
+            raise errors[-1]
+        raise TranslationIncomplete(f"{len(failed)} entries were not translated: {errors[-1]}", enriched, failed)
     return enriched
 
 
-def request_tutor_reply(
+def _tutor_messages(
     dialogue_history: List[Dict[str, str]],
     *,
     scenario: str,
-    target_language: str = "ukrainian",
-    proficiency: str = "intermediate",
-    model: str = TUTOR_MODEL,
-) -> str:
-    """
-    Generate the next tutor reply in a scenario-driven conversation practice.
-    """
-    client = _get_client()
-
+    target_language: str,
+    proficiency: str,
+) -> List[Dict[str, str]]:
     system_message = (
         "You are SlavaTalk, a bilingual Ukrainian tutor focusing on operational vocabulary. "
         "Stay in Ukrainian for main dialogue, optionally providing concise English glosses in parentheses. "
@@ -352,18 +536,76 @@ def request_tutor_reply(
                 "content": turn.get("content", ""),
             }
         )
+    return messages
 
-    try:
-        response = client.chat.completions.create(model=model, messages=messages)
-    except Exception as exc:  # pragma: no cover
-        raise AIClientError(f"Chat tutor failed: {exc}") from exc
 
-    content = response.choices[0].message.content
+def request_tutor_reply(
+    dialogue_history: List[Dict[str, str]],
+    *,
+    scenario: str,
+    target_language: str = "ukrainian",
+    proficiency: str = "intermediate",
+    model: str = TUTOR_MODEL,
+) -> str:
+    """
+    Generate the next tutor reply in a scenario-driven conversation practice.
+    """
+    messages = _tutor_messages(
+        dialogue_history, scenario=scenario, target_language=target_language, proficiency=proficiency
+    )
+    content = _chat_completion("tutor", model=model, messages=messages, failure="Chat tutor failed")
     if content is None:
         raise AIClientError("Tutor response is empty.")
     return content.strip()
 
 
+def stream_tutor_reply(
+    dialogue_history: List[Dict[str, str]],
+    *,
+    scenario: str,
+    target_language: str = "ukrainian",
+    proficiency: str = "intermediate",
+    model: str = TUTOR_MODEL,
+) -> Iterator[str]:
+    """
+    Yield the next tutor reply piece by piece as the API generates it.
+
+    Same prompt and response cache as `request_tutor_reply`: a cached reply is
+    yielded in one piece, and a completed stream is cached for both. Errors are
+    raised as `AIClientError` while iterating.
+    """
+    messages = _tutor_messages(
+        dialogue_history, scenario=scenario, target_language=target_language, proficiency=proficiency
+    )
+    cache = get_cache()
+    key = make_cache_key(model, messages, namespace="tutor")
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached.strip()
+            return
+
+    client = _get_client()
+    parts: List[str] = []
+    try:
+        stream = client.chat.completions.create(model=model, messages=messages, stream=True)
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+    except Exception as exc:  # pragma: no cover - network code
+        raise AIClientError(f"Chat tutor failed: {exc}") from exc
+
+    reply = "".join(parts).strip()
+    if not reply:
+        raise AIClientError("Tutor response is empty.")
+    if cache is not None:
+        cache.set(key, reply, CACHE_TTLS["tutor"])
+
+
 def generate_quiz_feedback(
     vocab_entry: Dict,
     *,
@@ -373,7 +615,6 @@ def generate_quiz_feedback(
     model: str = DEFAULT_MODEL,
 ) -> str:
     """Produce short formative feedback for quiz responses in both English and Korean."""
-    client = _get_client()
 
     system_message = (
         "You coach learners studying Ukrainian for professional operations. "
@@ -386,22 +627,19 @@ def generate_quiz_feedback(
         f"Outcome: {status}\n"
         f"Learner level: {proficiency}\n"
         f"User answer: {user_answer}\n"
-        f"Vocabulary item:\n{json.dumps(vocab_entry, ensure_ascii=False)}\n\n"
+        f"Vocabulary item:\n{json.dumps(dict(vocab_entry), ensure_ascii=False)}\n\n"
         f"Please provide feedback in English first, then add a Korean translation starting with 🇰🇷"
     )
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-    except Exception as exc:  # pragma: no cover
-        raise AIClientError(f"Quiz feedback generation failed: {exc}") from exc
-
-    content = response.choices[0].message.content
+    content = _chat_completion(
+        "quiz_feedback",
+        model=model,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_prompt},
+        ],
+        failure="Quiz feedback generation failed",
+    )
     if content is None:
         raise AIClientError("Quiz feedback response is empty.")
     return content.strip()
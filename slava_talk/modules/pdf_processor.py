@@ -8,9 +8,18 @@ results into the workspace dataset.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
+import os
 import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
@@ -23,13 +32,23 @@ except ImportError:  # pragma: no cover - optional dependency
     spacy = None
     Language = None  # type: ignore
 
-from .ai_client import AIClientError, translate_vocab_entries
-from .vocab_manager import load_vocab, merge_vocab, normalize_entry, save_vocab
+from .ai_client import TRANSLATION_WORKERS, AIClientError, TranslationIncomplete, translate_vocab_entries
+from .vocab_manager import merge_vocab, normalize_entry, upsert_entries
 
 LOGGER = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 REFERENCE_DIR = BASE_DIR / "reference"
+# Extracted text + scored candidates per PDF content hash (see _pdf_candidates)
+CACHE_DIR = BASE_DIR / "data" / ".pdf_cache"
+# Bump whenever text extraction or candidate scoring changes, so cached results are not reused
+PIPELINE_VERSION = 2
+SPACY_MODEL = "xx_sent_ud_sm"
+
+# Streaming extraction: pages are grouped into chunks of about CHUNK_CHARS characters and
+# fed to spaCy PIPE_BATCH_SIZE chunks at a time, so memory is bounded by chunk, not document
+CHUNK_CHARS = 50_000
+PIPE_BATCH_SIZE = 4
 
 CYRILLIC_PATTERN = re.compile(r"[А-ЩЬЮЯЇІЄҐа-щьюяїієґ]")
 SENTENCE_SPLITTER = re.compile(r"(?<=[.!?])\s+")
@@ -63,16 +82,41 @@ CANDIDATE_POS = {"NOUN", "PROPN", "ADJ", "VERB"}
 MAX_SENTENCE_CHARS = 400
 
 
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
+    """Yield the stripped text of each page, one page in memory at a time.
+
+    PyMuPDF errors propagate; see `extract_text_from_pdf` for the forgiving variant.
+    """
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            yield page.get_text().strip()
+
+
 def extract_text_from_pdf(pdf_path: Path) -> str:
     """Extract raw text from a PDF; returns empty string if parsing fails."""
     try:
-        with fitz.open(pdf_path) as doc:
-            return "\n".join(page.get_text().strip() for page in doc)
+        return "\n".join(iter_pdf_pages(pdf_path))
     except Exception as exc:  # pragma: no cover - PyMuPDF errors
         LOGGER.error("Failed to read %s: %s", pdf_path, exc)
         return ""
 
 
+def _iter_chunks(pages: Iterable[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """Join consecutive non-empty pages into chunks of about `chunk_chars` (pages are not split)."""
+    buffer: List[str] = []
+    size = 0
+    for page in pages:
+        if not page:
+            continue
+        if buffer and size + len(page) > chunk_chars:
+            yield "\n".join(buffer)
+            buffer, size = [], 0
+        buffer.append(page)
+        size += len(page) + 1
+    if buffer:
+        yield "\n".join(buffer)
+
+
 def _clean_sentence(value: str) -> str:
     value = re.sub(r"\s+", " ", value).strip()
     if len(value) > MAX_SENTENCE_CHARS:
@@ -99,7 +143,7 @@ def _get_nlp() -> Optional[Language]:
         return None
 
     try:
-        return spacy.load("xx_sent_ud_sm")
+        return spacy.load(SPACY_MODEL)
     except OSError:
         # Minimal multilingual pipeline with just a sentencizer
         nlp = spacy.blank("xx")
@@ -126,8 +170,10 @@ def _iter_tokens(sentence: str) -> Iterator[str]:
 def _extract_candidates_with_spacy(
     doc,
     topics: Sequence[str],
+    candidates: Optional[Dict[str, Dict]] = None,
 ) -> Dict[str, Dict]:
-    candidates: Dict[str, Dict] = {}
+    """Add the candidates found in `doc` to `candidates` (a new dict if not given)."""
+    candidates = {} if candidates is None else candidates
 
     for sentence in doc.sents:
         sentence_text = _clean_sentence(sentence.text)
@@ -189,8 +235,12 @@ def _extract_candidates_with_spacy(
     return candidates
 
 
-def _extract_candidates_fallback(text: str, topics: Sequence[str]) -> Dict[str, Dict]:
-    candidates: Dict[str, Dict] = {}
+def _extract_candidates_fallback(
+    text: str,
+    topics: Sequence[str],
+    candidates: Optional[Dict[str, Dict]] = None,
+) -> Dict[str, Dict]:
+    candidates = {} if candidates is None else candidates
     for sentence in _iter_sentences(text):
         sentence_score = _topic_score(sentence.lower(), topics)
         for token in _iter_tokens(sentence):
@@ -216,14 +266,32 @@ def _extract_candidates_fallback(text: str, topics: Sequence[str]) -> Dict[str,
 
 def extract_candidate_terms(text: str, topics: Optional[Sequence[str]] = None) -> List[Dict]:
     """Return scored candidate vocabulary items from raw text."""
+    return extract_candidate_terms_streaming(_iter_chunks([text]), topics=topics)
+
+
+def extract_candidate_terms_streaming(
+    chunks: Iterable[str],
+    topics: Optional[Sequence[str]] = None,
+    *,
+    batch_size: int = PIPE_BATCH_SIZE,
+    n_process: int = 1,
+) -> List[Dict]:
+    """Scored candidates from a stream of text chunks (e.g. `_iter_chunks(iter_pdf_pages(path))`).
+
+    Chunks go through `nlp.pipe`, and counts/scores are accumulated into one
+    candidate table as each Doc arrives, so only `batch_size` chunks are parsed
+    at a time. `n_process > 1` lets spaCy parse batches on several cores.
+    """
     topics = [topic.lower() for topic in topics or []]
     nlp = _get_nlp()
 
+    candidates: Dict[str, Dict] = {}
     if nlp:
-        doc = nlp(text)
-        candidates = _extract_candidates_with_spacy(doc, topics)
+        for doc in nlp.pipe(chunks, batch_size=batch_size, n_process=n_process):
+            _extract_candidates_with_spacy(doc, topics, candidates)
     else:
-        candidates = _extract_candidates_fallback(text, topics)
+        for chunk in chunks:
+            _extract_candidates_fallback(chunk, topics, candidates)
 
     sorted_candidates = sorted(
         candidates.values(),
@@ -262,69 +330,287 @@ def _build_entries(
     return entries
 
 
-def harvest_pdf_vocabulary(
+@lru_cache(maxsize=1)
+def _pipeline_id() -> str:
+    """Identifies what produced the candidates, without loading spaCy."""
+    if not spacy:
+        return f"{PIPELINE_VERSION}/regex"
+    try:
+        model = f"{SPACY_MODEL}-{metadata.version(SPACY_MODEL)}"
+    except metadata.PackageNotFoundError:
+        model = "blank-xx"
+    return f"{PIPELINE_VERSION}/spacy-{spacy.__version__}/{model}"
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_paths(digest: str, topics: Optional[Sequence[str]]) -> Tuple[Path, Path]:
+    """(pages path, candidates path) for a PDF digest; candidates also depend on topics + pipeline."""
+    key = json.dumps([sorted({topic.lower() for topic in topics or []}), _pipeline_id()], ensure_ascii=False)
+    candidates_key = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return (
+        CACHE_DIR / f"{digest}-v{PIPELINE_VERSION}.pages.jsonl.gz",
+        CACHE_DIR / f"{digest}-{candidates_key}.candidates.json.gz",
+    )
+
+
+def _cache_read(path: Path):
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, zlib.error) as exc:
+        LOGGER.warning("Ignoring unreadable cache file %s: %s", path.name, exc)
+        return None
+
+
+def _cache_write(path: Path, payload) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as exc:  # read-only deployments just run uncached
+        LOGGER.warning("Could not write cache file %s: %s", path.name, exc)
+
+
+def _cached_candidates(pdf_path: Path, topics: Optional[Sequence[str]]) -> Optional[List[Dict]]:
+    """Scored candidates from the cache, or None if this PDF/topics/pipeline was not seen."""
+    _, candidates_path = _cache_paths(_file_digest(pdf_path), topics)
+    return _cache_read(candidates_path)
+
+
+def _read_pages_cache(pages_path: Path, errors: Optional[List[Exception]]) -> Iterator[str]:
+    """Stream page texts from a gzip JSON-lines page cache, one page at a time."""
+    try:
+        with gzip.open(pages_path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+    except (OSError, EOFError, ValueError, zlib.error) as exc:
+        LOGGER.warning("Ignoring unreadable cache file %s: %s", pages_path.name, exc)
+        pages_path.unlink(missing_ok=True)
+        if errors is not None:
+            errors.append(exc)
+
+
+def _iter_pages_cached(
+    pdf_path: Path, pages_path: Optional[Path], errors: Optional[List[Exception]] = None
+) -> Iterator[str]:
+    """Page texts from the cache, else streamed from the PDF (and cached once fully read).
+
+    Pages are written to / read from the gzip JSON-lines cache one at a time, so
+    only the current page is held in memory either way. A read error ends the
+    stream early; it is logged and appended to `errors`.
+    """
+    if pages_path is None:
+        tmp_path = None
+    elif pages_path.exists():
+        yield from _read_pages_cache(pages_path, errors)
+        return
+    else:
+        tmp_path = pages_path.with_name(f".{pages_path.name}.{os.getpid()}.tmp")
+
+    cache_file = None
+    if tmp_path is not None:
+        try:
+            pages_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_file = gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6)
+        except OSError as exc:  # read-only deployments just run uncached
+            LOGGER.warning("Could not write cache file %s: %s", pages_path.name, exc)
+
+    read_pages = 0
+    has_text = complete = False
+    try:
+        for page in iter_pdf_pages(pdf_path):
+            read_pages += 1
+            has_text = has_text or bool(page)
+            if cache_file is not None:
+                cache_file.write(json.dumps(page, ensure_ascii=False) + "\n")
+            yield page
+        complete = True
+    except Exception as exc:  # pragma: no cover - PyMuPDF errors
+        LOGGER.error("Failed to read %s after %d page(s): %s", pdf_path, read_pages, exc)
+        if errors is not None:
+            errors.append(exc)
+    finally:
+        if cache_file is not None:
+            try:
+                cache_file.close()
+                if complete and has_text:
+                    os.replace(tmp_path, pages_path)
+            except OSError as exc:
+                LOGGER.warning("Could not write cache file %s: %s", pages_path.name, exc)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+
+def _pdf_candidates(
     pdf_path: Path,
-    *,
     topics: Optional[Sequence[str]] = None,
-    max_terms: int = 20,
-    translate: bool = True,
+    *,
+    use_cache: bool = True,
+    n_process: int = 1,
 ) -> List[Dict]:
-    """Convert a PDF into enriched vocabulary entries."""
-    text = extract_text_from_pdf(pdf_path)
-    if not text.strip():
+    """Scored candidates for one PDF (all of them; max_terms is applied later).
+
+    Pages are streamed through spaCy chunk by chunk. Cached by file content hash:
+    the page texts are reused for any topics, the candidates for the same topics
+    and pipeline version.
+    """
+    pages_path = candidates_path = None
+    if use_cache:
+        pages_path, candidates_path = _cache_paths(_file_digest(pdf_path), topics)
+        cached = _cache_read(candidates_path)
+        if cached is not None:
+            return cached
+
+    read_errors: List[Exception] = []
+    chunks = _iter_chunks(_iter_pages_cached(pdf_path, pages_path, read_errors))
+    first = next(chunks, None)
+    if first is None:
         raise RuntimeError(f"No extractable text found in {pdf_path.name}")
 
-    candidates = extract_candidate_terms(text, topics=topics)
+    candidates = extract_candidate_terms_streaming(
+        itertools.chain([first], chunks), topics=topics, n_process=n_process
+    )
     if not candidates:
         raise RuntimeError(f"No Ukrainian terms detected in {pdf_path.name}")
+    # Candidates from a partly read PDF are still returned, but not cached as if complete
+    if candidates_path and not read_errors:
+        _cache_write(candidates_path, candidates)
+    return candidates
 
-    entries = _build_entries(candidates, source=pdf_path.name, topics=topics, max_terms=max_terms)
 
-    if translate:
-        try:
-            entries = translate_vocab_entries(entries)
-        except AIClientError as exc:
-            for entry in entries:
-                note = entry.get("notes", "")
-                note = f"{note}\nTranslation unavailable: {exc}".strip()
-                entry["notes"] = note
+def _extract_pdf_entries(
+    pdf_path: Path,
+    *,
+    topics: Optional[Sequence[str]] = None,
+    max_terms: int = 20,
+    use_cache: bool = True,
+    n_process: int = 1,
+) -> List[Dict]:
+    """Untranslated entries for one PDF (extraction + candidate scoring)."""
+    candidates = _pdf_candidates(pdf_path, topics, use_cache=use_cache, n_process=n_process)
+    return _build_entries(candidates, source=pdf_path.name, topics=topics, max_terms=max_terms)
+
 
+def _translate_entries(entries: List[Dict], *, max_workers: int = TRANSLATION_WORKERS) -> List[Dict]:
+    """Translate entries; keep the ones that failed and note why."""
+    try:
+        return translate_vocab_entries(entries, max_workers=max_workers)
+    except TranslationIncomplete as exc:
+        entries, failed, reason = exc.entries, exc.failed, str(exc)
+    except AIClientError as exc:
+        failed, reason = list(range(len(entries))), str(exc)
+    for idx in failed:
+        note = entries[idx].get("notes", "")
+        note = f"{note}\nTranslation unavailable: {reason}".strip()
+        entries[idx]["notes"] = note
+    return entries
+
+
+def harvest_pdf_vocabulary(
+    pdf_path: Path,
+    *,
+    topics: Optional[Sequence[str]] = None,
+    max_terms: int = 20,
+    translate: bool = True,
+    use_cache: bool = True,
+    n_process: int = 1,
+) -> List[Dict]:
+    """Convert a PDF into enriched vocabulary entries.
+
+    `n_process > 1` runs spaCy on several cores, useful for one large document.
+    """
+    entries = _extract_pdf_entries(
+        pdf_path, topics=topics, max_terms=max_terms, use_cache=use_cache, n_process=n_process
+    )
+    if translate:
+        entries = _translate_entries(entries)
     return [normalize_entry(entry) for entry in entries]
 
 
+def _harvest_worker(
+    pdf_path: Path,
+    topics: Optional[Sequence[str]],
+    max_terms: int,
+    use_cache: bool = True,
+) -> Tuple[List[Dict], Optional[str]]:
+    """Process-pool task: (entries, None) or ([], warning)."""
+    try:
+        return _extract_pdf_entries(pdf_path, topics=topics, max_terms=max_terms, use_cache=use_cache), None
+    except RuntimeError as exc:
+        return [], str(exc)
+
+
 def process_reference_library(
     *,
     topics: Optional[Sequence[str]] = None,
     max_terms_per_doc: int = 20,
     translate: bool = True,
     update_dataset: bool = True,
+    workers: Optional[int] = None,
+    translation_workers: int = TRANSLATION_WORKERS,
+    use_cache: bool = True,
 ) -> Tuple[List[Dict], List[str]]:
     """
     Process all PDFs in the reference directory.
 
+    PDFs are extracted and scored in a process pool (`workers`, default: CPU count),
+    the candidates of all documents are merged once, and only the unique entries
+    are translated (see `translate_vocab_entries`: translation memory first, then
+    batched requests sent `translation_workers` at a time). PDFs whose
+    candidates are already cached (same content, topics and pipeline) skip the pool.
+
     Returns:
         tuple: (new_entries, warnings)
     """
-    new_entries: List[Dict] = []
-    warnings: List[str] = []
-
-    for pdf_path in sorted(REFERENCE_DIR.glob("*.pdf")):
-        try:
-            entries = harvest_pdf_vocabulary(
-                pdf_path,
-                topics=topics,
-                max_terms=max_terms_per_doc,
-                translate=translate,
+    pdf_paths = sorted(REFERENCE_DIR.glob("*.pdf"))
+    results: Dict[Path, Tuple[List[Dict], Optional[str]]] = {}
+    if use_cache:
+        for pdf_path in pdf_paths:
+            cached = _cached_candidates(pdf_path, topics)
+            if cached is not None:
+                entries = _build_entries(cached, source=pdf_path.name, topics=topics, max_terms=max_terms_per_doc)
+                results[pdf_path] = (entries, None)
+
+    pending = [pdf_path for pdf_path in pdf_paths if pdf_path not in results]
+    workers = min(workers or os.cpu_count() or 1, len(pending)) or 1
+    if workers > 1:
+        # spawn: forking a process that already runs Streamlit/HTTP threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            count = len(pending)
+            outputs = executor.map(
+                _harvest_worker, pending, [topics] * count, [max_terms_per_doc] * count, [use_cache] * count
             )
-        except RuntimeError as exc:
-            warnings.append(str(exc))
-            continue
+            results.update(zip(pending, outputs))
+    else:
+        for pdf_path in pending:
+            results[pdf_path] = _harvest_worker(pdf_path, topics, max_terms_per_doc, use_cache)
 
-        new_entries = merge_vocab(new_entries, entries)
+    harvested: List[Dict] = []
+    warnings: List[str] = []
+    for entries, warning in (results[pdf_path] for pdf_path in pdf_paths):
+        if warning:
+            warnings.append(warning)
+        harvested.extend(entries)
+
+    new_entries = merge_vocab([], harvested)
+    if translate and new_entries:
+        translated = _translate_entries(new_entries, max_workers=translation_workers)
+        new_entries = [normalize_entry(entry) for entry in translated]
 
     if update_dataset and new_entries:
-        merged = merge_vocab(load_vocab(), new_entries)
-        save_vocab(merged)
+        upsert_entries(new_entries)
 
     return new_entries, warnings
 
@@ -337,6 +623,14 @@ if __name__ == "__main__":
     parser.add_argument("--max-terms", type=int, default=20, help="Max terms to extract per PDF.")
     parser.add_argument("--no-translate", action="store_true", help="Skip translation step.")
     parser.add_argument("--dry-run", action="store_true", help="Do not merge into the main dataset.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the PDF cache.")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count).")
+    parser.add_argument(
+        "--translation-workers",
+        type=int,
+        default=TRANSLATION_WORKERS,
+        help="Concurrent translation requests.",
+    )
     args = parser.parse_args()
 
     entries, warnings = process_reference_library(
@@ -344,6 +638,9 @@ if __name__ == "__main__":
         max_terms_per_doc=args.max_terms,
         translate=not args.no_translate,
         update_dataset=not args.dry_run,
+        workers=args.workers,
+        translation_workers=args.translation_workers,
+        use_cache=not args.no_cache,
     )
 
     print(f"Extracted {len(entries)} unique terms from reference PDFs.")
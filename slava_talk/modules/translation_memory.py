@@ -0,0 +1,80 @@
+"""
+Persistent translation memory for vocabulary translation.
+
+Maps (Ukrainian term, context sentence, model) to the fields the translation
+API returned, so translating the same harvest again costs no API calls.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "translation_memory.sqlite3"
+
+TMKey = Tuple[str, str, str]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def make_key(term: str, context: str, model: str) -> TMKey:
+    """(term, context, model) with whitespace collapsed, as stored in the memory."""
+    return (
+        _WHITESPACE.sub(" ", term or "").strip(),
+        _WHITESPACE.sub(" ", context or "").strip(),
+        model,
+    )
+
+
+class TranslationMemory:
+    """SQLite table of translations per (term, context, model)."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS translations (
+        term TEXT NOT NULL,
+        context TEXT NOT NULL,
+        model TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (term, context, model)
+    );
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[TMKey]) -> Dict[TMKey, Dict]:
+        found: Dict[TMKey, Dict] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                row = self.conn.execute(
+                    "SELECT payload FROM translations WHERE term = ? AND context = ? AND model = ?",
+                    key,
+                ).fetchone()
+                if row:
+                    found[key] = json.loads(row[0])
+        return found
+
+    def put_many(self, items: Dict[TMKey, Dict]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                [(*key, json.dumps(payload, ensure_ascii=False), now) for key, payload in items.items()],
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
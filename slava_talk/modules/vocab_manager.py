@@ -1,17 +1,53 @@
 import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
 from datetime import datetime
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import yaml
 
 try:
-    import streamlit as st  # type: ignore
-except ImportError:  # pragma: no cover - CLI usage
-    st = None
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: in-process locking only
+    fcntl = None  # type: ignore
 
 VOCAB_FILE = Path(__file__).resolve().parent.parent / "data" / "vocabulary.json"
+# Append-only upserts on top of VOCAB_FILE, folded back in by compact_vocab()
+VOCAB_LOG_FILE = VOCAB_FILE.with_name("vocabulary.log.jsonl")
+# flock()ed around every read/write of the two files above, so the app and the CLI can share them
+VOCAB_LOCK_FILE = VOCAB_FILE.with_name("vocabulary.lock")
+
+DEDUPE_KEY = ("ukrainian", "english")
+# Compact once the log holds this many records and more than a quarter of the vocabulary
+COMPACT_MIN_RECORDS = 200
+
+# Fields concatenated into the free-text search blob
+SEARCH_FIELDS = (
+    "ukrainian",
+    "pronunciation",
+    "korean",
+    "english",
+    "example_sentence_ukr",
+    "example_sentence_eng",
+    "notes",
+)
+NGRAM_SIZE = 3
+
+# Vocabulary as last read from VOCAB_FILE + VOCAB_LOG_FILE (see _load_state)
+_store_lock = threading.Lock()
+_store_state: Dict[str, object] = {}
+
+# Process-wide read-only snapshot shared by every session (see get_snapshot)
+SNAPSHOT_CHECK_INTERVAL = 1.0  # seconds between stat() checks for edits made outside the app
+_snapshot_lock = threading.Lock()
+_snapshot: Optional["VocabSnapshot"] = None
+_snapshot_checked_at = 0.0
+_generation = 0
 
 DEFAULT_ENTRY = {
     "ukrainian": "",
@@ -26,6 +62,10 @@ DEFAULT_ENTRY = {
     "level": "",
     "created_at": "",
 }
+ENTRY_FIELDS = tuple(DEFAULT_ENTRY)
+_ENTRY_FIELD_SET = frozenset(ENTRY_FIELDS)
+# Low-cardinality values shared between entries
+_INTERNED_FIELDS = ("source", "level")
 
 
 def _normalize_topics(value) -> List[str]:
@@ -40,6 +80,8 @@ def _normalize_topics(value) -> List[str]:
 
 def normalize_entry(entry: Dict) -> Dict:
     """Ensure all vocabulary entries follow the same schema."""
+    if isinstance(entry, VocabEntry):
+        return entry.to_dict()
     normalized = DEFAULT_ENTRY.copy()
     normalized.update(entry or {})
     if normalized.get("source_doc") and not normalized.get("source"):
@@ -59,8 +101,114 @@ def normalize_entry(entry: Dict) -> Dict:
     return normalized
 
 
-def _read_vocab() -> List[Dict]:
-    """Read vocabulary entries from disk without caching."""
+class VocabEntry(Mapping):
+    """Compact read-only vocabulary record (one slot per DEFAULT_ENTRY field).
+
+    Reads like the entry dicts it replaces (`entry["ukrainian"]`, `entry.get(...)`,
+    `dict(entry)`); topics are a tuple of interned strings and keys outside the
+    schema are kept in `extras`. Convert with `VocabEntry.from_dict` / `to_dict`.
+    """
+
+    __slots__ = ENTRY_FIELDS + ("extras",)
+
+    def __init__(self, values: Sequence, extras: Tuple[Tuple[str, object], ...] = ()):
+        for name, value in zip(ENTRY_FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "extras", extras)
+
+    @classmethod
+    def from_dict(cls, entry: Dict) -> "VocabEntry":
+        if isinstance(entry, VocabEntry):
+            return entry
+        return cls._from_normalized(normalize_entry(entry))
+
+    @classmethod
+    def _from_normalized(cls, normalized: Dict) -> "VocabEntry":
+        values = dict.fromkeys(ENTRY_FIELDS, "")
+        extras = []
+        for key, value in normalized.items():
+            if key in _ENTRY_FIELD_SET:
+                values[key] = value
+            else:
+                extras.append((sys.intern(key), value))
+        values["topics"] = tuple(sys.intern(topic) for topic in values["topics"])
+        for key in _INTERNED_FIELDS:
+            if isinstance(values[key], str):
+                values[key] = sys.intern(values[key])
+        return cls(tuple(values.values()), tuple(extras))
+
+    def to_dict(self) -> Dict:
+        """Plain entry dict (schema order, topics as a list, extras last)."""
+        data = {name: getattr(self, name) for name in ENTRY_FIELDS}
+        data["topics"] = list(self.topics)  # type: ignore[attr-defined]
+        data.update(self.extras)
+        return data
+
+    def __getitem__(self, key: str):
+        if key in _ENTRY_FIELD_SET:
+            return getattr(self, key)
+        for name, value in self.extras:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        if key in _ENTRY_FIELD_SET:
+            return getattr(self, key)
+        for name, value in self.extras:
+            if name == key:
+                return value
+        return default
+
+    def __contains__(self, key) -> bool:
+        return key in _ENTRY_FIELD_SET or any(name == key for name, _ in self.extras)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from ENTRY_FIELDS
+        for name, _ in self.extras:
+            yield name
+
+    def __len__(self) -> int:
+        return len(ENTRY_FIELDS) + len(self.extras)
+
+    def _values(self) -> Tuple:
+        return tuple(getattr(self, name) for name in ENTRY_FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, VocabEntry):
+            return self._values() == other._values() and self.extras == other.extras
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("VocabEntry is read-only; use to_dict() for a mutable copy")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return (VocabEntry, (self._values(), self.extras))
+
+    def __repr__(self) -> str:
+        return f"VocabEntry(ukrainian={self.ukrainian!r}, english={self.english!r})"  # type: ignore[attr-defined]
+
+
+def _dedupe_key(entry: Dict, fields: Tuple[str, ...] = DEDUPE_KEY) -> Tuple:
+    return tuple((entry.get(field) or "").lower() for field in fields)
+
+
+def _merge_entry(current: Dict, incoming: Dict) -> Dict:
+    """Merge two normalized entries: non-empty incoming fields win, topics are unioned."""
+    merged = normalize_entry(current)
+    merged.update({k: v for k, v in incoming.items() if v})
+    merged["topics"] = sorted(set(current.get("topics", ())) | set(incoming.get("topics", ())))
+    return merged
+
+
+def _read_base() -> List[VocabEntry]:
+    """Read the compacted vocabulary JSON file."""
     if not VOCAB_FILE.exists():
         return []
 
@@ -77,75 +225,287 @@ def _read_vocab() -> List[Dict]:
     if not isinstance(data, list):
         return []
 
-    return [normalize_entry(item) for item in data]
+    return [VocabEntry.from_dict(item) for item in data if isinstance(item, dict)]
 
 
-def _clear_cached_vocab() -> None:
-    """Clear any cached vocabulary state."""
-    clear_fn = getattr(load_vocab, "clear", None)
-    if callable(clear_fn):
-        clear_fn()
-        return
-    cache_clear_fn = getattr(load_vocab, "cache_clear", None)
-    if callable(cache_clear_fn):
-        cache_clear_fn()
+def _storage_version() -> Tuple[int, ...]:
+    """mtime/size of the JSON file and the upsert log"""
+    version: List[int] = []
+    for path in (VOCAB_FILE, VOCAB_LOG_FILE):
+        try:
+            stat = path.stat()
+        except OSError:
+            version.extend((0, 0))
+        else:
+            version.extend((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+@contextmanager
+def _locked_store(exclusive: bool = True) -> Iterator[None]:
+    """Hold `_store_lock` plus a flock on VOCAB_LOCK_FILE (shared for reads, exclusive for writes).
+
+    Not re-entrant: helpers that need the lock say so instead of taking it again.
+    """
+    with _store_lock:
+        if fcntl is None:
+            yield
+            return
+        VOCAB_LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(VOCAB_LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _load_state() -> Dict[str, object]:
+    """Current vocabulary (base file + replayed log), re-read only when either file changes.
+
+    Callers must hold `_locked_store()`.
+    """
+    version = _storage_version()
+    if _store_state.get("version") == version:
+        return _store_state
+
+    entries = _read_base()
+    positions = {_dedupe_key(entry): idx for idx, entry in enumerate(entries)}
+    log_records = 0
+    if VOCAB_LOG_FILE.exists():
+        with open(VOCAB_LOG_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line after a crash
+                if not isinstance(record, dict) or record.get("op") != "upsert":
+                    continue
+                entry = VocabEntry.from_dict(record.get("entry"))
+                key = _dedupe_key(entry)
+                if key in positions:
+                    entries[positions[key]] = entry
+                else:
+                    positions[key] = len(entries)
+                    entries.append(entry)
+                log_records += 1
+
+    _store_state.update(version=version, entries=entries, positions=positions, log_records=log_records)
+    return _store_state
+
+
+def _truncate_torn_tail(path: Path, block_size: int = 4096) -> None:
+    """Cut a half-written last line (crash mid-append) back to the last newline.
+
+    Otherwise the next append is glued onto the fragment and replay drops both.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
         return
-    cached_fn = globals().get("_load_vocab_cached")
-    cache_clear_fn = getattr(cached_fn, "cache_clear", None)
-    if callable(cache_clear_fn):
-        cache_clear_fn()
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        if not end:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        pos = end
+        while pos > 0:
+            start = max(0, pos - block_size)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                pos = start + newline + 1
+                break
+            pos = start
+        f.truncate(pos)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _write_json_atomic(path: Path, entries: Iterable[Dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    payload = [normalize_entry(entry) for entry in entries]
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(payload, ensure_ascii=False, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class VocabSnapshot:
+    """One immutable version of the vocabulary, shared process-wide.
+
+    `version` is the in-process save counter plus the files' mtime/size; the
+    search index is built on first use and lives as long as the snapshot.
+    """
+
+    __slots__ = ("version", "entries", "_index", "_index_lock")
+
+    def __init__(self, version: Tuple[int, ...], entries: Tuple[VocabEntry, ...]):
+        self.version = version
+        self.entries = entries
+        self._index: Optional["VocabIndex"] = None
+        self._index_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def index(self) -> "VocabIndex":
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = VocabIndex(self.entries)
+        return self._index
+
+
+def _clear_cached_vocab() -> None:
+    """Drop the shared snapshot so the next access reloads it."""
+    global _generation, _snapshot
+    with _snapshot_lock:
+        _generation += 1
+        _snapshot = None
+
+
+def get_snapshot() -> VocabSnapshot:
+    """Current vocabulary snapshot, reloaded only when the files change.
+
+    In-process saves invalidate it immediately; edits made outside the app are
+    picked up by a stat() check at most every SNAPSHOT_CHECK_INTERVAL seconds.
+    """
+    global _snapshot, _snapshot_checked_at
+    snapshot = _snapshot
+    now = time.monotonic()
+    if snapshot is not None and now - _snapshot_checked_at < SNAPSHOT_CHECK_INTERVAL:
+        return snapshot
 
+    with _snapshot_lock:
+        generation = _generation
+        version = (generation, *_storage_version())
+        snapshot = _snapshot
+        if snapshot is not None and snapshot.version == version:
+            _snapshot_checked_at = now
+            return snapshot
 
-if st:
+    with _locked_store(exclusive=False):
+        entries = tuple(_load_state()["entries"])  # type: ignore[arg-type]
+        version = (generation, *_storage_version())
+    snapshot = VocabSnapshot(version, entries)
 
-    @st.cache_data(show_spinner=False)  # type: ignore[arg-type]
-    def load_vocab() -> List[Dict]:
-        """Load vocabulary, cached within a Streamlit session."""
-        return _read_vocab()
+    with _snapshot_lock:
+        # A save that happened while loading bumped the generation; don't publish stale data
+        if generation == _generation:
+            _snapshot = snapshot
+            _snapshot_checked_at = now
+    return snapshot
 
-else:
 
-    @lru_cache(maxsize=1)
-    def _load_vocab_cached() -> Tuple[Dict, ...]:
-        return tuple(_read_vocab())
+def load_vocab() -> Tuple[VocabEntry, ...]:
+    """Current vocabulary as shared read-only records (no per-call copies)."""
+    return get_snapshot().entries
 
-    def load_vocab() -> List[Dict]:
-        """Load vocabulary with simple process-wide caching."""
-        return list(_load_vocab_cached())
+
+def load_vocab_index() -> "VocabIndex":
+    """Search index over the current vocabulary, built once per snapshot."""
+    return get_snapshot().index
 
 
 def save_vocab(entries: Iterable[Dict]) -> None:
-    """Persist vocabulary entries back to the JSON file."""
-    normalized = [normalize_entry(item) for item in entries]
-    VOCAB_FILE.parent.mkdir(parents=True, exist_ok=True)
-    VOCAB_FILE.write_text(json.dumps(normalized, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Replace the whole vocabulary (atomic JSON rewrite, clears the upsert log).
+
+    To add or update a few entries use `upsert_entries`, which only appends to the log.
+    """
+    with _locked_store():
+        _write_json_atomic(VOCAB_FILE, entries)
+        VOCAB_LOG_FILE.unlink(missing_ok=True)
+        _store_state.clear()
+    _clear_cached_vocab()
+
+
+def _compact_locked() -> int:
+    """Fold the log into the JSON file; callers must hold `_locked_store()`."""
+    state = _load_state()  # re-read: another process may have compacted or appended meanwhile
+    entries: List[VocabEntry] = state["entries"]  # type: ignore[assignment]
+    if state["log_records"]:
+        _write_json_atomic(VOCAB_FILE, entries)
+        VOCAB_LOG_FILE.unlink(missing_ok=True)
+        _store_state.clear()
+    return len(entries)
+
+
+def compact_vocab() -> int:
+    """Fold the upsert log into the JSON file; returns the number of entries."""
+    with _locked_store():
+        total = _compact_locked()
     _clear_cached_vocab()
+    return total
+
+
+def upsert_entries(entries: Iterable[Dict]) -> int:
+    """Add or update entries with `merge_vocab` semantics (keyed on ukrainian + english).
+
+    Each entry costs one appended log line instead of a full rewrite; the log is
+    compacted into the JSON file once it grows past COMPACT_MIN_RECORDS.
+    Returns the total number of vocabulary entries.
+    """
+    with _locked_store():
+        state = _load_state()
+        stored: List[VocabEntry] = state["entries"]  # type: ignore[assignment]
+        positions: Dict[Tuple, int] = state["positions"]  # type: ignore[assignment]
+
+        records = []
+        for item in entries:
+            incoming = VocabEntry.from_dict(item)
+            key = _dedupe_key(incoming)
+            if key in positions:
+                merged = VocabEntry._from_normalized(_merge_entry(stored[positions[key]], incoming))
+                stored[positions[key]] = merged
+            else:
+                merged = incoming
+                positions[key] = len(stored)
+                stored.append(merged)
+            records.append(json.dumps({"op": "upsert", "entry": merged.to_dict()}, ensure_ascii=False) + "\n")
+
+        if records:
+            VOCAB_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _truncate_torn_tail(VOCAB_LOG_FILE)
+            with open(VOCAB_LOG_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(records))
+                f.flush()
+                os.fsync(f.fileno())
+            state["log_records"] = int(state["log_records"]) + len(records)  # type: ignore[arg-type]
+            state["version"] = _storage_version()
+        total = len(stored)
+        if int(state["log_records"]) >= max(COMPACT_MIN_RECORDS, total // 4):  # type: ignore[arg-type]
+            total = _compact_locked()
+
+    if records:
+        _clear_cached_vocab()
+    return total
 
 
 def merge_vocab(
     existing: Iterable[Dict],
     new_entries: Iterable[Dict],
     *,
-    dedupe_key: Tuple[str, ...] = ("ukrainian", "english"),
+    dedupe_key: Tuple[str, ...] = DEDUPE_KEY,
 ) -> List[Dict]:
     """Merge vocabulary lists while deduplicating on selected keys."""
     index: Dict[Tuple, Dict] = {}
 
-    def key_for(item: Dict) -> Tuple:
-        return tuple(item.get(field, "").lower() for field in dedupe_key)
-
     for item in existing:
         normalized = normalize_entry(item)
-        index[key_for(normalized)] = normalized
+        index[_dedupe_key(normalized, dedupe_key)] = normalized
 
     for item in new_entries:
         normalized = normalize_entry(item)
-        key = key_for(normalized)
+        key = _dedupe_key(normalized, dedupe_key)
         if key in index:
             # Merge topics and notes without losing existing intelligence
-            combined_topics = sorted(set(index[key].get("topics", []) + normalized.get("topics", [])))
-            index[key].update({k: v for k, v in normalized.items() if v})
-            index[key]["topics"] = combined_topics
+            index[key] = _merge_entry(index[key], normalized)
         else:
             index[key] = normalized
 
@@ -185,37 +545,127 @@ def get_topics(entries: Iterable[Dict]) -> List[str]:
     return sorted(topics)
 
 
+class VocabIndex(Sequence):
+    """Read-only vocabulary with prebuilt search structures.
+
+    - `blobs`: lowercased search text per entry (SEARCH_FIELDS joined)
+    - `topic_ids` / `source_ids`: topic and lowercased source -> entry ids
+    - trigram -> entry ids, built lazily on the first search of 3+ characters
+      (`ngrams=False` for one-off indexes, which just scan the blobs)
+
+    Behaves as a sequence of `VocabEntry` records (plain dicts are converted),
+    so it can be passed anywhere a vocabulary list is expected (e.g. `get_topics`).
+    """
+
+    def __init__(self, entries: Iterable[Dict], *, ngrams: bool = True):
+        self.entries: List[VocabEntry] = [VocabEntry.from_dict(entry) for entry in entries]
+        self.use_ngrams = ngrams
+        self.blobs: List[str] = []
+        self.topic_ids: Dict[str, List[int]] = {}
+        self.source_ids: Dict[str, List[int]] = {}
+        self._ngrams: Optional[Dict[str, List[int]]] = None
+        self._ngram_lock = threading.Lock()
+
+        for idx, entry in enumerate(self.entries):
+            self.blobs.append(" ".join(str(getattr(entry, field)) for field in SEARCH_FIELDS).lower())
+            for topic in dict.fromkeys(entry.topics):  # type: ignore[attr-defined]
+                self.topic_ids.setdefault(topic, []).append(idx)
+            self.source_ids.setdefault(str(entry.source).lower(), []).append(idx)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, item):
+        return self.entries[item]
+
+    def __iter__(self) -> Iterator[VocabEntry]:
+        return iter(self.entries)
+
+    @property
+    def topics(self) -> List[str]:
+        return sorted(self.topic_ids)
+
+    def _ngram_index(self) -> Dict[str, List[int]]:
+        if self._ngrams is None:
+            with self._ngram_lock:
+                if self._ngrams is None:
+                    ngrams: Dict[str, List[int]] = {}
+                    for idx, blob in enumerate(self.blobs):
+                        for gram in {blob[i:i + NGRAM_SIZE] for i in range(len(blob) - NGRAM_SIZE + 1)}:
+                            ngrams.setdefault(gram, []).append(idx)
+                    self._ngrams = ngrams
+        return self._ngrams
+
+    def _search_ids(self, search: str) -> Set[int]:
+        """Ids whose blob contains `search` (trigram candidates, then verified)"""
+        if len(search) < NGRAM_SIZE or not self.use_ngrams:
+            return {idx for idx, blob in enumerate(self.blobs) if search in blob}
+
+        ngrams = self._ngram_index()
+        postings = []
+        for gram in {search[i:i + NGRAM_SIZE] for i in range(len(search) - NGRAM_SIZE + 1)}:
+            ids = ngrams.get(gram)
+            if not ids:
+                return set()
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return candidates
+        return {idx for idx in candidates if search in self.blobs[idx]}
+
+    def filter_ids(
+        self,
+        *,
+        search: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        source: Optional[str] = None,
+    ) -> List[int]:
+        """Entry ids matching all given filters, in vocabulary order."""
+        search = (search or "").strip().lower()
+        source = (source or "").strip().lower()
+
+        selected: Optional[Set[int]] = None
+        if topics:
+            selected = set()
+            for topic in topics:
+                selected.update(self.topic_ids.get(topic, ()))
+        if source:
+            by_source: Set[int] = set()
+            for name, ids in self.source_ids.items():
+                if source in name:
+                    by_source.update(ids)
+            selected = by_source if selected is None else selected & by_source
+        if search and (selected is None or selected):
+            if selected is not None and len(selected) < len(self.blobs) // 8:
+                # Few candidates left: verifying them directly beats the n-gram lookup
+                selected = {idx for idx in selected if search in self.blobs[idx]}
+            else:
+                found = self._search_ids(search)
+                selected = found if selected is None else selected & found
+
+        if selected is None:
+            return list(range(len(self.entries)))
+        return sorted(selected)
+
+    def filter(self, **filters) -> List[VocabEntry]:
+        return [self.entries[idx] for idx in self.filter_ids(**filters)]
+
+
 def filter_vocab(
-    entries: Iterable[Dict],
+    entries: Union[VocabIndex, Iterable[Dict]],
     *,
     search: Optional[str] = None,
     topics: Optional[List[str]] = None,
     source: Optional[str] = None,
-) -> List[Dict]:
-    """Filter vocabulary entries by search term, topics, and source."""
-    search = (search or "").strip().lower()
-    topics = topics or []
-    source = (source or "").strip().lower()
+) -> List[VocabEntry]:
+    """Filter vocabulary entries by search term, topics, and source.
+
+    Pass the result of `load_vocab_index()` to reuse its prebuilt structures;
+    a plain list is indexed on the fly.
+    """
+    index = entries if isinstance(entries, VocabIndex) else VocabIndex(entries, ngrams=False)
+    return index.filter(search=search, topics=topics, source=source)
 
-    filtered: List[Dict] = []
-    for entry in entries:
-        text_blob = " ".join(
-            [
-                entry.get("ukrainian", ""),
-                entry.get("pronunciation", ""),
-                entry.get("korean", ""),
-                entry.get("english", ""),
-                entry.get("example_sentence_ukr", ""),
-                entry.get("example_sentence_eng", ""),
-                entry.get("notes", ""),
-            ]
-        ).lower()
-
-        matches_search = not search or search in text_blob
-        matches_topics = not topics or any(topic in entry.get("topics", []) for topic in topics)
-        matches_source = not source or source in entry.get("source", "").lower()
-
-        if matches_search and matches_topics and matches_source:
-            filtered.append(entry)
-
-    return filtered
@@ -3,8 +3,8 @@ from typing import List
 import streamlit as st
 
 from modules.ai_client import AIClientError, generate_lesson_scaffolding
-from modules.data_loader import export_to_yaml, filter_vocab, load_vocab
-from modules.vocab_manager import get_topics
+from modules.data_loader import export_to_yaml, filter_vocab
+from modules.vocab_manager import get_topics, load_vocab_index
 from modules.ui_components import apply_custom_css, render_vocab_card, render_hero_section, render_ai_lesson
 
 st.set_page_config(page_title="Document Study - SlavaTalk", page_icon="📚", layout="wide")
@@ -16,7 +16,7 @@ def set_topic_filter(*, topics: List[str]) -> None:
     st.session_state.doc_selected_topics = list(topics)
 
 
-vocabulary = load_vocab()
+vocabulary = load_vocab_index()
 
 if not vocabulary:
     st.error("Vocabulary data could not be loaded. Please verify `data/vocabulary.json`.")
@@ -1,18 +1,18 @@
 import io
 import random
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import streamlit as st
 from gtts import gTTS
 
 from modules.ai_client import AIClientError, generate_quiz_feedback
-from modules.data_loader import filter_vocab, load_vocab
+from modules.data_loader import filter_vocab
 from modules.ui_components import (
     apply_custom_css,
     render_progress_bar,
     render_streak_display,
 )
-from modules.vocab_manager import get_topics
+from modules.vocab_manager import VocabEntry, get_topics, load_vocab_index
 
 st.set_page_config(page_title="Quiz - SlavaTalk", page_icon="❓", layout="centered")
 apply_custom_css()
@@ -132,9 +132,9 @@ def ensure_state():
         st.session_state.quiz_text_answer = ""
 
 
-def build_question_pool(vocab: List[Dict], *, topics: List[str]) -> List[Dict]:
+def build_question_pool(vocab: Sequence[VocabEntry], *, topics: List[str]) -> List[VocabEntry]:
     filtered = filter_vocab(vocab, topics=topics)
-    return filtered if filtered else vocab
+    return filtered if filtered else list(vocab)
 
 
 def generate_new_question(question_mode: str, n_options: int):
@@ -150,7 +150,8 @@ def generate_new_question(question_mode: str, n_options: int):
 
     if QUESTION_MODES[question_mode]["type"] == "mc":
         options = [vocab_entry]
-        incorrect_pool = [item for item in pool if item != vocab_entry]
+        # Pool entries are shared records, so identity is enough (and skips field comparison)
+        incorrect_pool = [item for item in pool if item is not vocab_entry]
         num_options_to_get = min(len(incorrect_pool), n_options - 1)
 
         if num_options_to_get > 0:
@@ -294,7 +295,7 @@ def generate_tts_audio(text: str, lang: str = "uk") -> bytes:
 # --- Main App Logic ---
 ensure_state()
 
-vocabulary = load_vocab()
+vocabulary = load_vocab_index()
 if not vocabulary:
     st.error("Vocabulary data could not be loaded. Cannot start quiz.")
     st.stop()
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from modules.ai_client import AIClientError, request_tutor_reply
+from modules.ai_client import AIClientError, stream_tutor_reply
 from modules.ui_components import apply_custom_css, render_hero_section
 
 st.set_page_config(page_title="AI Tutor - SlavaTalk", page_icon="🧠", layout="centered")
@@ -31,6 +31,20 @@ def reset_dialogue(*, preserve_error: bool = False) -> None:
         st.session_state.tutor_error_message = ""
 
 
+def stream_reply(dialogue_history, *, scenario: str, proficiency: str) -> str:
+    """Render the tutor reply in an assistant bubble as it streams; returns the full text."""
+    with st.chat_message("assistant"):
+        reply = st.write_stream(
+            stream_tutor_reply(
+                dialogue_history,
+                scenario=scenario,
+                target_language="ukrainian",
+                proficiency=proficiency,
+            )
+        )
+    return reply if isinstance(reply, str) else "".join(map(str, reply))
+
+
 def ensure_state() -> None:
     if "tutor_history" not in st.session_state:
         st.session_state.tutor_history = []
@@ -79,6 +93,11 @@ if st.session_state.tutor_disabled:
     st.error(st.session_state.tutor_error_message or QUOTA_MESSAGE)
     st.stop()
 
+for message in st.session_state.tutor_history:
+    role = message["role"]
+    with st.chat_message("user" if role == "user" else "assistant"):
+        st.markdown(message["content"])
+
 if not st.session_state.tutor_history:
     seed = (
         f"Please open the dialogue for this scenario: {SCENARIOS[scenario]}.\n"
@@ -87,12 +106,7 @@ if not st.session_state.tutor_history:
         f"Additionally, provide {korean_hint}% Korean hints in parentheses for key terms to help Korean learners."
     )
     try:
-        first_reply = request_tutor_reply(
-            [{"role": "user", "content": seed}],
-            scenario=scenario,
-            target_language="ukrainian",
-            proficiency=proficiency,
-        )
+        first_reply = stream_reply([{"role": "user", "content": seed}], scenario=scenario, proficiency=proficiency)
     except AIClientError as exc:
         flag_error(exc, context="Unable to start tutor session")
         st.error(st.session_state.tutor_error_message)
@@ -100,21 +114,17 @@ if not st.session_state.tutor_history:
     else:
         st.session_state.tutor_history.append({"role": "assistant", "content": first_reply})
 
-for message in st.session_state.tutor_history:
-    role = message["role"]
-    with st.chat_message("user" if role == "user" else "assistant"):
-        st.markdown(message["content"])
-
 user_input = st.chat_input("Перейдімо до розмови…")
 
 if user_input:
     st.session_state.tutor_history.append({"role": "user", "content": user_input})
+    with st.chat_message("user"):
+        st.markdown(user_input)
     try:
-        reply = request_tutor_reply(
+        reply = stream_reply(
             [{"role": "user", "content": f"Keep approximately {language_mix}% English support and {korean_hint}% Korean hints in parentheses when needed."}]
             + st.session_state.tutor_history,
             scenario=scenario,
-            target_language="ukrainian",
             proficiency=proficiency,
         )
     except AIClientError as exc:
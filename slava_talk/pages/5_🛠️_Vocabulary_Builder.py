@@ -4,8 +4,8 @@ import streamlit as st
 
 from modules.ai_client import AIClientError, generate_vocab_from_context
 from modules.crawler import crawl_and_extract
-from modules.data_loader import export_to_yaml, load_vocab, save_vocab
-from modules.vocab_manager import merge_vocab, parse_yaml
+from modules.data_loader import export_to_yaml
+from modules.vocab_manager import merge_vocab, parse_yaml, upsert_entries
 from modules.ui_components import apply_custom_css, render_hero_section
 
 st.set_page_config(page_title="Vocabulary Builder - SlavaTalk", page_icon="🛠️", layout="wide")
@@ -84,10 +84,8 @@ if st.session_state.builder_results:
     )
 
     if st.button("💾 메인 단어장에 병합하기"):
-        current = load_vocab()
-        merged = merge_vocab(current, st.session_state.builder_results)
-        save_vocab(merged)
-        st.success(f"✅ data/vocabulary.json 업데이트 완료! 총 {len(merged)}개 단어")
+        total = upsert_entries(st.session_state.builder_results)
+        st.success(f"✅ data/vocabulary.json 업데이트 완료! 총 {total}개 단어")
 
 if st.session_state.builder_warnings:
     st.warning("Warnings:\n- " + "\n- ".join(st.session_state.builder_warnings))
@@ -107,10 +105,8 @@ if uploaded:
         imported_entries = []
 
     if imported_entries and st.button("💾 업로드한 단어 병합하기"):
-        current = load_vocab()
-        merged = merge_vocab(current, imported_entries)
-        save_vocab(merged)
-        st.success(f"✅ 병합 완료! 현재 총 {len(merged)}개 단어")
+        total = upsert_entries(imported_entries)
+        st.success(f"✅ 병합 완료! 현재 총 {total}개 단어")
 
 st.markdown("---")
 st.caption("💡 팁: YAML 파일을 Git으로 관리하고 팀원들과 공유하세요!")